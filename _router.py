@@ -0,0 +1,22 @@
+"""
+Generated by gen_router.py - do not edit by hand.
+"""
+
+from typing import Optional
+
+
+def route(s: str) -> Optional[str]:
+    """Return the action for a lowercased message, or None for general interaction."""
+    if ('code' in s or 'program' in s or 'script' in s or 'game' in s or 'app' in s) and ('code' in s or 'write' in s or 'create' in s or 'make' in s):
+        return 'generate_code'
+    if 'analyze' in s or 'analysis' in s or 'data' in s:
+        return 'analyze_data'
+    if 'ppt' in s or 'powerpoint' in s or 'presentation' in s:
+        return 'create_presentation'
+    if 'insert' in s and 'image' in s:
+        return 'insert_image_in_document'
+    if 'image' in s or 'flag' in s:
+        return 'generate_image'
+    if 'write' in s or 'essay' in s or 'article' in s:
+        return 'generate_document'
+    return None
@@ -44,7 +44,7 @@ def example_stealth_browsing():
     
     # Start stealth browser
     print("\n1. Starting Stealth Browser")
-    result = browser.start_browser()
+    result = browser.start_browser(lazy=False)
     print(f"   ✓ Browser: {result.get('browser')}")
     print(f"   ✓ Version: {result.get('version')}")
     print(f"   ✓ Headless: {result.get('headless')}")
@@ -97,7 +97,7 @@ def example_human_behavior():
     
     # Demonstrate human-like scrolling
     print("\n2. Simulating Human Scrolling")
-    human = HumanBehaviorSimulator()
+    human = HumanBehaviorSimulator(browser.driver)
     
     for i in range(5):
         print(f"   Scroll {i+1}: Random distance, natural timing")
@@ -113,10 +113,7 @@ def example_human_behavior():
     
     # Random mouse movements
     print("\n3. Simulating Random Mouse Movements")
-    from selenium.webdriver.common.action_chains import ActionChains
-    actions = ActionChains(browser.driver)
-    
-    human.random_mouse_movement(browser.driver, actions)
+    human.wander()
     print("   ✓ Mouse movements complete")
     
     browser.close()
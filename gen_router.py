@@ -0,0 +1,68 @@
+#!/usr/bin/env python
+"""
+Router generator: declarative routing spec -> straight-line Python
+
+Reads ROUTES below and writes _router.py containing a single ``route()``
+function with every keyword test inlined as a constant substring check.
+No keyword lists are built or iterated at runtime; classification is a
+fixed sequence of ``in`` tests evaluated in spec order.
+
+Each route is (action, any_of, and_any_of): the route matches when at least
+one ``any_of`` keyword and (if given) at least one ``and_any_of`` keyword
+occur in the lowercased message. Re-run after editing the spec:
+
+    python gen_router.py
+"""
+
+from pathlib import Path
+
+# Ordered routing spec used by quick_test.py (first match wins)
+ROUTES = [
+    ("generate_code", ["code", "program", "script", "game", "app"], ["code", "write", "create", "make"]),
+    ("analyze_data", ["analyze", "analysis", "data"], []),
+    ("create_presentation", ["ppt", "powerpoint", "presentation"], []),
+    ("insert_image_in_document", ["insert"], ["image"]),
+    ("generate_image", ["image", "flag"], []),
+    ("generate_document", ["write", "essay", "article"], []),
+]
+
+OUTPUT = Path(__file__).with_name("_router.py")
+
+
+def _any_of(keywords, grouped=False):
+    """Inline an any-of keyword group as chained substring tests."""
+    tests = " or ".join(f"{keyword!r} in s" for keyword in keywords)
+    return f"({tests})" if grouped and len(keywords) > 1 else tests
+
+
+def generate() -> str:
+    """Return the source of _router.py for ROUTES."""
+    lines = [
+        '"""',
+        "Generated by gen_router.py - do not edit by hand.",
+        '"""',
+        "",
+        "from typing import Optional",
+        "",
+        "",
+        "def route(s: str) -> Optional[str]:",
+        '    """Return the action for a lowercased message, or None for general interaction."""',
+    ]
+    for action, any_of, and_any_of in ROUTES:
+        if and_any_of:
+            condition = f"{_any_of(any_of, True)} and {_any_of(and_any_of, True)}"
+        else:
+            condition = _any_of(any_of)
+        lines.append(f"    if {condition}:")
+        lines.append(f"        return {action!r}")
+    lines.append("    return None")
+    return "\n".join(lines) + "\n"
+
+
+def main():
+    OUTPUT.write_text(generate(), encoding="utf-8")
+    print(f"✅ Wrote {OUTPUT.name} ({len(ROUTES)} routes)")
+
+
+if __name__ == "__main__":
+    main()
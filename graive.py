@@ -20,10 +20,16 @@ Usage:
 import os
 import sys
 import argparse
+import functools
+import hashlib
 import json
 import re
+import shutil
+import time
+from dataclasses import dataclass
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Dict, List, Any, Optional, TYPE_CHECKING
+from typing import Dict, List, Any, Optional, Callable, Tuple, TYPE_CHECKING
 from datetime import datetime
 
 # Type checking imports (only for type checkers, not runtime)
@@ -43,6 +49,11 @@ if TYPE_CHECKING:
     from src.execution import TaskExecutor
     from src.cli import FileOperations
 
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
 # Load environment variables from .env file
 from dotenv import load_dotenv
 load_dotenv()
@@ -60,6 +71,9 @@ try:
     from src.media import create_image_generator
     from src.execution import create_task_executor
     from src.cli import create_file_operations
+    from src.llm import LLMClient, LLMResponseCache, TokenBucketLimiter
+    from src.context.prompt_buffer import PromptBuffer
+    from src.context.transcript_writer import TranscriptWriter
     
     # Check if optional dependencies are available
     LANGCHAIN_AVAILABLE = True
@@ -96,6 +110,158 @@ except ImportError as e:
     sys.exit(1)
 
 
+_WORD_RE = re.compile(r"\S+")
+_SAFE_TOPIC_RE = re.compile(r"[^\w\s-]")
+
+_BAR = "=" * 70
+
+# Console output: terminals that are not UTF-8 (e.g. legacy Windows code pages)
+# cannot encode the emoji used in status lines
+_STDOUT_ENCODING = getattr(sys.stdout, "encoding", None) or "ascii"
+_EMOJI_OK = _STDOUT_ENCODING.lower().replace("-", "").startswith("utf")
+
+
+def _emit(*lines: str) -> None:
+    """Write a group of console lines with a single write and flush."""
+    text = "\n".join(lines) + "\n"
+    if not _EMOJI_OK:
+        text = text.encode(_STDOUT_ENCODING, "replace").decode(_STDOUT_ENCODING)
+    sys.stdout.write(text)
+    sys.stdout.flush()
+
+_THESIS_BANNER = f"\n{_BAR}\nTHESIS GENERATION WORKFLOW (WITH REFLECTION)\n{_BAR}\n"
+
+# Thesis sections paired with their sandbox output paths
+_THESIS_SECTIONS: Tuple[Tuple[str, str], ...] = tuple(
+    (name, f"thesis/{name.lower().replace(' ', '_')}.md")
+    for name in (
+        "Introduction",
+        "Literature Review",
+        "Methodology",
+        "Results",
+        "Discussion",
+        "Conclusion"
+    )
+)
+
+# Token budget for the previous-section context carried into each section prompt
+_SECTION_CONTEXT_TOKENS = 300
+
+
+def _count_words(text: str) -> int:
+    """Count whitespace-delimited words without materialising a token list."""
+    return sum(1 for _ in _WORD_RE.finditer(text))
+
+
+# Placeholder body for thesis sections, built once rather than per section
+_LOREM_BLOCK = "Lorem ipsum dolor sit amet, consectetur adipiscing elit. " * 100
+_LOREM_WORDS = _count_words(_LOREM_BLOCK)
+
+# Shared author string for mock research results
+_MOCK_AUTHORS = sys.intern("Smith et al.")
+
+
+@dataclass(slots=True)
+class Paper:
+    """Research paper record passed from the research phase to citation storage."""
+    title: str = ""
+    authors: str = ""
+    year: int = 2023
+    url: str = ""
+    abstract: str = ""
+
+
+@functools.lru_cache(maxsize=128)
+def _safe_topic(topic: str) -> str:
+    """Turn a topic into a filesystem-safe file name stem."""
+    return _SAFE_TOPIC_RE.sub("", topic).strip().replace(" ", "_")
+
+
+# Patterns used by the fallback request router (process_user_request)
+_RE_TITLED = re.compile(r'titled?\s+[\"\']?([^\"\'\n]+)[\"\']?')
+_RE_DOC_ABOUT = re.compile(r'(?:article|essay|document|paper)\s+about\s+([\w\s]+)')
+_RE_IMAGE_OF = re.compile(r'image of\s+([\w\s]+)')
+_RE_WORDS = re.compile(r'(\d+)\s*words?')
+# "about X" wins whenever it appears; "essay of X" / "article on X" are fallbacks
+_RE_TOPIC_ABOUT = re.compile(r'about\s+([\w\s]+?)(?:\s+(?:in|with|well|and|at)|$)')
+_RE_TOPIC_OF_ON = re.compile(
+    r'(?:essay|article|paper|document|thesis)\s+(?:of|on)\s+([\w\s]+?)(?:\s+(?:with|in|and|at)|$)'
+)
+_RE_FLAG = re.compile(r'flag of (\w+)')
+_RE_MEDIA_OF = re.compile(r'(?:image|picture|photo|flag)\s+of\s+([\w\s]+)')
+_RE_NAME = re.compile(r"\b(?:i'?m|i am|my name is|am)\s+(\w+)")
+_RE_CODE_STOPWORDS = re.compile(r'\b(?:code me|write|create|make me|build|develop|a|the)\b')
+
+# Substring -> language, checked in order so 'javascript' wins over 'java'
+_LANG_TOKENS = {'javascript': 'javascript', 'js': 'javascript', 'java': 'java', 'c++': 'cpp', 'cpp': 'cpp'}
+
+# Keyword categories for the fallback router; one scan tags a message with all of them
+_PPT_KEYWORDS = ('ppt', 'powerpoint', 'presentation', 'slides', 'slide deck')
+_ROUTER_KEYWORDS: Dict[str, Tuple[str, ...]] = {
+    'question': ('is the', 'did you', 'have you', 'where is', 'why', 'how', 'what', 'when', 'who'),
+    'complaint': ('but you', 'but u', 'you never', 'u never', 'you didn\'t', 'u didn\'t'),
+    'code': ('code', 'program', 'script', 'game', 'app', 'function', 'algorithm', 'implementation'),
+    'code_verb': ('code', 'write', 'create', 'make', 'build', 'develop'),
+    'analysis': ('analyze', 'analysis', 'data', 'statistics', 'calculate', 'compute', 'visualize', 'plot', 'chart'),
+    'data_source': ('data', 'csv', 'excel', 'dataset'),
+    'ppt': _PPT_KEYWORDS,
+    'build_verb': ('create', 'make', 'generate', 'build'),
+    'insert': ('insert', 'add', 'put', 'include', 'embed', 'place'),
+    'image_ref': ('image', 'picture', 'photo', 'it', 'that'),
+    'doc_ref': ('article', 'essay', 'document', 'paper', 'that', 'it', 'the'),
+    'last_doc_ref': ('the essay', 'that essay', 'the document', 'that document', 'the article',
+                     'that article', 'essay u made', 'document u made', 'essay you made'),
+    'image_pointer': ('that image', 'the image', 'it'),
+    'write': ('write', 'generate', 'create', 'make me', 'essay', 'article', 'paper', 'document', 'thesis'),
+    'creation_verb': ('create', 'write', 'generate', 'make'),
+    'document_type': ('essay', 'article', 'paper', 'document', 'thesis'),
+    'image': ('image', 'picture', 'photo', 'flag', 'icon', 'logo', 'graphic'),
+    'image_verb': ('give', 'get', 'show', 'create', 'generate', 'download'),
+}
+
+# (noun, verb) tag pairs that must both be present for a task branch to fire;
+# image insertion is the only branch keyed on a single tag ('insert')
+_TASK_TAG_PAIRS: Tuple[Tuple[str, str], ...] = (
+    ('code', 'code_verb'),
+    ('analysis', 'data_source'),
+    ('ppt', 'build_verb'),
+    ('write', 'document_type'),
+    ('image', 'image_verb'),
+)
+
+
+def _build_keyword_index() -> Tuple[Dict[str, Tuple[str, ...]], Any]:
+    """Map each router keyword to its categories and, if available, build an Aho-Corasick automaton."""
+    keyword_tags: Dict[str, Tuple[str, ...]] = {}
+    for tag, keywords in _ROUTER_KEYWORDS.items():
+        for keyword in keywords:
+            keyword_tags[keyword] = keyword_tags.get(keyword, ()) + (tag,)
+
+    automaton = None
+    if ahocorasick is not None:
+        automaton = ahocorasick.Automaton()
+        for keyword, tags in keyword_tags.items():
+            automaton.add_word(keyword, tags)
+        automaton.make_automaton()
+    return keyword_tags, automaton
+
+
+_KEYWORD_TAGS, _KEYWORD_AUTOMATON = _build_keyword_index()
+
+
+@functools.lru_cache(maxsize=1024)
+def _match_keyword_tags(text: str) -> frozenset:
+    """
+    Return the router keyword categories present in text (substring match).
+    
+    Pure function of the folded message, so repeated messages ("hello",
+    "help", retyped commands) are answered from the LRU cache.
+    """
+    if _KEYWORD_AUTOMATON is not None:
+        return frozenset(tag for _, tags in _KEYWORD_AUTOMATON.iter(text) for tag in tags)
+    return frozenset(tag for keyword, tags in _KEYWORD_TAGS.items() if keyword in text for tag in tags)
+
+
 class GraiveAI:
     """
     Main Graive AI system coordinator.
@@ -151,6 +317,36 @@ class GraiveAI:
         self.last_generated_document = None
         self.last_generated_code = None
         
+        # Background writer so large file writes overlap with later stages
+        self._writer_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="graive-writer")
+        self._pending_writes: List[Future] = []
+        self._rate_limiter = TokenBucketLimiter(
+            rpm=int(os.getenv("GRAIVE_LLM_RPM", "3000")),
+            tpm=int(os.getenv("GRAIVE_LLM_TPM", "90000"))
+        )
+        self._llm = LLMClient(
+            openai_key=os.getenv("OPENAI_API_KEY"),
+            deepseek_key=os.getenv("DEEPSEEK_API_KEY"),
+            rate_limiter=self._rate_limiter,
+            # Opt-in: only for DeepSeek endpoints known to accept zstd bodies
+            compress_requests=os.getenv("GRAIVE_LLM_ZSTD", "").lower() in ("1", "true", "yes")
+        )
+        self._response_cache = LLMResponseCache(self.workspace / "cache" / "llm_responses.db")
+        # Tables smaller than this many cells use the deterministic template
+        self.table_llm_min_cells = 12
+        # Reasoner analyses keyed by message fingerprint: (analysis, plan_file)
+        self._plan_cache: Dict[str, Tuple[Dict[str, Any], str]] = {}
+        # interactive_mode dispatch: routed action -> handler
+        self._action_handlers: Dict[str, Callable[..., Optional[Tuple[str, str]]]] = {
+            'generate_code': self._handle_generate_code,
+            'analyze_data': self._handle_analyze_data,
+            'create_presentation': self._handle_create_presentation,
+            'insert_image_in_document': self._handle_insert_image_in_document,
+            'generate_image': self._handle_generate_image,
+            'generate_document': self._handle_generate_document,
+            'general_interaction': self._handle_general_interaction,
+        }
+        
         print(f"\n{'='*70}")
         print(f"GRAIVE AI SYSTEM INITIALIZATION")
         print(f"{'='*70}\n")
@@ -560,7 +756,8 @@ class GraiveAI:
         output_format: str = "md",
         enable_phd_review: bool = True,
         document_type: str = "essay",
-        academic_level: str = "undergraduate"
+        academic_level: str = "undergraduate",
+        use_batch_api: bool = False
     ) -> Dict[str, Any]:
         """
         Generate document using deliberate plan-then-generate architecture.
@@ -574,6 +771,8 @@ class GraiveAI:
             enable_phd_review: Enable quality review
             document_type: Document type (essay, paper, thesis, ...)
             academic_level: Target academic sophistication
+            use_batch_api: Submit all section prompts through the provider
+                batch API (cheaper, but asynchronous - not for interactive use)
 
         Returns:
             Document generation results
@@ -597,7 +796,8 @@ class GraiveAI:
                     output_format=output_format,
                     enable_phd_review=enable_phd_review,
                     document_type=document_type,
-                    academic_level=academic_level
+                    academic_level=academic_level,
+                    use_batch_api=use_batch_api
                 )
 
             print("⚠️  Document planner not available - using direct generation\n")
@@ -625,7 +825,8 @@ class GraiveAI:
         output_format: str,
         enable_phd_review: bool,
         document_type: str,
-        academic_level: str
+        academic_level: str,
+        use_batch_api: bool = False
     ) -> Dict[str, Any]:
         """Generate document using strategic planning workflow."""
 
@@ -666,7 +867,7 @@ class GraiveAI:
         )
 
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        safe_topic = re.sub(r"[^\w\s-]", "", topic).strip().replace(" ", "_")
+        safe_topic = _safe_topic(topic)
         plans_dir = self.session_workspace / "plans"
         plans_dir.mkdir(parents=True, exist_ok=True)
         plan_file = plans_dir / f"{safe_topic}_plan_{timestamp}.json"
@@ -681,52 +882,61 @@ class GraiveAI:
         total_words = 0
         section_quality_scores: List[Optional[float]] = []
 
-        for index, section in enumerate(plan.sections, 1):
-            print(f"[Section {index}/{len(plan.sections)}] Generating: {section.title}")
-            print(f"                Target: {section.word_count} words")
+        batched_contents: Dict[str, str] = {}
+        if use_batch_api:
+            print("📦 Submitting all section prompts via batch API...")
+            batched_contents = self._run_batch_completions({
+                f"section_{index}": (
+                    self._build_section_prompt(
+                        section_title=section.title,
+                        key_points=section.key_points,
+                        word_count=section.word_count,
+                        topic=topic,
+                        previous_sections=[]
+                    ),
+                    max(400, min(section.word_count * 3, 6000))
+                )
+                for index, section in enumerate(plan.sections, 1)
+            })
+            print(f"   ✅ Batch returned {len(batched_contents)}/{len(plan.sections)} sections\n")
 
-            if self.persistent_planner:
-                self.persistent_planner.update_module_status(index, "generating")
+        if self.persistent_planner:
+            self.persistent_planner.begin_batch()
 
-            prompt = self._build_section_prompt(
-                section_title=section.title,
-                key_points=section.key_points,
-                word_count=section.word_count,
-                topic=topic,
-                previous_sections=generated_sections
-            )
+        try:
+            for index, section in enumerate(plan.sections, 1):
+                print(f"[Section {index}/{len(plan.sections)}] Generating: {section.title}")
+                print(f"                Target: {section.word_count} words")
+
+                if self.persistent_planner:
+                    self.persistent_planner.update_module_status(index, "generating")
 
-            max_tokens = max(400, min(section.word_count * 3, 6000))
-            section_content = self._call_llm_for_content(prompt, max_tokens=max_tokens)
-            if not section_content.strip():
-                section_content = self._generate_default_section_content(
+                prompt = self._build_section_prompt(
                     section_title=section.title,
                     key_points=section.key_points,
                     word_count=section.word_count,
-                    topic=topic
+                    topic=topic,
+                    previous_sections=generated_sections
                 )
 
-            section_words = len(section_content.split())
-            total_words += section_words
-
-            section_quality: Optional[float] = None
-            if enable_phd_review:
-                if self.review_system:
-                    section_review = self.review_system.review_content(
-                        content=section_content,
-                        topic=topic,
-                        target_audience="academic",
-                        field=document_type
+                max_tokens = max(400, min(section.word_count * 3, 6000))
+                section_content = batched_contents.get(f"section_{index}", "")
+                if not section_content.strip():
+                    section_content = self._call_llm_for_content(prompt, max_tokens=max_tokens)
+                if not section_content.strip():
+                    section_content = self._generate_default_section_content(
+                        section_title=section.title,
+                        key_points=section.key_points,
+                        word_count=section.word_count,
+                        topic=topic
                     )
-                    section_quality = section_review["average_score"]
-                    if section_review.get("needs_revision"):
-                        print(f"                ⚠️  Quality: {section_quality:.1f}/10 - revising...")
-                        section_content = self.review_system.revise_content(
-                            content=section_content,
-                            review_report=section_review,
-                            topic=topic,
-                            max_iterations=1
-                        )
+
+                section_words = _count_words(section_content)
+                total_words += section_words
+
+                section_quality: Optional[float] = None
+                if enable_phd_review:
+                    if self.review_system:
                         section_review = self.review_system.review_content(
                             content=section_content,
                             topic=topic,
@@ -734,43 +944,102 @@ class GraiveAI:
                             field=document_type
                         )
                         section_quality = section_review["average_score"]
-                    print(f"                ✅ Quality: {section_quality:.1f}/10")
-                else:
-                    section_content = self._revise_section(section_content, 6.5)
+                        if section_review.get("needs_revision"):
+                            print(f"                ⚠️  Quality: {section_quality:.1f}/10 - revising...")
+                            section_content = self.review_system.revise_content(
+                                content=section_content,
+                                review_report=section_review,
+                                topic=topic,
+                                max_iterations=1
+                            )
+                            section_review = self.review_system.review_content(
+                                content=section_content,
+                                topic=topic,
+                                target_audience="academic",
+                                field=document_type
+                            )
+                            section_quality = section_review["average_score"]
+                        print(f"                ✅ Quality: {section_quality:.1f}/10")
+                    else:
+                        section_content = self._revise_section(section_content, 6.5)
+
+                snippet = section_content[:200].replace("\n", " ")
+                generated_sections.append(
+                    {
+                        "title": section.title,
+                        "content": section_content,
+                        "word_count": section_words,
+                        "media_specs": section.media_specs,
+                        "snippet": snippet,
+                        "snippet_tokens": self._llm.count_tokens(snippet),
+                    }
+                )
+                section_quality_scores.append(section_quality)
 
-            generated_sections.append(
-                {
-                    "title": section.title,
-                    "content": section_content,
-                    "word_count": section_words,
-                    "media_specs": section.media_specs,
-                }
-            )
-            section_quality_scores.append(section_quality)
+                if self.persistent_planner:
+                    self.persistent_planner.update_module_status(
+                        module_order=index,
+                        status="complete",
+                        content=section_content,
+                        quality_score=section_quality
+                    )
 
+                print(f"                ✓ Generated: {section_words} words\n")
+        finally:
+            # Always flush, or later status updates stay queued in the open batch
             if self.persistent_planner:
-                self.persistent_planner.update_module_status(
-                    module_order=index,
-                    status="complete",
-                    content=section_content,
-                    quality_score=section_quality
-                )
-
-            print(f"                ✓ Generated: {section_words} words\n")
+                self.persistent_planner.commit_batch()
 
         print(f"✅ All sections generated: {total_words} total words\n")
 
+        # The document-level review only reads text, so start it on a
+        # text-only draft now and let it overlap with media integration.
+        early_review_future: Optional[Future] = None
+        if enable_phd_review and self.review_system:
+            text_only_draft = self._assemble_document(
+                title=plan.title,
+                sections=generated_sections,
+                media=[],
+                citations=plan.citation_strategy
+            )
+            review_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="graive-review")
+            early_review_future = review_pool.submit(
+                self.review_system.review_content,
+                content=text_only_draft,
+                topic=topic,
+                target_audience="PhD researchers",
+                field="academic"
+            )
+            review_pool.shutdown(wait=False)
+            print("🎓 Document review started in background\n")
+
         print("=" * 70)
         print("STAGE 3: MEDIA INTEGRATION")
         print("=" * 70 + "\n")
 
         generated_media: List[Dict[str, Any]] = []
 
+        # Generate every table in one LLM round-trip up front
+        table_specs = [
+            (section_index, spec_index, media_spec.get("subject", section["title"]),
+             media_spec.get("rows", 5), media_spec.get("columns", 3))
+            for section_index, section in enumerate(generated_sections)
+            for spec_index, media_spec in enumerate(section.get("media_specs") or ())
+            if media_spec.get("type") == "table"
+        ]
+        batched_tables = dict(zip(
+            ((section_index, spec_index) for section_index, spec_index, _, _, _ in table_specs),
+            self._generate_tables_batch(
+                [(subject, rows, columns) for _, _, subject, rows, columns in table_specs],
+                topic=topic
+            )
+        ))
+
         for section_index, section in enumerate(generated_sections):
             if not section.get("media_specs"):
                 continue
 
-            for media_spec in section["media_specs"]:
+            for spec_index, media_spec in enumerate(section["media_specs"]):
                 if media_spec.get("type") == "image":
                     description = media_spec.get("subject", f"Illustration for {section['title']}")
                     if self.image_generator:
@@ -802,12 +1071,7 @@ class GraiveAI:
                         )
                         print(f"🖼️  Image placeholder registered: {description}")
                 elif media_spec.get("type") == "table":
-                    table_md = self._generate_table_for_section(
-                        subject=media_spec.get("subject", section["title"]),
-                        topic=topic,
-                        rows=media_spec.get("rows", 5),
-                        columns=media_spec.get("columns", 3)
-                    )
+                    table_md = batched_tables[(section_index, spec_index)]
                     generated_media.append(
                         {
                             "type": "table",
@@ -824,6 +1088,26 @@ class GraiveAI:
         print("STAGE 4: DOCUMENT ASSEMBLY")
         print("=" * 70 + "\n")
 
+        if early_review_future is not None:
+            early_review = early_review_future.result()
+            if early_review.get("needs_revision"):
+                # Revise section text before media is injected so the
+                # assembled document carries the revisions. Sections were
+                # already reviewed one by one in Stage 2, so the draft report
+                # drives a single pass with no per-section re-review.
+                print(f"🔄 Draft quality: {early_review['average_score']:.2f}/10 - revising sections...\n")
+                total_words = 0
+                for section in generated_sections:
+                    section["content"] = self.review_system.apply_review(
+                        content=section["content"],
+                        review_report=early_review,
+                        topic=topic
+                    )
+                    section["word_count"] = _count_words(section["content"])
+                    total_words += section["word_count"]
+            else:
+                print(f"✅ Draft quality approved: {early_review['average_score']:.2f}/10\n")
+
         document_content = self._assemble_document(
             title=plan.title,
             sections=generated_sections,
@@ -834,7 +1118,7 @@ class GraiveAI:
         if self.persistent_planner:
             self.persistent_planner.save_assembly_draft(document_content, draft_type="combined")
 
-        print(f"✅ Document assembled: {len(document_content.split())} words\n")
+        print(f"✅ Document assembled: {_count_words(document_content)} words\n")
 
         review_report = None
         if enable_phd_review and self.review_system:
@@ -877,6 +1161,7 @@ class GraiveAI:
         docs_dir.mkdir(parents=True, exist_ok=True)
         file_name = f"{safe_topic}_{timestamp}.{output_format}"
         file_path = docs_dir / file_name
+        write_future: Optional[Future] = None
 
         if self.document_formatter:
             print("📝 Applying professional formatting...")
@@ -902,10 +1187,7 @@ class GraiveAI:
                 print(f"   ✅ Professionally formatted {output_format.upper()} ready")
             else:
                 print("   ⚠️  Formatter could not create the requested format; falling back to markdown save")
-                with open(file_path, "w", encoding="utf-8") as f:
-                    f.write(document_content)
-                file_size = os.path.getsize(file_path)
-                print(f"   ✅ File written ({file_size:,} bytes)\n")
+                write_future = self._write_file_action(str(file_path), document_content)
 
             additional_exports = {
                 fmt.upper(): path for fmt, path in exports.items() if path and Path(path) != file_path
@@ -917,16 +1199,17 @@ class GraiveAI:
                 print()
         else:
             print("💾 Saving to file...")
-            with open(file_path, "w", encoding="utf-8") as f:
-                f.write(document_content)
-            file_size = os.path.getsize(file_path)
-            print(f"   ✅ File written ({file_size:,} bytes)\n")
+            write_future = self._write_file_action(str(file_path), document_content)
 
         self.last_generated_document = str(file_path)
 
         if self.persistent_planner:
             self.persistent_planner.save_assembly_draft(document_content, draft_type="final")
 
+        if write_future is not None:
+            write_future.result()
+            print(f"   ✅ File written ({os.path.getsize(file_path):,} bytes)\n")
+
         print("=" * 70)
         print("✅ DOCUMENT GENERATION COMPLETE")
         print("=" * 70)
@@ -942,6 +1225,7 @@ class GraiveAI:
             print(f"🎓 Quality: {review_report['average_score']:.2f}/10 ({review_report['quality_level']})")
         print("=" * 70 + "\n")
 
+        self._flush_pending_writes()
         self._show_workspace_contents()
 
         return {
@@ -972,7 +1256,7 @@ class GraiveAI:
         """Fallback document generation without strategic planner."""
 
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        safe_topic = re.sub(r'[^\w\s-]', '', topic).strip().replace(' ', '_')
+        safe_topic = _safe_topic(topic)
         file_name = f"{safe_topic}_{timestamp}.{output_format}"
         file_path = self.session_workspace / "documents" / file_name
 
@@ -985,11 +1269,21 @@ class GraiveAI:
         print("           Estimated time: 15-30 seconds")
         print("           Status: Sending request...")
 
+        streamed_chars = 0
+
+        def _report_progress(piece: str) -> None:
+            nonlocal streamed_chars
+            streamed_chars += len(piece)
+            print(f"\r           ⏳ Streaming... {streamed_chars:,} chars received", end="", flush=True)
+
         content_result = self._generate_content_action(
             topic=topic,
             word_count=word_count,
-            include_citations=True
+            include_citations=True,
+            on_chunk=_report_progress
         )
+        if streamed_chars:
+            print()
 
         if not content_result or "content" not in content_result:
             print("\n❌ FAILED: Content generation error")
@@ -1019,7 +1313,7 @@ class GraiveAI:
                     topic=topic,
                     max_iterations=3
                 )
-                actual_words = len(content.split())
+                actual_words = _count_words(content)
                 print("           ✅ Content revised to PhD standards\n")
             else:
                 print("           ✅ Content meets PhD quality standards\n")
@@ -1073,12 +1367,8 @@ class GraiveAI:
         else:
             print("[Step 5/6] 💾 Writing to file...")
             print(f"             Path: {file_path}")
-
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(content)
-
-            file_size = os.path.getsize(file_path)
-            print(f"             ✅ File written ({file_size:,} bytes)\n")
+            self._write_file_action(str(file_path), content)
+            print("             ✅ File write queued\n")
 
         print("[Step 6/6] 📊 Final quality verification...")
 
@@ -1106,6 +1396,7 @@ class GraiveAI:
             print(f"📈 Tables: {len(tables)}")
         print(f"{'='*70}\n")
 
+        self._flush_pending_writes()
         self._show_workspace_contents()
 
         self.last_generated_document = str(file_path)
@@ -1121,6 +1412,85 @@ class GraiveAI:
             "quality_level": review_report.get('quality_level') if (enable_phd_review and review_report) else None
         }
 
+    def _run_batch_completions(
+        self,
+        prompts: Dict[str, Tuple[str, int]],
+        poll_timeout: float = 24 * 3600
+    ) -> Dict[str, str]:
+        """
+        Run many chat completions through the OpenAI Batch API.
+
+        Args:
+            prompts: Mapping of custom_id -> (prompt, max_tokens)
+            poll_timeout: Maximum seconds to wait for the batch to finish
+
+        Returns:
+            Mapping of custom_id -> generated content. Missing ids (or an empty
+            dict when the batch API is unavailable) should be generated live.
+        """
+        client = self._llm.openai_client
+        if client is None or not prompts:
+            return {}
+
+        try:
+
+            lines = [
+                json.dumps({
+                    "custom_id": custom_id,
+                    "method": "POST",
+                    "url": "/v1/chat/completions",
+                    "body": {
+                        "model": self._llm.openai_model,
+                        "messages": [
+                            {"role": "system", "content": "You are an expert programmer and content generator."},
+                            {"role": "user", "content": prompt}
+                        ],
+                        "max_tokens": max_tokens,
+                        "temperature": 0.7
+                    }
+                })
+                for custom_id, (prompt, max_tokens) in prompts.items()
+            ]
+            batch_input = client.files.create(
+                file=("sections.jsonl", "\n".join(lines).encode("utf-8")),
+                purpose="batch"
+            )
+            batch = client.batches.create(
+                input_file_id=batch_input.id,
+                endpoint="/v1/chat/completions",
+                completion_window="24h"
+            )
+
+            # Poll with exponential backoff until the batch reaches a terminal state
+            delay = 5.0
+            deadline = time.monotonic() + poll_timeout
+            while batch.status not in ("completed", "failed", "expired", "cancelled"):
+                if time.monotonic() > deadline:
+                    print(f"   ⚠️  Batch {batch.id} still {batch.status} - falling back to live calls")
+                    return {}
+                time.sleep(delay)
+                delay = min(delay * 2, 300.0)
+                batch = client.batches.retrieve(batch.id)
+
+            if batch.status != "completed" or not batch.output_file_id:
+                print(f"   ⚠️  Batch {batch.id} ended as {batch.status} - falling back to live calls")
+                return {}
+
+            results: Dict[str, str] = {}
+            for line in client.files.content(batch.output_file_id).text.splitlines():
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                body = (record.get("response") or {}).get("body") or {}
+                choices = body.get("choices") or []
+                if choices:
+                    results[record["custom_id"]] = choices[0]["message"].get("content") or ""
+            return results
+
+        except Exception as e:
+            print(f"   ⚠️  Batch API error: {e} - falling back to live calls")
+            return {}
+
     def _build_section_prompt(
         self,
         section_title: str,
@@ -1133,11 +1503,21 @@ class GraiveAI:
 
         context = ""
         if previous_sections:
-            context_lines = ["Previous sections provide context:"]
-            for prev in previous_sections[-2:]:
-                snippet = prev['content'][:200].replace('\n', ' ')
-                context_lines.append(f"- {prev['title']}: {snippet}...")
-            context = "\n".join(context_lines) + "\n\n"
+            # Walk back from the most recent section, keeping snippets within budget
+            context_entries: List[str] = []
+            budget = _SECTION_CONTEXT_TOKENS
+            for prev in reversed(previous_sections[-2:]):
+                snippet = prev.get('snippet')
+                if snippet is None:
+                    snippet = prev['content'][:200].replace('\n', ' ')
+                snippet_tokens = prev.get('snippet_tokens') or self._llm.count_tokens(snippet)
+                if snippet_tokens > budget:
+                    break
+                budget -= snippet_tokens
+                context_entries.append(f"- {prev['title']}: {snippet}...")
+            if context_entries:
+                context_entries.reverse()
+                context = "\n".join(["Previous sections provide context:"] + context_entries) + "\n\n"
 
         key_points_text = "\n".join(f"- {point}" for point in key_points) if key_points else "- Continue the narrative logically"
 
@@ -1165,25 +1545,27 @@ Begin the {section_title} section now."""
     ) -> str:
         """Assemble complete document from generated sections and media."""
 
-        content = f"# {title}\n\n"
+        # Index media by section once instead of re-filtering per section
+        media_by_section: Dict[Any, List[Dict[str, Any]]] = {}
+        for item in media:
+            media_by_section.setdefault(item.get('section_index'), []).append(item)
+
+        parts: List[str] = ["# ", title, "\n\n"]
 
         for index, section in enumerate(sections):
-            content += f"## {section['title']}\n\n"
-            content += section['content'].strip() + "\n\n"
+            parts.extend(("## ", section['title'], "\n\n", section['content'].strip(), "\n\n"))
 
-            section_media = [item for item in media if item.get('section_index') == index]
-            for media_item in section_media:
+            for media_item in media_by_section.get(index, ()):
                 if media_item['type'] == 'image':
-                    content += f"![{media_item['description']}]({media_item['path']})\n\n"
-                    content += f"*Figure: {media_item['description']}*\n\n"
+                    description = media_item['description']
+                    parts.append(f"![{description}]({media_item['path']})\n\n*Figure: {description}*\n\n")
                 elif media_item['type'] == 'table':
-                    content += media_item['markdown'].strip() + "\n\n"
+                    parts.extend((media_item['markdown'].strip(), "\n\n"))
 
         if citations and citations.get('target_citations'):
-            content += "## References\n\n"
-            content += "[References will be populated based on citation strategy]\n"
+            parts.append("## References\n\n[References will be populated based on citation strategy]\n")
 
-        return content
+        return "".join(parts)
 
     def _generate_table_for_section(
         self,
@@ -1194,6 +1576,9 @@ Begin the {section_title} section now."""
     ) -> str:
         """Generate markdown table for a section."""
 
+        if rows * columns < self.table_llm_min_cells:
+            return self._template_table(rows, columns)
+
         prompt = (
             f"Create a Markdown table with {rows} rows and {columns} columns summarizing {subject} "
             f"within the context of {topic}. Provide descriptive column headers and concise data."
@@ -1202,6 +1587,59 @@ Begin the {section_title} section now."""
         if table_md.strip():
             return table_md.strip()
 
+        return self._template_table(rows, columns)
+
+    def _generate_tables_batch(
+        self,
+        specs: List[Tuple[str, int, int]],
+        topic: str
+    ) -> List[str]:
+        """
+        Generate several markdown tables with a single LLM call.
+
+        Args:
+            specs: List of (subject, rows, columns) tuples
+            topic: Document topic
+
+        Returns:
+            One markdown table per spec, in order. Small tables and any table
+            missing from the LLM response fall back to the template.
+        """
+        tables = [""] * len(specs)
+        llm_indices = [
+            i for i, (_, rows, columns) in enumerate(specs)
+            if rows * columns >= self.table_llm_min_cells
+        ]
+
+        if len(llm_indices) == 1:
+            subject, rows, columns = specs[llm_indices[0]]
+            tables[llm_indices[0]] = self._generate_table_for_section(subject, topic, rows, columns)
+        elif llm_indices:
+            requests_text = "\n".join(
+                f"TABLE {n}: {specs[i][1]} rows x {specs[i][2]} columns summarizing {specs[i][0]}"
+                for n, i in enumerate(llm_indices, 1)
+            )
+            prompt = (
+                f"Create the following Markdown tables within the context of {topic}. "
+                "Provide descriptive column headers and concise data. Precede each table "
+                "with a line '=== TABLE n ===' using its number and output nothing else.\n\n"
+                f"{requests_text}"
+            )
+            max_tokens = sum(specs[i][1] * specs[i][2] * 12 for i in llm_indices) + 20 * len(llm_indices)
+            response = self._call_llm_for_content(prompt, max_tokens=max_tokens)
+            for match in re.finditer(r"=== TABLE (\d+) ===\s*(.*?)(?==== TABLE \d+ ===|\Z)", response, re.S):
+                n = int(match.group(1))
+                if 1 <= n <= len(llm_indices) and match.group(2).strip():
+                    tables[llm_indices[n - 1]] = match.group(2).strip()
+
+        return [
+            table or self._template_table(rows, columns)
+            for table, (_, rows, columns) in zip(tables, specs)
+        ]
+
+    @staticmethod
+    def _template_table(rows: int, columns: int) -> str:
+        """Build a deterministic placeholder markdown table."""
         headers = [f"Column {i+1}" for i in range(columns)]
         header_row = " | ".join(headers)
         separator_row = " | ".join(["---"] * columns)
@@ -1223,7 +1661,7 @@ Begin the {section_title} section now."""
             f"Section:\n{content}\n\n"
             "Return the revised section text only."
         )
-        revised = self._call_llm_for_content(prompt, max_tokens=len(content.split()) * 3)
+        revised = self._call_llm_for_content(prompt, max_tokens=_count_words(content) * 3)
         return revised.strip() if revised.strip() else content
 
     def _generate_default_section_content(
@@ -1238,24 +1676,29 @@ Begin the {section_title} section now."""
         paragraphs = []
         base_sentence_count = max(3, word_count // 120)
         key_points = key_points or [f"Core aspect of {topic}"]
+        running_word_count = 0
 
         for point in key_points:
             paragraph = (
                 f"{section_title} explores {point} within the broader context of {topic}. "
                 f"This section examines historical background, current developments, and emerging perspectives related to {point}."
             )
-            if len(paragraph.split()) < base_sentence_count * 20:
+            if _count_words(paragraph) < base_sentence_count * 20:
                 paragraph += (
                     f" Furthermore, it highlights practical implications and provides examples that demonstrate why {point} "
                     "matters for researchers and practitioners alike."
                 )
             paragraphs.append(paragraph)
+            running_word_count += _count_words(paragraph)
 
-        while len("\n\n".join(paragraphs).split()) < word_count:
-            paragraphs.append(
-                f"Building upon these insights, the section emphasises the importance of {section_title.lower()} for understanding "
-                f"the evolving narrative around {topic}."
-            )
+        filler = (
+            f"Building upon these insights, the section emphasises the importance of {section_title.lower()} for understanding "
+            f"the evolving narrative around {topic}."
+        )
+        filler_words = _count_words(filler)
+        while running_word_count < word_count:
+            paragraphs.append(filler)
+            running_word_count += filler_words
 
         return "\n\n".join(paragraphs)
 
@@ -1287,8 +1730,7 @@ Begin the {section_title} section now."""
             "\n".join(steps),
         ]
 
-        with open(plan_path, 'w', encoding='utf-8') as plan_file:
-            plan_file.write("\n".join(plan_content))
+        self._write_file_action(str(plan_path), "\n".join(plan_content))
 
         return str(plan_path)
     
@@ -1300,15 +1742,18 @@ Begin the {section_title} section now."""
         
         docs_dir = self.workspace / "documents"
         if docs_dir.exists():
-            files = list(docs_dir.glob("*"))
-            if files:
-                print(f"\nDocuments folder ({len(files)} files):")
-                for f in sorted(files, key=lambda x: x.stat().st_mtime, reverse=True)[:10]:
-                    size = f.stat().st_size
-                    modified = datetime.fromtimestamp(f.stat().st_mtime).strftime("%Y-%m-%d %H:%M")
-                    print(f"  • {f.name} ({size:,} bytes) - {modified}")
-                if len(files) > 10:
-                    print(f"  ... and {len(files) - 10} more files")
+            # DirEntry caches its stat result, so each file is stat'ed at most once
+            with os.scandir(docs_dir) as it:
+                entries = [entry for entry in it if entry.is_file()]
+            if entries:
+                print(f"\nDocuments folder ({len(entries)} files):")
+                entries.sort(key=lambda entry: entry.stat().st_mtime, reverse=True)
+                for entry in entries[:10]:
+                    st = entry.stat()
+                    modified = datetime.fromtimestamp(st.st_mtime).strftime("%Y-%m-%d %H:%M")
+                    print(f"  • {entry.name} ({st.st_size:,} bytes) - {modified}")
+                if len(entries) > 10:
+                    print(f"  ... and {len(entries) - 10} more files")
             else:
                 print("\nDocuments folder: (empty)")
         else:
@@ -1317,8 +1762,20 @@ Begin the {section_title} section now."""
         print(f"\n📍 Full path: {docs_dir}")
         print(f"{'='*70}\n")
     
-    def _generate_content_action(self, topic: str, word_count: int, include_citations: bool) -> Dict[str, Any]:
-        """Generate document content using configured LLM with progress tracking."""
+    def _generate_content_action(
+        self,
+        topic: str,
+        word_count: int,
+        include_citations: bool,
+        on_chunk: Optional[Callable[[str], None]] = None
+    ) -> Dict[str, Any]:
+        """
+        Generate document content using configured LLM with progress tracking.
+
+        The completion is streamed so that ``on_chunk`` receives each fragment as
+        soon as it arrives, letting callers start downstream work (progress
+        display, incremental writes) before generation finishes.
+        """
         try:
             # Build prompt for content generation
             prompt = f"""Write a comprehensive, well-researched article about {topic}.
@@ -1334,82 +1791,37 @@ Requirements:
 Begin writing:"""
             
             print(f"           🔄 Connecting to API...")
-            
-            # Use OpenAI for content generation
-            openai_key = os.getenv("OPENAI_API_KEY")
-            if openai_key:
+
+            if self._llm.provider == "openai":
                 print(f"           🟢 Using OpenAI GPT-3.5-Turbo-16K")
-                from openai import OpenAI
-                client = OpenAI(api_key=openai_key)
-                
-                print(f"           💬 Sending prompt ({len(prompt)} chars)...")
-                
-                response = client.chat.completions.create(
-                    model="gpt-3.5-turbo-16k",
-                    messages=[
-                        {"role": "system", "content": "You are an expert academic writer. Write detailed, well-structured content."},
-                        {"role": "user", "content": prompt}
-                    ],
-                    max_tokens=min(word_count * 2, 4000),
-                    temperature=0.7
-                )
-                
-                print(f"           📝 Receiving content...")
-                content = response.choices[0].message.content
-                actual_words = len(content.split())
-                
-                print(f"           📊 Actual words generated: {actual_words}")
-                
-                return {
-                    "content": content,
-                    "actual_words": actual_words
-                }
-            
-            # Fallback to DeepSeek
-            deepseek_key = os.getenv("DEEPSEEK_API_KEY")
-            if deepseek_key:
+                system_prompt = "You are an expert academic writer. Write detailed, well-structured content."
+            elif self._llm.provider == "deepseek":
                 print(f"           🟢 Using DeepSeek Chat")
-                import requests
-                
-                print(f"           💬 Sending request...")
-                
-                response = requests.post(
-                    "https://api.deepseek.com/chat/completions",
-                    headers={
-                        "Authorization": f"Bearer {deepseek_key}",
-                        "Content-Type": "application/json"
-                    },
-                    json={
-                        "model": "deepseek-chat",
-                        "messages": [
-                            {"role": "system", "content": "You are an expert academic writer."},
-                            {"role": "user", "content": prompt}
-                        ],
-                        "max_tokens": min(word_count * 2, 4000),
-                        "temperature": 0.7
-                    },
-                    timeout=60
-                )
-                
-                print(f"           📝 Processing response...")
-                
-                if response.status_code == 200:
-                    result = response.json()
-                    content = result['choices'][0]['message']['content']
-                    actual_words = len(content.split())
-                    
-                    print(f"           📊 Actual words generated: {actual_words}")
-                    
-                    return {
-                        "content": content,
-                        "actual_words": actual_words
-                    }
-                else:
-                    print(f"           ❌ DeepSeek API error: {response.status_code}")
-            
-            print(f"           ⚠️  No API available - using fallback")
-            return {"content": f"# {topic}\n\nContent generation failed - no API available.", "actual_words": 0}
-            
+                system_prompt = "You are an expert academic writer."
+            else:
+                print(f"           ⚠️  No API available - using fallback")
+                return {"content": f"# {topic}\n\nContent generation failed - no API available.", "actual_words": 0}
+
+            print(f"           💬 Sending prompt ({len(prompt)} chars)...")
+            content = self._llm.complete(
+                messages=[
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": prompt}
+                ],
+                max_tokens=min(word_count * 2, 4000),
+                temperature=0.7,
+                stream=True,
+                on_chunk=on_chunk
+            )
+            actual_words = _count_words(content)
+
+            print(f"           📊 Actual words generated: {actual_words}")
+
+            return {
+                "content": content,
+                "actual_words": actual_words
+            }
+
         except Exception as e:
             print(f"           ❌ Error: {e}")
             return {"content": f"# {topic}\n\nError: {e}", "actual_words": 0}
@@ -1426,10 +1838,23 @@ Begin writing:"""
         
         return {"table_markdown": table_md}
     
-    def _write_file_action(self, file_path: str, content: str) -> Dict[str, Any]:
-        """Write content to file."""
+    def _write_file_action(self, file_path: str, content: str) -> Future:
+        """
+        Queue content to be written to file on the background writer pool.
+
+        Returns:
+            Future resolving to {"bytes_written": int}; call ``result()`` (or
+            ``_flush_pending_writes``) before relying on the file contents.
+        """
+        future = self._writer_pool.submit(self._write_file_sync, file_path, content)
+        self._pending_writes.append(future)
+        return future
+    
+    @staticmethod
+    def _write_file_sync(file_path: str, content: str) -> Dict[str, Any]:
+        """Write content to file through a 1 MiB user-space buffer."""
         try:
-            with open(file_path, 'w', encoding='utf-8') as f:
+            with open(file_path, 'w', encoding='utf-8', buffering=1 << 20) as f:
                 f.write(content)
             
             bytes_written = len(content.encode('utf-8'))
@@ -1437,6 +1862,14 @@ Begin writing:"""
         except Exception as e:
             raise Exception(f"Failed to write file: {e}")
     
+    def _flush_pending_writes(self) -> None:
+        """Block until every queued background write has completed."""
+        pending, self._pending_writes = self._pending_writes, []
+        for future in pending:
+            future.result()
+        if self.storage:
+            self.storage.execute("flush_writes")
+    
     def generate_thesis(
         self,
         title: str,
@@ -1458,16 +1891,17 @@ Begin writing:"""
         Returns:
             Generation results
         """
-        print(f"\n{'='*70}")
-        print(f"THESIS GENERATION WORKFLOW (WITH REFLECTION)")
-        print(f"{'='*70}")
-        print(f"\nTitle: {title}")
-        print(f"Research Question: {research_question}")
-        print(f"Target: {target_pages} pages")
-        print(f"Citations: {citation_format} format, {year_range[0]}-{year_range[1]}")
-        print(f"\n{'='*70}\n")
-        
-        workflow_results = []
+        sys.stdout.write(_THESIS_BANNER + "\n".join([
+            f"\nTitle: {title}",
+            f"Research Question: {research_question}",
+            f"Target: {target_pages} pages",
+            f"Citations: {citation_format} format, {year_range[0]}-{year_range[1]}",
+            f"\n{_BAR}\n\n",
+        ]))
+        
+        # Phase outcomes as parallel arrays: names plus a 1/0 success byte each
+        phase_names: List[str] = []
+        phase_ok = bytearray()
         
         # Phase 1: Research with reflection
         print("\n[Phase 1] Research & Citation Extraction\n")
@@ -1488,7 +1922,8 @@ Begin writing:"""
             }
         )
         
-        workflow_results.append(("Research", research_result["success"]))
+        phase_names.append("Research")
+        phase_ok.append(1 if research_result["success"] else 0)
         
         if not research_result["success"]:
             print(f"✗ Research failed: {research_result['error']}")
@@ -1515,7 +1950,8 @@ Begin writing:"""
             }
         )
         
-        workflow_results.append(("Citations", citation_result["success"]))
+        phase_names.append("Citations")
+        phase_ok.append(1 if citation_result["success"] else 0)
         
         if citation_result["success"]:
             print(f"✓ Stored {citation_result['result'].get('records_inserted', 0)} citations")
@@ -1523,114 +1959,102 @@ Begin writing:"""
         # Phase 3: Content generation with reflection
         print("\n[Phase 3] Generating Thesis Sections\n")
         
-        sections = [
-            "Introduction",
-            "Literature Review",
-            "Methodology",
-            "Results",
-            "Discussion",
-            "Conclusion"
-        ]
-        
-        for section in sections:
-            section_result = self.run_with_reflection(
-                agent_name="WriterAgent",
-                activity_type=ActivityType.FILE_WRITE,
-                description=f"Generate {section} section",
-                action=self._generate_section_action,
-                inputs={
-                    "section_name": section,
-                    "title": title,
-                    "research_question": research_question,
-                    "file_path": f"thesis/{section.lower().replace(' ', '_')}.md"
-                },
-                expected_outputs={
-                    "word_count": int,
-                    "file_path": str
-                }
-            )
-            
-            workflow_results.append((section, section_result["success"]))
+        sections = [name for name, _ in _THESIS_SECTIONS]
+        
+        # Sections are independent of each other, so generate them concurrently
+        section_results: List[Optional[Dict[str, Any]]] = [None] * len(sections)
+        with ThreadPoolExecutor(max_workers=len(sections), thread_name_prefix="graive-thesis") as pool:
+            futures = {
+                pool.submit(
+                    self.run_with_reflection,
+                    agent_name="WriterAgent",
+                    activity_type=ActivityType.FILE_WRITE,
+                    description=f"Generate {section} section",
+                    action=self._generate_section_action,
+                    inputs={
+                        "section_name": section,
+                        "title": title,
+                        "research_question": research_question,
+                        "file_path": section_path
+                    },
+                    expected_outputs={
+                        "word_count": int,
+                        "file_path": str
+                    }
+                ): index
+                for index, (section, section_path) in enumerate(_THESIS_SECTIONS)
+            }
             
-            if section_result["success"]:
-                print(f"✓ {section} generated ({section_result['result'].get('word_count', 0)} words)")
-            else:
-                print(f"✗ {section} failed")
+            for future in as_completed(futures):
+                index = futures[future]
+                section_result = future.result()
+                section_results[index] = section_result
+                
+                if section_result["success"]:
+                    print(f"✓ {sections[index]} generated ({section_result['result'].get('word_count', 0)} words)")
+                else:
+                    print(f"✗ {sections[index]} failed")
+        
+        phase_names.extend(sections)
+        phase_ok.extend(1 if section_result["success"] else 0 for section_result in section_results)
+        self._flush_pending_writes()
         
         # Generate reflection report
         if self.reflection:
-            print(f"\n{'='*70}")
-            print("WORKFLOW REFLECTION REPORT")
-            print(f"{'='*70}")
+            sys.stdout.write(f"\n{_BAR}\nWORKFLOW REFLECTION REPORT\n{_BAR}\n")
             self.reflection.print_reflection_report()
             
             # Export log
             self.reflection.export_reflection_log()
         
         # Final summary
-        total_phases = len(workflow_results)
-        successful_phases = sum(1 for _, success in workflow_results if success)
-        
-        print(f"\n{'='*70}")
-        print(f"WORKFLOW COMPLETE")
-        print(f"{'='*70}")
-        print(f"\nPhases: {successful_phases}/{total_phases} successful")
+        total_phases = len(phase_ok)
+        successful_phases = phase_ok.count(1)
         
-        for phase_name, success in workflow_results:
-            status = "✓" if success else "✗"
-            print(f"  {status} {phase_name}")
-        
-        print(f"\n{'='*70}\n")
+        summary = [f"\n{_BAR}", "WORKFLOW COMPLETE", _BAR, f"\nPhases: {successful_phases}/{total_phases} successful"]
+        summary.extend(f"  {'✓' if ok else '✗'} {phase_name}" for phase_name, ok in zip(phase_names, phase_ok))
+        summary.append(f"\n{_BAR}\n\n")
+        sys.stdout.write("\n".join(summary))
         
         return {
             "success": successful_phases == total_phases,
             "phases_completed": successful_phases,
             "total_phases": total_phases,
-            "workflow_results": workflow_results
+            "workflow_results": [(name, bool(ok)) for name, ok in zip(phase_names, phase_ok)]
         }
     
     def _mock_research_action(self, query: str, year_range: tuple, max_results: int) -> Dict[str, Any]:
         """Mock research action for demonstration."""
         # In production, would use browser automation
-        papers = []
-        for i in range(min(10, max_results)):
-            papers.append({
-                "title": f"Research Paper {i+1} on {query[:30]}",
-                "authors": "Smith et al.",
-                "year": 2023,
-                "url": f"https://example.com/paper{i+1}",
-                "abstract": f"Abstract for paper {i+1}"
-            })
+        q30 = sys.intern(query[:30])
+        papers = [
+            Paper(
+                title=f"Research Paper {i} on {q30}",
+                authors=_MOCK_AUTHORS,
+                year=2023,
+                url=f"https://example.com/paper{i}",
+                abstract=f"Abstract for paper {i}"
+            )
+            for i in range(1, min(10, max_results) + 1)
+        ]
         
-        return {
-            "papers": papers,
-            "count": len(papers)
-        }
+        return {"papers": papers, "count": len(papers)}
     
-    def _store_citations_action(self, papers: List[Dict], table_name: str) -> Dict[str, Any]:
+    def _store_citations_action(self, papers: List[Paper], table_name: str) -> Dict[str, Any]:
         """Store citations in database."""
-        inserted = 0
+        rows = [
+            (p.title, p.authors, p.year, p.url, p.abstract, f"{p.authors} ({p.year}). {p.title}.")
+            for p in papers
+        ]
         
-        for paper in papers:
-            result = self.storage.execute(
-                "execute_query",
-                db_name="citations",
-                query="""
-                INSERT INTO papers (title, authors, year, url, abstract, citation_apa)
-                VALUES (?, ?, ?, ?, ?, ?)
-                """,
-                query_params=(
-                    paper.get("title", ""),
-                    paper.get("authors", ""),
-                    paper.get("year", 2023),
-                    paper.get("url", ""),
-                    paper.get("abstract", ""),
-                    f"{paper.get('authors', '')} ({paper.get('year', 2023)}). {paper.get('title', '')}."
-                )
-            )
-            
-            if result["success"]:
-                inserted += 1
+        result = self.storage.execute(
+            "insert_many",
+            db_name="citations",
+            table="papers",
+            columns=("title", "authors", "year", "url", "abstract", "citation_apa"),
+            rows=rows
+        )
+        inserted = len(rows) if result["success"] else 0
         
         return {
             "records_inserted": inserted,
@@ -1646,88 +2070,103 @@ Begin writing:"""
     ) -> Dict[str, Any]:
         """Generate thesis section."""
         # Mock content generation
-        content = f"# {section_name}\n\n"
-        content += f"**Thesis:** {title}\n\n"
-        content += f"**Research Question:** {research_question}\n\n"
-        content += "## Content\n\n"
-        content += "Lorem ipsum dolor sit amet, consectetur adipiscing elit. " * 100
+        header = (
+            f"# {section_name}\n\n"
+            f"**Thesis:** {title}\n\n"
+            f"**Research Question:** {research_question}\n\n"
+            "## Content\n\n"
+        )
+        content = header + _LOREM_BLOCK
         
-        # Write to storage
-        result = self.storage.execute(
-            "write_file",
+        # Queue the write; generate_thesis flushes all section writes at the end of the phase
+        self.storage.execute(
+            "write_file_async",
             file_path=file_path,
             content=content
         )
         
         return {
-            "word_count": len(content.split()),
+            "word_count": _count_words(header) + _LOREM_WORDS,
             "file_path": file_path
         }
     
     # Legacy chat fallback removed; all conversations now flow through the interaction agent
     
-    def _call_llm_for_content(self, prompt: str, max_tokens: int = 2000) -> str:
+    def _call_llm_for_content(self, prompt: str, max_tokens: int = 2000, cache_bypass: bool = False) -> str:
         """
         Helper method to call LLM for content generation.
         Used by task executor for code generation, etc.
         
+        Responses are cached by exact prompt so repeated prompts skip the API
+        round-trip.
+        
         Args:
             prompt: Prompt for LLM
             max_tokens: Maximum tokens to generate
+            cache_bypass: Always request a fresh completion
         
         Returns:
             Generated content
         """
+        model = self._llm.model
+        if model and not cache_bypass:
+            cached = self._response_cache.get(prompt, model, max_tokens)
+            if cached is not None:
+                return cached
+        
         try:
-            # Use OpenAI if available
-            openai_key = os.getenv("OPENAI_API_KEY")
-            if openai_key:
-                from openai import OpenAI
-                client = OpenAI(api_key=openai_key)
-                
-                response = client.chat.completions.create(
-                    model="gpt-3.5-turbo-16k",
-                    messages=[
-                        {"role": "system", "content": "You are an expert programmer and content generator."},
-                        {"role": "user", "content": prompt}
-                    ],
-                    max_tokens=max_tokens,
-                    temperature=0.7
-                )
-                return response.choices[0].message.content
-            
-            # Fallback to DeepSeek
-            deepseek_key = os.getenv("DEEPSEEK_API_KEY")
-            if deepseek_key:
-                import requests
-                response = requests.post(
-                    "https://api.deepseek.com/chat/completions",
-                    headers={
-                        "Authorization": f"Bearer {deepseek_key}",
-                        "Content-Type": "application/json"
-                    },
-                    json={
-                        "model": "deepseek-chat",
-                        "messages": [
-                            {"role": "system", "content": "You are an expert programmer."},
-                            {"role": "user", "content": prompt}
-                        ],
-                        "max_tokens": max_tokens,
-                        "temperature": 0.7
-                    },
-                    timeout=60
-                )
-                
-                if response.status_code == 200:
-                    result = response.json()
-                    return result['choices'][0]['message']['content']
-            
-            return ""  # No API available
-            
+            content = self._llm.complete(
+                messages=[
+                    {"role": "system", "content": "You are an expert programmer and content generator."},
+                    {"role": "user", "content": prompt}
+                ],
+                max_tokens=max_tokens,
+                temperature=0.7
+            )
+            if content:
+                self._response_cache.put(prompt, model, max_tokens, content)
+            return content or ""  # Empty when no API is available
+
         except Exception as e:
             print(f"LLM call error: {e}")
             return ""
     
+    def _analyze_with_plan_cache(self, message: str) -> Tuple[Dict[str, Any], str]:
+        """
+        Run the request reasoner, reusing cached plans where possible.
+        
+        Only exact repeats are reused, matched on a fingerprint of the
+        lowercased message: near-duplicates such as the same request about a
+        different country need their own plan. A hit copies the cached plan
+        file to a fresh path instead of calling the reasoner again.
+        
+        Args:
+            message: User's message
+        
+        Returns:
+            Tuple of (analysis, plan_file)
+        """
+        key = hashlib.blake2b(message.lower().encode("utf-8"), digest_size=16).hexdigest()
+        cached = self._plan_cache.get(key)
+        
+        if cached is not None and Path(cached[1]).exists():
+            analysis, cached_file = cached
+            source = Path(cached_file)
+            plan_file = source.with_name(
+                f"execution_plan_{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}{source.suffix}"
+            )
+            shutil.copy2(source, plan_file)
+            print(f"♻️  Reusing cached plan: {plan_file.name}")
+            return analysis, str(plan_file)
+        
+        analysis = self.request_reasoner.analyze_request(message)
+        plan_file = self.request_reasoner.create_execution_plan_file(
+            analysis,
+            self.session_workspace
+        )
+        self._plan_cache[key] = (analysis, plan_file)
+        return analysis, plan_file
+    
     def process_user_request(self, message: str, user_name: str = None) -> Dict[str, Any]:
         """
         Process user request with REASONING instead of pattern matching.
@@ -1748,14 +2187,9 @@ Begin writing:"""
             print(f"\n✨ REASONING-BASED REQUEST PROCESSING")
             print(f"{'='*70}\n")
             
-            # STEP 1: Analyze request with reasoning
-            analysis = self.request_reasoner.analyze_request(message)
-            
-            # STEP 2: Create visible execution plan file
-            plan_file = self.request_reasoner.create_execution_plan_file(
-                analysis,
-                self.session_workspace
-            )
+            # STEP 1 + 2: Analyze request and create visible execution plan file,
+            # reusing a prior plan for repeated or near-identical requests
+            analysis, plan_file = self._analyze_with_plan_cache(message)
             
             # STEP 3: Wait for user approval
             print(f"\n⏸️  WAITING FOR APPROVAL")
@@ -1807,13 +2241,12 @@ Begin writing:"""
         # FALLBACK: Old pattern-matching approach if reasoner not available
         print(f"\n[⚠️  Using fallback pattern matching - reasoner not available]\n")
         message_lower = message.lower()
+        # ASCII messages are already folded by lower(); casefold only real Unicode
+        tags = _match_keyword_tags(message_lower if message.isascii() else message.casefold())
         
         # CRITICAL: Detect questions and complaints FIRST (they should go to chat)
-        question_indicators = ['is the', 'did you', 'have you', 'where is', 'why', 'how', 'what', 'when', 'who']
-        complaint_indicators = ['but you', 'but u', 'you never', 'u never', 'you didn\'t', 'u didn\'t']
-        
-        is_question = any(indicator in message_lower for indicator in question_indicators)
-        is_complaint = any(indicator in message_lower for indicator in complaint_indicators)
+        is_question = 'question' in tags
+        is_complaint = 'complaint' in tags
         
         # If it's a question or complaint, route to chat immediately
         if is_question or is_complaint:
@@ -1826,26 +2259,23 @@ Begin writing:"""
                 'interaction_type': 'question_or_complaint'
             }
         
+        # Nothing that any task branch needs was found: skip the branch cascade
+        if 'insert' not in tags and not any(noun in tags and verb in tags for noun, verb in _TASK_TAG_PAIRS):
+            return self._route_to_interaction_agent(message)
+        
         # Detect CODE GENERATION requests (NEW!)
-        code_keywords = ['code', 'program', 'script', 'game', 'app', 'function', 'algorithm', 'implementation']
-        is_code_request = any(keyword in message_lower for keyword in code_keywords)
+        is_code_request = 'code' in tags
         
         # Check for code-specific patterns
-        if is_code_request and any(verb in message_lower for verb in ['code', 'write', 'create', 'make', 'build', 'develop']):
+        if is_code_request and 'code_verb' in tags:
             # Detect programming language
-            language = 'python'  # Default
-            if 'javascript' in message_lower or 'js' in message_lower:
-                language = 'javascript'
-            elif 'java' in message_lower and 'javascript' not in message_lower:
-                language = 'java'
-            elif 'c++' in message_lower or 'cpp' in message_lower:
-                language = 'cpp'
+            language = next(
+                (lang for token, lang in _LANG_TOKENS.items() if token in message_lower),
+                'python'  # Default
+            )
             
             # Extract description
-            description = message_lower
-            for remove in ['code me', 'write', 'create', 'make me', 'build', 'develop', 'a', 'the']:
-                description = description.replace(remove, '')
-            description = description.strip()
+            description = _RE_CODE_STOPWORDS.sub('', message_lower).strip()
             
             if description:
                 return {
@@ -1855,10 +2285,9 @@ Begin writing:"""
                 }
         
         # Detect DATA ANALYSIS requests (NEW!)
-        analysis_keywords = ['analyze', 'analysis', 'data', 'statistics', 'calculate', 'compute', 'visualize', 'plot', 'chart']
-        is_analysis_request = any(keyword in message_lower for keyword in analysis_keywords)
+        is_analysis_request = 'analysis' in tags
         
-        if is_analysis_request and any(keyword in message_lower for keyword in ['data', 'csv', 'excel', 'dataset']):
+        if is_analysis_request and 'data_source' in tags:
             return {
                 'action': 'analyze_data',
                 'description': message,
@@ -1866,13 +2295,12 @@ Begin writing:"""
             }
         
         # Detect PPT/PRESENTATION generation (NEW!)
-        ppt_keywords = ['ppt', 'powerpoint', 'presentation', 'slides', 'slide deck']
-        is_ppt_request = any(keyword in message_lower for keyword in ppt_keywords)
+        is_ppt_request = 'ppt' in tags
         
-        if is_ppt_request and any(verb in message_lower for verb in ['create', 'make', 'generate', 'build']):
+        if is_ppt_request and 'build_verb' in tags:
             # Extract topic
             topic = message_lower
-            for remove in ppt_keywords + ['create', 'make', 'generate', 'build', 'a', 'on', 'about']:
+            for remove in _PPT_KEYWORDS + ('create', 'make', 'generate', 'build', 'a', 'on', 'about'):
                 topic = topic.replace(remove, '')
             topic = topic.strip()
             
@@ -1883,10 +2311,9 @@ Begin writing:"""
             }
         
         # Detect image insertion into document requests (ENHANCED - Much more flexible!)
-        insert_keywords = ['insert', 'add', 'put', 'include', 'embed', 'place']
-        has_insert = any(keyword in message_lower for keyword in insert_keywords)
-        has_image_ref = any(ref in message_lower for ref in ['image', 'picture', 'photo', 'it', 'that'])
-        has_doc_ref = any(ref in message_lower for ref in ['article', 'essay', 'document', 'paper', 'that', 'it', 'the'])
+        has_insert = 'insert' in tags
+        has_image_ref = 'image_ref' in tags
+        has_doc_ref = 'doc_ref' in tags
         
         # More flexible detection: "insert it", "add it to the essay", "put it in the document"
         if has_insert and (has_image_ref or 'it' in message_lower) and (has_doc_ref or 'essay' in message_lower or 'article' in message_lower):
@@ -1895,18 +2322,18 @@ Begin writing:"""
             title = None
             
             # Try "titled X" or "title X"
-            title_match = re.search(r'titled?\s+[\"\']?([^\"\'\n]+)[\"\']?', message_lower)
+            title_match = _RE_TITLED.search(message_lower)
             if title_match:
                 title = title_match.group(1).strip()
             
             # Try "article about X" or "essay about X"
             elif 'about' in message_lower:
-                about_match = re.search(r'(?:article|essay|document|paper)\s+about\s+([\w\s]+)', message_lower)
+                about_match = _RE_DOC_ABOUT.search(message_lower)
                 if about_match:
                     title = about_match.group(1).strip()
             
             # Try "the essay", "that document", "the article" - use last generated document
-            elif any(phrase in message_lower for phrase in ['the essay', 'that essay', 'the document', 'that document', 'the article', 'that article', 'essay u made', 'document u made', 'essay you made']):
+            elif 'last_doc_ref' in tags:
                 # User referencing previously generated document
                 if self.last_generated_document:
                     title = Path(self.last_generated_document).stem  # Use filename as title
@@ -1918,10 +2345,10 @@ Begin writing:"""
             
             # Extract image reference
             image_desc = None
-            if any(phrase in message_lower for phrase in ['that image', 'the image', 'it']):
+            if 'image_pointer' in tags:
                 image_desc = 'latest_generated'  # Use most recent image
             elif 'image of' in message_lower:
-                img_match = re.search(r'image of\s+([\w\s]+)', message_lower)
+                img_match = _RE_IMAGE_OF.search(message_lower)
                 if img_match:
                     image_desc = img_match.group(1).strip()
             
@@ -1937,36 +2364,23 @@ Begin writing:"""
         # CRITICAL: Detect DOCUMENT generation FIRST (before image detection)
         # This prevents "make me an essay with an image" from being misdetected as image generation
         
-        write_keywords = ['write', 'generate', 'create', 'make me', 'essay', 'article', 'paper', 'document', 'thesis']
-        is_write_request = any(keyword in message_lower for keyword in write_keywords)
-        
-        # Extract word count if mentioned
-        word_count_match = re.search(r'(\d+)\s*words?', message_lower)
-        target_words = int(word_count_match.group(1)) if word_count_match else 1200
+        is_write_request = 'write' in tags
+        has_document_type = 'document_type' in tags
         
-        # Detect topic - ENHANCED to handle "of", "on", and "about"
+        # Detect topic - handles "about", "of" and "on"
+        # (only needed when this can still be a document request)
         topic = None
-        if 'about' in message_lower:
-            topic_match = re.search(r'about\s+([\w\s]+?)(?:\s+(?:in|with|well|and|at)|$)', message_lower)
-            if topic_match:
-                topic = topic_match.group(1).strip()
-        elif 'of' in message_lower:
-            # Handle "essay of japan", "article of climate", etc.
-            topic_match = re.search(r'(?:essay|article|paper|document|thesis)\s+of\s+([\w\s]+?)(?:\s+(?:with|in|and|at)|$)', message_lower)
-            if topic_match:
-                topic = topic_match.group(1).strip()
-        elif 'on' in message_lower:
-            # Handle "essay on japan", "article on climate", etc.
-            topic_match = re.search(r'(?:essay|article|paper|document|thesis)\s+on\s+([\w\s]+?)(?:\s+(?:with|in|and|at)|$)', message_lower)
+        if is_write_request and has_document_type:
+            topic_match = _RE_TOPIC_ABOUT.search(message_lower) or _RE_TOPIC_OF_ON.search(message_lower)
             if topic_match:
                 topic = topic_match.group(1).strip()
         
-        # ENHANCED: Check if this is a document generation (prioritize over image generation)
-        has_creation_verb = any(verb in message_lower for verb in ['create', 'write', 'generate', 'make'])
-        has_document_type = any(dtype in message_lower for dtype in ['essay', 'article', 'paper', 'document', 'thesis'])
-        
         # If we have both write intent AND topic AND document type, this is DEFINITELY document generation
         if is_write_request and topic and has_document_type:
+            # Extract word count if mentioned
+            word_count_match = _RE_WORDS.search(message_lower)
+            target_words = int(word_count_match.group(1)) if word_count_match else 1200
+            
             print(f"\n[🔍 Detection] Document generation detected!")
             print(f"   Topic: {topic}")
             print(f"   Words: {target_words}")
@@ -1983,23 +2397,22 @@ Begin writing:"""
         
         # ONLY NOW check for standalone image generation requests
         # (Not part of document generation)
-        image_keywords = ['image', 'picture', 'photo', 'flag', 'icon', 'logo', 'graphic']
-        is_image_only_request = any(keyword in message_lower for keyword in image_keywords)
+        is_image_only_request = 'image' in tags
         
         # Make sure this is NOT a document request (already handled above)
         if is_image_only_request and not has_document_type:
-            if any(verb in message_lower for verb in ['give', 'get', 'show', 'create', 'generate', 'download']):
+            if 'image_verb' in tags:
                 # Extract image description
                 description = None
                 
                 # Try to extract "flag of X"
-                flag_match = re.search(r'flag of (\w+)', message_lower)
+                flag_match = _RE_FLAG.search(message_lower)
                 if flag_match:
                     description = f"flag of {flag_match.group(1)}"
                 
                 # Try to extract after "image/picture of"
                 elif 'of' in message_lower:
-                    of_match = re.search(r'(?:image|picture|photo|flag)\s+of\s+([\w\s]+)', message_lower)
+                    of_match = _RE_MEDIA_OF.search(message_lower)
                     if of_match:
                         description = of_match.group(1).strip()
                 
@@ -2013,6 +2426,10 @@ Begin writing:"""
                         'description': description
                     }
         
+        return self._route_to_interaction_agent(message)
+    
+    def _route_to_interaction_agent(self, message: str) -> Dict[str, Any]:
+        """Fallback routing result when no specific task was detected."""
         print(f"\n[🔍 Detection] No specific task detected - delegating to interaction agent")
         print(f"   Message: {message[:50]}...")
         plan_file = self._create_general_interaction_plan(message, 'general')
@@ -2023,6 +2440,210 @@ Begin writing:"""
             'interaction_type': 'general'
         }
     
+    def _handle_generate_code(self, request: Dict[str, Any], user_input: str, user_name: Optional[str]) -> Optional[Tuple[str, str]]:
+        """Generate a code file through the task executor. Returns the (user, assistant) turn to record, if any."""
+        # CODE GENERATION (NEW!)
+        _emit(
+            f"\nManus AI: I'll create a {request['language']} {request['description']} for you.",
+            "           Generating actual code file...\n"
+        )
+
+        if self.task_executor:
+            result = self.task_executor.execute_task(
+                'generate_code',
+                {
+                    'description': request['description'],
+                    'language': request['language']
+                }
+            )
+
+            if result.get('success'):
+                return user_input, f"I've created {request['description']} in {request['language']} and saved it to {result['code_file']}"
+            else:
+                print(f"\n⚠️  Code generation failed: {result.get('error')}")
+                return user_input, f"Error generating code: {result.get('error')}"
+        else:
+            print(f"\n❌ Task executor not available.")
+            return None
+
+    def _handle_analyze_data(self, request: Dict[str, Any], user_input: str, user_name: Optional[str]) -> Optional[Tuple[str, str]]:
+        """Run a data analysis through the task executor. Returns the (user, assistant) turn to record, if any."""
+        # DATA ANALYSIS (NEW!)
+        _emit(
+            "\nManus AI: I'll analyze the data for you.",
+            "           Note: Please ensure pandas/matplotlib are installed.\n"
+        )
+
+        if self.task_executor:
+            result = self.task_executor.execute_task(
+                'analyze_data',
+                {
+                    'description': request['description'],
+                    'data_source': request.get('data_source', 'user_provided')
+                }
+            )
+
+            if result.get('success'):
+                return user_input, f"Analysis complete. Results saved to {result.get('report_file')}"
+            else:
+                print(f"\n⚠️  {result.get('error')}")
+                return user_input, result.get('error')
+        else:
+            print(f"\n❌ Task executor not available.")
+            return None
+
+    def _handle_create_presentation(self, request: Dict[str, Any], user_input: str, user_name: Optional[str]) -> Optional[Tuple[str, str]]:
+        """Create a PowerPoint presentation through the task executor. Returns the (user, assistant) turn to record, if any."""
+        # PPT GENERATION (NEW!)
+        _emit(
+            f"\nManus AI: I'll create a PowerPoint presentation about '{request['topic']}'.",
+            "           Note: Please ensure python-pptx is installed.\n"
+        )
+
+        if self.task_executor:
+            result = self.task_executor.execute_task(
+                'create_presentation',
+                {
+                    'topic': request['topic'],
+                    'slides': request.get('slides', 10)
+                }
+            )
+
+            if result.get('success'):
+                return user_input, f"Presentation created and saved to {result.get('file_path')}"
+            else:
+                print(f"\n⚠️  {result.get('error')}")
+                return user_input, result.get('error')
+        else:
+            print(f"\n❌ Task executor not available.")
+            return None
+
+    def _handle_insert_image_in_document(self, request: Dict[str, Any], user_input: str, user_name: Optional[str]) -> Optional[Tuple[str, str]]:
+        """Create a document with the last generated image embedded. Returns the (user, assistant) turn to record, if any."""
+        # IMAGE INSERTION INTO DOCUMENT (FIXED!)
+        _emit(
+            f"\nManus AI: I'll insert the image into an article titled '{request['title']}'.",
+            "           Creating document with embedded image...\n"
+        )
+
+        if self.task_executor:
+            result = self.task_executor.execute_task(
+                'insert_image_in_document',
+                {
+                    'title': request['title'],
+                    'image_path': self.last_generated_image,  # Use most recent image
+                    'word_count': 800
+                }
+            )
+
+            if result.get('success'):
+                return user_input, f"I've created an article titled '{request['title']}' with the image embedded. Saved to {result['file_path']}"
+            else:
+                print(f"\n⚠️  Document creation failed: {result.get('error')}")
+                return user_input, f"Error creating document: {result.get('error')}"
+        else:
+            print(f"\n❌ Task executor not available.")
+            return None
+
+    def _handle_generate_image(self, request: Dict[str, Any], user_input: str, user_name: Optional[str]) -> Optional[Tuple[str, str]]:
+        """Generate an image and remember it for later insertion. Returns the (user, assistant) turn to record, if any."""
+        # User wants an image generated!
+        _emit(
+            f"\nManus AI: I'll generate an image of '{request['description']}' for you.",
+            "           This will take just a moment...\n"
+        )
+
+        # Generate the image
+        if self.image_generator:
+            result = self.image_generator.generate_image(
+                description=request['description'],
+                method="auto",
+                size="1024x1024"
+            )
+
+            if result.get('success'):
+                # CRITICAL: Track last generated image for insertion!
+                self.last_generated_image = result['path']
+
+                _emit(
+                    "\n✅ Image created successfully!",
+                    f"   📁 Saved to: {result['filename']}",
+                    f"   📍 Full path: {result['path']}",
+                    "\n💡 Tip: You can now insert this image into a document!",
+                    "   Say: 'insert that image in an article titled [your title]'\n"
+                )
+
+                return user_input, f"I've created an image of {request['description']} and saved it to {result['path']}"
+            else:
+                _emit(
+                    "\n⚠️  Image generation encountered an issue.",
+                    f"   Created placeholder: {result['filename']}"
+                )
+                return user_input, f"I created a placeholder for {request['description']}. Install Pillow for actual image generation."
+        else:
+            print(f"\n❌ Image generator not available. Please restart the system.")
+            return user_input, "Image generator is not initialized."
+
+    def _handle_generate_document(self, request: Dict[str, Any], user_input: str, user_name: Optional[str]) -> Optional[Tuple[str, str]]:
+        """Generate a document with the agent pipeline. Returns the (user, assistant) turn to record, if any."""
+        # User wants a document generated!
+        lines = [f"\nManus AI: Absolutely! I'll write a {request['word_count']}-word {request['format'].upper()} document about {request['topic']}."]
+        if request['include_images']:
+            lines.append("           Including images as requested.")
+        if request['include_tables']:
+            lines.append("           Including tables as requested.")
+        _emit(*lines)
+
+        # Generate the document using agents
+        result = self.generate_document(
+            topic=request['topic'],
+            word_count=request['word_count'],
+            include_images=request.get('include_images', False),
+            include_tables=request.get('include_tables', False),
+            output_format=request.get('format', 'md')
+        )
+
+        # Result always contains file_path now (even on error)
+        if result.get('success'):
+            return user_input, f"I've generated a {result['word_count']}-word document about {request['topic']} and saved it to {result['file_path']}"
+        else:
+            print(f"\n⚠️  Generation completed with errors. Check the output above.")
+            return user_input, f"I encountered an error while generating the document: {result.get('error', 'Unknown error')}"
+
+    def _handle_general_interaction(self, request: Dict[str, Any], user_input: str, user_name: Optional[str]) -> Optional[Tuple[str, str]]:
+        """Delegate a general request to the interaction agent. Returns the (user, assistant) turn to record, if any."""
+        print("\nManus AI: Delegating to the interaction agent to complete this task.")
+
+        if self.task_executor:
+            # The executor reads the plan file, so make sure it has landed
+            self._flush_pending_writes()
+            result = self.task_executor.execute_task(
+                'general_interaction',
+                {
+                    'message': request.get('message', user_input),
+                    'plan_file': request.get('plan_file'),
+                    'analysis': request.get('analysis'),
+                    'interaction_type': request.get('interaction_type', 'general'),
+                    'user_name': user_name,
+                }
+            )
+
+            if result.get('success'):
+                response_text = result.get('response', '')
+                print(f"\nManus AI: {response_text}\n")
+                return user_input, response_text
+            else:
+                print(f"\n⚠️  Interaction task failed: {result.get('error')}")
+                return user_input, result.get('error', 'Interaction failed')
+        else:
+            print(f"\n❌ Task executor not available.")
+            return None
+
+    def _handle_unknown_action(self, request: Dict[str, Any], user_input: str, user_name: Optional[str]) -> Optional[Tuple[str, str]]:
+        """Report a routing result with no registered handler."""
+        print(f"\n⚠️  Unknown action: {request['action']}")
+        return None
+    
     def interactive_mode(self):
         """Run in interactive mode with human-in-the-loop control and memory."""
         print(f"\n{'='*70}")
@@ -2046,249 +2667,72 @@ Begin writing:"""
         print("  • exit               - Exit system")
         print(f"\n{'='*70}\n")
         
-        # Initialize conversation memory
-        conversation_history = []
+        # Initialize conversation memory (bounded recent window; older turns are committed verbatim)
+        self.prompt_buffer = PromptBuffer(max_recent=40)
+        # Turns are persisted by a background writer so disk I/O never delays the prompt
+        transcript = TranscriptWriter(self.session_workspace / "conversation.jsonl")
         user_name = None
         
-        while True:
-            try:
-                user_input = input("\nYou: ").strip()
+        try:
+            while True:
+                try:
+                    user_input = input("\nYou: ").strip()
                 
-                if not user_input:
-                    continue
+                    if not user_input:
+                        continue
                 
-                if user_input.lower() == "exit":
-                    print("\n👋 Shutting down Graive AI... Goodbye!")
-                    break
+                    if user_input.lower() == "exit":
+                        print("\n👋 Shutting down Graive AI... Goodbye!")
+                        break
                 
-                elif user_input.lower() in ["help", "h", "?"]:
-                    print("\n💡 Just talk to me naturally! I understand:")
-                    print("   - 'Write an essay about X in Y words'")
-                    print("   - 'Generate a report on X with images and tables'")
-                    print("   - Regular conversation and questions")
-                    print("\n   Commands: reflection-report, cost-report, exit")
-                    continue
+                    elif user_input.lower() in ["help", "h", "?"]:
+                        print("\n💡 Just talk to me naturally! I understand:")
+                        print("   - 'Write an essay about X in Y words'")
+                        print("   - 'Generate a report on X with images and tables'")
+                        print("   - Regular conversation and questions")
+                        print("\n   Commands: reflection-report, cost-report, exit")
+                        continue
                 
-                elif user_input.lower() == "reflection-report":
-                    if self.reflection:
-                        self.reflection.print_reflection_report()
-                    else:
-                        print("⚠️  Reflection system not enabled")
-                    continue
+                    elif user_input.lower() == "reflection-report":
+                        if self.reflection:
+                            self.reflection.print_reflection_report()
+                        else:
+                            print("⚠️  Reflection system not enabled")
+                        continue
                 
-                elif user_input.lower() == "cost-report":
-                    print(self.cost_manager.get_report(detailed=True))
-                    continue
+                    elif user_input.lower() == "cost-report":
+                        print(self.cost_manager.get_report(detailed=True))
+                        continue
                 
-                # Check if user is introducing themselves
-                if not user_name:
-                    name_patterns = [r"i'm (\w+)", r"i am (\w+)", r"my name is (\w+)", r"am (\w+)"]
-                    for pattern in name_patterns:
-                        match = re.search(pattern, user_input.lower())
+                    # Check if user is introducing themselves; the message is still
+                    # routed below ("I am writing an essay..." is also a request)
+                    if not user_name:
+                        match = _RE_NAME.search(user_input.lower())
                         if match:
                             user_name = match.group(1).capitalize()
                             print(f"\nManus AI: Nice to meet you, {user_name}! 👋")
-                            conversation_history.append({"role": "user", "content": user_input})
-                            conversation_history.append({"role": "assistant", "content": f"Nice to meet you, {user_name}!"})
-                            continue
-                
-                # Process user request with intelligent routing
-                request = self.process_user_request(user_input, user_name)
-                
-                if request['action'] == 'generate_code':
-                    # CODE GENERATION (NEW!)
-                    print(f"\nManus AI: I'll create a {request['language']} {request['description']} for you.")
-                    print(f"           Generating actual code file...\n")
-                    
-                    if self.task_executor:
-                        result = self.task_executor.execute_task(
-                            'generate_code',
-                            {
-                                'description': request['description'],
-                                'language': request['language']
-                            }
-                        )
-                        
-                        if result.get('success'):
-                            conversation_history.append({"role": "user", "content": user_input})
-                            conversation_history.append({"role": "assistant", "content": f"I've created {request['description']} in {request['language']} and saved it to {result['code_file']}"})
-                        else:
-                            print(f"\n⚠️  Code generation failed: {result.get('error')}")
-                            conversation_history.append({"role": "user", "content": user_input})
-                            conversation_history.append({"role": "assistant", "content": f"Error generating code: {result.get('error')}"})
-                    else:
-                        print(f"\n❌ Task executor not available.")
+                            self.prompt_buffer.append("user", user_input)
+                            self.prompt_buffer.append("assistant", f"Nice to meet you, {user_name}!")
+                            transcript.record(user_input, f"Nice to meet you, {user_name}!")
                 
-                elif request['action'] == 'analyze_data':
-                    # DATA ANALYSIS (NEW!)
-                    print(f"\nManus AI: I'll analyze the data for you.")
-                    print(f"           Note: Please ensure pandas/matplotlib are installed.\n")
-                    
-                    if self.task_executor:
-                        result = self.task_executor.execute_task(
-                            'analyze_data',
-                            {
-                                'description': request['description'],
-                                'data_source': request.get('data_source', 'user_provided')
-                            }
-                        )
-                        
-                        if result.get('success'):
-                            conversation_history.append({"role": "user", "content": user_input})
-                            conversation_history.append({"role": "assistant", "content": f"Analysis complete. Results saved to {result.get('report_file')}"})
-                        else:
-                            print(f"\n⚠️  {result.get('error')}")
-                            conversation_history.append({"role": "user", "content": user_input})
-                            conversation_history.append({"role": "assistant", "content": result.get('error')})
-                    else:
-                        print(f"\n❌ Task executor not available.")
+                    # Process user request with intelligent routing
+                    request = self.process_user_request(user_input, user_name)
                 
-                elif request['action'] == 'create_presentation':
-                    # PPT GENERATION (NEW!)
-                    print(f"\nManus AI: I'll create a PowerPoint presentation about '{request['topic']}'.")
-                    print(f"           Note: Please ensure python-pptx is installed.\n")
-                    
-                    if self.task_executor:
-                        result = self.task_executor.execute_task(
-                            'create_presentation',
-                            {
-                                'topic': request['topic'],
-                                'slides': request.get('slides', 10)
-                            }
-                        )
-                        
-                        if result.get('success'):
-                            conversation_history.append({"role": "user", "content": user_input})
-                            conversation_history.append({"role": "assistant", "content": f"Presentation created and saved to {result.get('file_path')}"})
-                        else:
-                            print(f"\n⚠️  {result.get('error')}")
-                            conversation_history.append({"role": "user", "content": user_input})
-                            conversation_history.append({"role": "assistant", "content": result.get('error')})
-                    else:
-                        print(f"\n❌ Task executor not available.")
-                
-                elif request['action'] == 'insert_image_in_document':
-                    # IMAGE INSERTION INTO DOCUMENT (FIXED!)
-                    print(f"\nManus AI: I'll insert the image into an article titled '{request['title']}'.")
-                    print(f"           Creating document with embedded image...\n")
-                    
-                    if self.task_executor:
-                        result = self.task_executor.execute_task(
-                            'insert_image_in_document',
-                            {
-                                'title': request['title'],
-                                'image_path': self.last_generated_image,  # Use most recent image
-                                'word_count': 800
-                            }
-                        )
-                        
-                        if result.get('success'):
-                            conversation_history.append({"role": "user", "content": user_input})
-                            conversation_history.append({"role": "assistant", "content": f"I've created an article titled '{request['title']}' with the image embedded. Saved to {result['file_path']}"})
-                        else:
-                            print(f"\n⚠️  Document creation failed: {result.get('error')}")
-                            conversation_history.append({"role": "user", "content": user_input})
-                            conversation_history.append({"role": "assistant", "content": f"Error creating document: {result.get('error')}"})
-                    else:
-                        print(f"\n❌ Task executor not available.")
-                
-                elif request['action'] == 'generate_image':
-                    # User wants an image generated!
-                    print(f"\nManus AI: I'll generate an image of '{request['description']}' for you.")
-                    print(f"           This will take just a moment...\n")
-                    
-                    # Generate the image
-                    if self.image_generator:
-                        result = self.image_generator.generate_image(
-                            description=request['description'],
-                            method="auto",
-                            size="1024x1024"
-                        )
-                        
-                        if result.get('success'):
-                            # CRITICAL: Track last generated image for insertion!
-                            self.last_generated_image = result['path']
-                            
-                            print(f"\n✅ Image created successfully!")
-                            print(f"   📁 Saved to: {result['filename']}")
-                            print(f"   📍 Full path: {result['path']}")
-                            print(f"\n💡 Tip: You can now insert this image into a document!")
-                            print(f"   Say: 'insert that image in an article titled [your title]'\n")
-                            
-                            conversation_history.append({"role": "user", "content": user_input})
-                            conversation_history.append({"role": "assistant", "content": f"I've created an image of {request['description']} and saved it to {result['path']}"})
-                        else:
-                            print(f"\n⚠️  Image generation encountered an issue.")
-                            print(f"   Created placeholder: {result['filename']}")
-                            conversation_history.append({"role": "user", "content": user_input})
-                            conversation_history.append({"role": "assistant", "content": f"I created a placeholder for {request['description']}. Install Pillow for actual image generation."})
-                    else:
-                        print(f"\n❌ Image generator not available. Please restart the system.")
-                        conversation_history.append({"role": "user", "content": user_input})
-                        conversation_history.append({"role": "assistant", "content": "Image generator is not initialized."})
-                
-                elif request['action'] == 'generate_document':
-                    # User wants a document generated!
-                    print(f"\nManus AI: Absolutely! I'll write a {request['word_count']}-word {request['format'].upper()} document about {request['topic']}.")
-
-                    if request['include_images']:
-                        print(f"           Including images as requested.")
-                    if request['include_tables']:
-                        print(f"           Including tables as requested.")
-                    
-                    # Generate the document using agents
-                    result = self.generate_document(
-                        topic=request['topic'],
-                        word_count=request['word_count'],
-                        include_images=request.get('include_images', False),
-                        include_tables=request.get('include_tables', False),
-                        output_format=request.get('format', 'md')
-                    )
-                    
-                    # Result always contains file_path now (even on error)
-                    if result.get('success'):
-                        conversation_history.append({"role": "user", "content": user_input})
-                        conversation_history.append({"role": "assistant", "content": f"I've generated a {result['word_count']}-word document about {request['topic']} and saved it to {result['file_path']}"})
-                    else:
-                        print(f"\n⚠️  Generation completed with errors. Check the output above.")
-                        conversation_history.append({"role": "user", "content": user_input})
-                        conversation_history.append({"role": "assistant", "content": f"I encountered an error while generating the document: {result.get('error', 'Unknown error')}"})
-
-                elif request['action'] == 'general_interaction':
-                    print("\nManus AI: Delegating to the interaction agent to complete this task.")
-
-                    if self.task_executor:
-                        result = self.task_executor.execute_task(
-                            'general_interaction',
-                            {
-                                'message': request.get('message', user_input),
-                                'plan_file': request.get('plan_file'),
-                                'analysis': request.get('analysis'),
-                                'interaction_type': request.get('interaction_type', 'general'),
-                                'user_name': user_name,
-                            }
-                        )
-
-                        if result.get('success'):
-                            response_text = result.get('response', '')
-                            print(f"\nManus AI: {response_text}\n")
-                            conversation_history.append({"role": "user", "content": user_input})
-                            conversation_history.append({"role": "assistant", "content": response_text})
-                        else:
-                            print(f"\n⚠️  Interaction task failed: {result.get('error')}")
-                            conversation_history.append({"role": "user", "content": user_input})
-                            conversation_history.append({"role": "assistant", "content": result.get('error', 'Interaction failed')})
-                    else:
-                        print(f"\n❌ Task executor not available.")
-
-                else:
-                    print(f"\n⚠️  Unknown action: {request['action']}")
-
-            except KeyboardInterrupt:
-                print("\n\n⚠️  Interrupted. Type 'exit' to quit or continue chatting.")
-            except Exception as e:
-                print(f"\n❌ Unexpected Error: {e}")
-                print(f"\nPlease report this issue. Continuing...")
+                    handler = self._action_handlers.get(request['action'], self._handle_unknown_action)
+                    turn = handler(request, user_input, user_name)
+                    if turn:
+                        self.prompt_buffer.append("user", turn[0])
+                        self.prompt_buffer.append("assistant", turn[1])
+                        transcript.record(turn[0], turn[1])
+
+                except KeyboardInterrupt:
+                    print("\n\n⚠️  Interrupted. Type 'exit' to quit or continue chatting.")
+                except Exception as e:
+                    print(f"\n❌ Unexpected Error: {e}")
+                    print(f"\nPlease report this issue. Continuing...")
+        finally:
+            # Flush queued turns however the loop exits
+            transcript.close()
 
 
 def main():
@@ -2360,9 +2804,8 @@ Examples:
     else:
         graive.interactive_mode()
 
+    sys.exit(0)
 
-if __name__ == "__main__":
-    main()
 
 if __name__ == "__main__":
     main()
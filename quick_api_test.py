@@ -1,8 +1,21 @@
 """Quick API Test - Verify all APIs are working"""
 
+import asyncio
+import functools
+import json
 import os
+import time
 from dotenv import load_dotenv
 
+try:
+    import orjson
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+except ImportError:
+    def _json_dumps(payload):
+        return json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    _json_loads = json.loads
+
 # Load API keys
 load_dotenv()
 
@@ -20,55 +33,117 @@ print(f"✓ OpenAI: {openai_key[:20]}..." if openai_key else "❌ OpenAI: Not fo
 print(f"✓ DeepSeek: {deepseek_key[:20]}..." if deepseek_key else "❌ DeepSeek: Not found")
 print(f"✓ Gemini: {gemini_key[:20]}..." if gemini_key else "❌ Gemini: Not found")
 
-# Test 2: Simple OpenAI call
-print("\n[2] Testing OpenAI...")
-try:
+# Tests 2-4: the three provider calls are independent, so run them concurrently.
+# The SDKs and requests are synchronous; asyncio.to_thread overlaps their network waits.
+# Each call streams its completion so time-to-first-token can be reported; the
+# probes run side by side, so fragments are collected rather than echoed live.
+
+
+def _collect(pieces, started):
+    """Join streamed fragments, returning (text, seconds until the first fragment)."""
+    parts = []
+    first_token = None
+    for piece in pieces:
+        if not piece:
+            continue
+        if first_token is None:
+            first_token = time.perf_counter() - started
+        parts.append(piece)
+    return "".join(parts), first_token
+
+
+def _call_openai():
     from openai import OpenAI
     client = OpenAI(api_key=openai_key)
+    started = time.perf_counter()
     response = client.chat.completions.create(
         model="gpt-3.5-turbo",
         messages=[{"role": "user", "content": "Hi"}],
-        max_tokens=50
+        max_tokens=50,
+        stream=True
     )
-    print(f"✓ OpenAI works! Response: {response.choices[0].message.content}")
-except Exception as e:
-    print(f"❌ OpenAI error: {e}")
+    return _collect((chunk.choices[0].delta.content for chunk in response if chunk.choices), started)
 
-# Test 3: Simple Gemini call
-print("\n[3] Testing Gemini...")
-try:
+
+def _call_gemini():
     import google.generativeai as genai
     genai.configure(api_key=gemini_key)
     model = genai.GenerativeModel('gemini-1.5-flash')
-    response = model.generate_content("Hi")
-    print(f"✓ Gemini works! Response: {response.text}")
-except Exception as e:
-    print(f"❌ Gemini error: {e}")
+    started = time.perf_counter()
+    response = model.generate_content("Hi", stream=True)
+    return _collect((chunk.text for chunk in response), started)
 
-# Test 4: Simple DeepSeek call
-print("\n[4] Testing DeepSeek...")
-try:
+
+def _iter_sse_content(response):
+    """Yield content deltas from an OpenAI-compatible server-sent event stream."""
+    for line in response.iter_lines(decode_unicode=True):
+        if not line or not line.startswith("data:"):
+            continue
+        data = line[len("data:"):].strip()
+        if data == "[DONE]":
+            break
+        for choice in _json_loads(data).get("choices", []):
+            yield (choice.get("delta") or {}).get("content")
+
+
+@functools.lru_cache(maxsize=1)
+def _deepseek_session():
+    """Shared keep-alive session so repeated DeepSeek calls reuse TCP/TLS connections."""
     import requests
-    response = requests.post(
+    from requests.adapters import HTTPAdapter
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(pool_connections=8, pool_maxsize=16))
+    session.headers.update({
+        "Authorization": f"Bearer {deepseek_key}",
+        "Content-Type": "application/json"
+    })
+    return session
+
+
+def _call_deepseek():
+    session = _deepseek_session()
+    started = time.perf_counter()
+    response = session.post(
         "https://api.deepseek.com/chat/completions",
-        headers={
-            "Authorization": f"Bearer {deepseek_key}",
-            "Content-Type": "application/json"
-        },
-        json={
+        data=_json_dumps({
             "model": "deepseek-chat",
             "messages": [{"role": "user", "content": "Hi"}],
-            "max_tokens": 50
-        },
-        timeout=30
+            "max_tokens": 50,
+            "stream": True
+        }),
+        timeout=30,
+        stream=True
     )
-    if response.status_code == 200:
-        result = response.json()
-        print(f"✓ DeepSeek works! Response: {result['choices'][0]['message']['content']}")
+    with response:
+        if response.status_code != 200:
+            raise RuntimeError(f"{response.status_code} - {response.text}")
+        return _collect(_iter_sse_content(response), started)
+
+
+async def _probe(name, call):
+    """Run one provider call in a worker thread and return (name, ok, detail)."""
+    try:
+        return name, True, await asyncio.to_thread(call)
+    except Exception as e:
+        return name, False, e
+
+
+async def _run_probes():
+    return await asyncio.gather(
+        _probe("OpenAI", _call_openai),
+        _probe("Gemini", _call_gemini),
+        _probe("DeepSeek", _call_deepseek)
+    )
+
+
+for index, (name, ok, detail) in enumerate(asyncio.run(_run_probes()), start=2):
+    print(f"\n[{index}] Testing {name}...")
+    if ok:
+        text, first_token = detail
+        timing = f" (first token after {first_token:.2f}s)" if first_token is not None else ""
+        print(f"✓ {name} works! Response: {text}{timing}")
     else:
-        print(f"❌ DeepSeek error: {response.status_code} - {response.text}")
-except Exception as e:
-    print(f"❌ DeepSeek error: {e}")
+        print(f"❌ {name} error: {detail}")
 
 print("\n" + "="*70)
 print("TEST COMPLETE")
@@ -6,23 +6,25 @@ Simple Quick Test - Tests just the request routing without full system init
 import re
 from typing import Dict, Any
 
+# Keyword classification is generated from gen_router.py's spec
+from _router import route
+
+# Extraction patterns, compiled once at import
+_STRIP_RE = re.compile(r'\b(?:code me|make me|write|create|a|the)\b')
+_TITLE_RE = re.compile(r'titled?\s+[\"\']?([^\"\'\n]+)[\"\']?')
+
 def process_user_request(message: str) -> Dict[str, Any]:
     """Test version of process_user_request"""
     message_lower = message.lower()
+    action = route(message_lower)
     
     # Detect CODE GENERATION requests
-    code_keywords = ['code', 'program', 'script', 'game', 'app']
-    is_code_request = any(keyword in message_lower for keyword in code_keywords)
-    
-    if is_code_request and any(verb in message_lower for verb in ['code', 'write', 'create', 'make']):
+    if action == 'generate_code':
         language = 'python'
         if 'javascript' in message_lower:
             language = 'javascript'
         
-        description = message_lower
-        for remove in ['code me', 'write', 'create', 'make me', 'a', 'the']:
-            description = description.replace(remove, '')
-        description = description.strip()
+        description = _STRIP_RE.sub('', message_lower).strip()
         
         return {
             'action': 'generate_code',
@@ -31,24 +33,22 @@ def process_user_request(message: str) -> Dict[str, Any]:
         }
     
     # Detect DATA ANALYSIS requests
-    analysis_keywords = ['analyze', 'analysis', 'data']
-    if any(keyword in message_lower for keyword in analysis_keywords):
+    if action == 'analyze_data':
         return {
             'action': 'analyze_data',
             'description': message
         }
     
     # Detect PPT generation
-    ppt_keywords = ['ppt', 'powerpoint', 'presentation']
-    if any(keyword in message_lower for keyword in ppt_keywords):
+    if action == 'create_presentation':
         return {
             'action': 'create_presentation',
             'topic': message
         }
     
     # Detect image insertion
-    if 'insert' in message_lower and 'image' in message_lower:
-        title_match = re.search(r'titled?\s+[\"\']?([^\"\'\n]+)[\"\']?', message_lower)
+    if action == 'insert_image_in_document':
+        title_match = _TITLE_RE.search(message_lower)
         title = title_match.group(1).strip() if title_match else 'untitled'
         
         return {
@@ -57,20 +57,20 @@ def process_user_request(message: str) -> Dict[str, Any]:
         }
     
     # Detect image generation
-    if 'image' in message_lower or 'flag' in message_lower:
+    if action == 'generate_image':
         return {
             'action': 'generate_image',
             'description': message
         }
     
     # Detect document generation
-    if any(word in message_lower for word in ['write', 'essay', 'article']):
+    if action == 'generate_document':
         return {
             'action': 'generate_document',
             'topic': message
         }
     
-    plan_path = f"plan_for_{message.lower().replace(' ', '_')}.md"
+    plan_path = f"plan_for_{message_lower.replace(' ', '_')}.md"
     with open(plan_path, 'w', encoding='utf-8') as plan_file:
         plan_file.write("# Quick Test Interaction Plan\n")
         plan_file.write(f"- Message: {message}\n")
@@ -17,9 +17,15 @@ Handles:
 
 import os
 import re
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 import shutil
 
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
 # Workspace root
 WORKSPACE = Path(r"c:\Users\GEMTECH 1\Desktop\MANUS")
 
@@ -36,45 +42,111 @@ SKIP_PATTERNS = {
     '.pyo'
 }
 
+# Text file types whose contents are rewritten
+TEXT_SUFFIXES = frozenset({'.py', '.md', '.txt', '.yaml', '.yml', '.json', '.bat', '.sh', '.rst'})
+
+# Replace variations of "manus" with "graive" in a single pass:
+# - whole words in all caps / title case / lower case (also covers Desktop\MANUS paths)
+# - the ManusAI class name
+# - manus_/_manus identifiers (underscores matched by lookaround so they are not consumed)
+RENAME_RE = re.compile(r'\b(?:MANUS|Manus|manus)\b|ManusAI|manus(?=_)|(?<=_)manus')
+RENAME_MAP = {
+    'MANUS': 'GRAIVE',
+    'Manus': 'Graive',
+    'manus': 'graive',
+    'ManusAI': 'GraiveAI',
+}
+
+# Optional Aho-Corasick automaton over the same spellings: one DFA pass finds
+# every candidate, and the word-boundary rules of RENAME_RE are applied to the hits
+RENAME_AUTOMATON = None
+if ahocorasick is not None:
+    RENAME_AUTOMATON = ahocorasick.Automaton()
+    for _word in RENAME_MAP:
+        RENAME_AUTOMATON.add_word(_word, _word)
+    RENAME_AUTOMATON.make_automaton()
+
+
+def _is_word_char(text: str, index: int) -> bool:
+    """Whether text[index] exists and is a regex word character."""
+    return 0 <= index < len(text) and (text[index].isalnum() or text[index] == '_')
+
+
+def _accept_match(text: str, start: int, word: str) -> bool:
+    """Apply RENAME_RE's boundary rules to a raw occurrence of word at start."""
+    if word == 'ManusAI':
+        return True
+    end = start + len(word)
+    whole_word = not _is_word_char(text, start - 1) and not _is_word_char(text, end)
+    if word == 'manus':
+        return whole_word or text[end:end + 1] == '_' or text[start - 1:start] == '_'
+    return whole_word
+
+
+def _splice_matches(text: str, matches) -> tuple:
+    """Replace accepted, non-overlapping (start, word) matches; returns (text, count)."""
+    parts = []
+    position = 0
+    for start, word in sorted(matches, key=lambda m: (m[0], -len(m[1]))):
+        if start < position or not _accept_match(text, start, word):
+            continue
+        parts.append(text[position:start])
+        parts.append(RENAME_MAP[word])
+        position = start + len(word)
+    if not parts:
+        return text, 0
+    parts.append(text[position:])
+    return "".join(parts), len(parts) // 2
+
+
+def replace_names(text: str) -> tuple:
+    """Rename every manus spelling in text; returns (new_text, replacements)."""
+    if RENAME_AUTOMATON is not None:
+        return _splice_matches(
+            text,
+            ((end - len(word) + 1, word) for end, word in RENAME_AUTOMATON.iter(text))
+        )
+    return RENAME_RE.subn(lambda m: RENAME_MAP[m.group(0)], text)
+
 def should_skip(path: Path) -> bool:
     """Check if path should be skipped."""
     return any(skip in str(path) for skip in SKIP_PATTERNS)
 
+def iter_text_files(root):
+    """Yield paths of text files under root, pruning skipped directories.
+    
+    Uses os.scandir so the file/directory type comes from the directory
+    listing itself instead of a separate stat per entry.
+    """
+    with os.scandir(root) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if not should_skip(Path(entry.path)):
+                    yield from iter_text_files(entry.path)
+            elif entry.is_file() and os.path.splitext(entry.name)[1] in TEXT_SUFFIXES:
+                file_path = Path(entry.path)
+                if not should_skip(file_path):
+                    yield file_path
+
 def rename_in_file(file_path: Path):
     """Rename all occurrences of manus to graive in a file."""
     if should_skip(file_path):
         return False
     
     try:
-        with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-            content = f.read()
+        with open(file_path, 'rb') as f:
+            raw = f.read()
         
-        # Track if changes were made
-        original_content = content
+        # Most files never mention manus: skip decoding and the regex entirely
+        if b'manus' not in raw and b'Manus' not in raw and b'MANUS' not in raw:
+            return False
         
-        # Replace variations of "manus" with "graive"
-        replacements = [
-            # All caps
-            (r'\bMANUS\b', 'GRAIVE'),
-            # Title case
-            (r'\bManus\b', 'Graive'),
-            # Lower case
-            (r'\bmanus\b', 'graive'),
-            # In paths (special handling)
-            (r'Desktop\\MANUS', r'Desktop\\GRAIVE'),
-            (r'Desktop/MANUS', r'Desktop/GRAIVE'),
-            # Class names
-            (r'ManusAI', 'GraiveAI'),
-            # URLs/identifiers that might contain manus
-            (r'manus_', 'graive_'),
-            (r'_manus', '_graive'),
-        ]
+        content = raw.decode('utf-8', errors='ignore')
         
-        for pattern, replacement in replacements:
-            content = re.sub(pattern, replacement, content)
+        content, replaced = replace_names(content)
         
-        # Write back if changed
-        if content != original_content:
+        # Write back only if something was replaced
+        if replaced:
             with open(file_path, 'w', encoding='utf-8') as f:
                 f.write(content)
             return True
@@ -119,22 +191,17 @@ def main():
     print("Phase 1: Updating file contents...")
     print("-"*70)
     
+    # Collect text files first, then rewrite them across all cores
+    text_files = list(iter_text_files(WORKSPACE))
+    
+    files_processed = len(text_files)
     files_changed = 0
-    files_processed = 0
     
-    for root, dirs, files in os.walk(WORKSPACE):
-        # Skip certain directories
-        dirs[:] = [d for d in dirs if not should_skip(Path(root) / d)]
-        
-        for file in files:
-            file_path = Path(root) / file
-            
-            # Only process text files
-            if file_path.suffix in {'.py', '.md', '.txt', '.yaml', '.yml', '.json', '.bat', '.sh', '.rst'}:
-                files_processed += 1
-                if rename_in_file(file_path):
-                    files_changed += 1
-                    print(f"  ✓ Updated: {file_path.relative_to(WORKSPACE)}")
+    with ProcessPoolExecutor() as executor:
+        for file_path, changed in zip(text_files, executor.map(rename_in_file, text_files, chunksize=32)):
+            if changed:
+                files_changed += 1
+                print(f"  ✓ Updated: {file_path.relative_to(WORKSPACE)}")
     
     print(f"\n✅ Phase 1 Complete: {files_changed}/{files_processed} files updated\n")
     
@@ -152,12 +219,11 @@ def main():
     print("Phase 3: Renaming test files...")
     print("-"*70)
     
-    test_files_renamed = 0
-    for file in WORKSPACE.glob("test_*.py"):
-        if 'manus' in file.name.lower():
-            new_path = rename_file_or_dir(file)
-            if new_path != file:
-                test_files_renamed += 1
+    # Pure filesystem renames: threads are enough to overlap the I/O
+    test_files = [file for file in WORKSPACE.glob("test_*.py") if 'manus' in file.name.lower()]
+    with ThreadPoolExecutor() as executor:
+        renamed = list(executor.map(rename_file_or_dir, test_files))
+    test_files_renamed = sum(1 for old, new in zip(test_files, renamed) if new != old)
     
     print(f"\n✅ Phase 3 Complete: {test_files_renamed} test files renamed\n")
     
@@ -1,21 +1,34 @@
-"""Browser Automation Module - Advanced Web Control."""
-
-from .browser_tool import (
-    AdvancedBrowserAutomation,
-    BrowserAutomationTool,
-    HumanBehaviorSimulator,
-    StealthBrowser,
-    create_browser_tool,
-    ADVANCED_BROWSER_AVAILABLE,
-    BROWSER_IMPORT_ERROR,
-)
-
-__all__ = [
-    "AdvancedBrowserAutomation",
-    "StealthBrowser",
-    "HumanBehaviorSimulator",
-    "BrowserAutomationTool",
-    "create_browser_tool",
-    "ADVANCED_BROWSER_AVAILABLE",
-    "BROWSER_IMPORT_ERROR",
-]
+"""Browser Automation Module - Advanced Web Control.
+
+Names are resolved lazily (PEP 562): importing the package is cheap, and the
+Selenium-backed implementation (or its fallback) is only loaded the first
+time one of the exported names is accessed.
+"""
+
+import importlib
+
+# Exported name -> submodule that defines it
+_LAZY = {
+    "AdvancedBrowserAutomation": "browser_tool",
+    "StealthBrowser": "browser_tool",
+    "HumanBehaviorSimulator": "browser_tool",
+    "BrowserAutomationTool": "browser_tool",
+    "create_browser_tool": "browser_tool",
+    "ADVANCED_BROWSER_AVAILABLE": "browser_tool",
+    "BROWSER_IMPORT_ERROR": "browser_tool",
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        module = importlib.import_module(f".{_LAZY[name]}", __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
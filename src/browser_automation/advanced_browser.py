@@ -21,7 +21,12 @@ import json
 from pathlib import Path
 from datetime import datetime
 import base64
+import functools
+import hashlib
+import math
+import threading
 
+import numpy as np
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
@@ -46,6 +51,87 @@ try:
 except ImportError:
     UNDETECTED_AVAILABLE = False
 
+# For event-driven download detection (inotify / ReadDirectoryChangesW / FSEvents)
+try:
+    from watchdog.observers import Observer
+    from watchdog.events import FileSystemEventHandler
+    WATCHDOG_AVAILABLE = True
+except ImportError:
+    Observer = None
+    FileSystemEventHandler = object
+    WATCHDOG_AVAILABLE = False
+
+# Smooth scroll run entirely in-page: fixed step size, one delay (ms) per step;
+# calls the async-script callback once the last step has run
+_SCROLL_JS = """
+const [step, delays, done] = arguments;
+let i = 0;
+(function next() {
+    if (i >= delays.length) { done(); return; }
+    window.scrollBy(0, step);
+    setTimeout(next, delays[i++]);
+})();
+"""
+
+# True while a Cloudflare challenge page is showing (title + challenge markers only)
+_CLOUDFLARE_CHALLENGE_JS = """
+return /Just a moment|Checking your browser|cloudflare/i.test(document.title) ||
+    !!document.querySelector('#cf-challenge-form, .cf-browser-verification, #challenge-form');
+"""
+
+# Outlines every element matching any of the given selectors
+_HIGHLIGHT_JS = """
+const [selectors, color] = arguments;
+for (const selector of selectors) {
+    let elements;
+    try { elements = document.querySelectorAll(selector); } catch (e) { continue; }
+    elements.forEach((element) => {
+        element.style.border = '3px solid ' + color;
+        element.style.boxShadow = '0 0 10px ' + color;
+    });
+}
+"""
+
+# Writes saved localStorage / sessionStorage dicts back in one call
+_RESTORE_STORAGE_JS = """
+const [local, session] = arguments;
+for (const k in local) localStorage.setItem(k, local[k]);
+for (const k in session) sessionStorage.setItem(k, session[k]);
+"""
+
+# Collects body text, headings, paragraphs and links in one WebDriver round-trip
+_EXTRACT_STRUCTURE_JS = """
+const texts = (selector) => Array.from(document.querySelectorAll(selector), (e) => e.innerText);
+return {
+    body: document.body ? document.body.innerText : '',
+    headings: texts('h1, h2, h3, h4, h5, h6'),
+    paragraphs: texts('p'),
+    links: Array.from(document.querySelectorAll('a'), (e) => ({
+        text: e.innerText,
+        href: typeof e.href === 'string' ? e.href : e.getAttribute('href')
+    }))
+};
+"""
+
+
+class _DownloadEventHandler(FileSystemEventHandler):
+    """Sets an event whenever a finished (non-.crdownload) file appears."""
+    
+    def __init__(self, wake: threading.Event):
+        super().__init__()
+        self.wake = wake
+    
+    def on_created(self, event):
+        self._notify(event.src_path)
+    
+    def on_moved(self, event):
+        # Chrome finishes a download by renaming the .crdownload file
+        self._notify(event.dest_path)
+    
+    def _notify(self, path) -> None:
+        if not str(path).endswith('.crdownload'):
+            self.wake.set()
+
 
 class HumanBehaviorSimulator:
     """
@@ -53,73 +139,177 @@ class HumanBehaviorSimulator:
     
     Implements realistic mouse movements, typing patterns, scrolling,
     and timing variations that mimic human interaction.
+    
+    Delays are drawn from a log-normal distribution centred on the
+    geometric midpoint of each range and clipped to it: right-skewed like
+    real reaction times, and with a lower median than a uniform draw.
     """
     
+    # Log-normal shape used when a caller does not pick one
+    DEFAULT_SIGMA = 0.4
+    
+    def __init__(self, driver: Optional[Any] = None):
+        """
+        Initialize the simulator.
+        
+        Args:
+            driver: WebDriver whose single ActionChains is reused by the
+                gesture helpers (can be bound later with ``bind``)
+        """
+        self.driver = driver
+        self._chain: Optional[ActionChains] = None
+    
+    def bind(self, driver: Optional[Any]) -> None:
+        """Attach to a (new) driver, dropping the chain built for the old one."""
+        self.driver = driver
+        self._chain = None
+    
+    @property
+    def chain(self) -> ActionChains:
+        """The reusable ActionChains for the bound driver, created on first use."""
+        if self._chain is None:
+            self._chain = ActionChains(self.driver)
+        return self._chain
+    
+    def mouse_gesture(self, from_x: int, from_y: int, to_x: int, to_y: int, steps: Optional[int] = None) -> None:
+        """Perform one Bezier mouse gesture on the shared chain."""
+        self.bezier_curve_movement(self.chain, from_x, from_y, to_x, to_y, steps)
+        self.chain.perform()
+        self.chain.reset_actions()
+    
+    def wander(self) -> None:
+        """Perform random mouse movements on the shared chain."""
+        self.random_mouse_movement(self.driver, self.chain)
+        self.chain.reset_actions()
+    
+    @staticmethod
+    def _log_normal_delay(median: float, sigma: float, lo: float, hi: float) -> float:
+        """Sample one log-normal delay with the given median, clipped to [lo, hi]."""
+        return max(lo, min(hi, float(np.random.lognormal(np.log(median), sigma))))
+    
+    @staticmethod
+    def _delay_in_range(lo: float, hi: float, sigma: float = DEFAULT_SIGMA) -> float:
+        """Log-normal delay for a [lo, hi] range, centred on its geometric midpoint."""
+        return HumanBehaviorSimulator._log_normal_delay((lo * hi) ** 0.5, sigma, lo, hi)
+    
     @staticmethod
     def human_delay(min_delay: float = 0.1, max_delay: float = 0.5) -> None:
         """Random delay simulating human reaction time."""
-        time.sleep(random.uniform(min_delay, max_delay))
+        time.sleep(HumanBehaviorSimulator._delay_in_range(min_delay, max_delay))
     
     @staticmethod
-    def human_type(element, text: str, typing_speed: str = "normal") -> None:
+    def human_type(
+        element,
+        text: str,
+        typing_speed: str = "normal",
+        chunk_delay: float = 0.2
+    ) -> None:
         """
         Type text with human-like timing variations.
         
+        Keystrokes are sent in short bursts: consecutive characters are
+        grouped until their combined delay reaches ``chunk_delay`` (or a
+        thinking pause falls due), sent with one ``send_keys`` call, and
+        followed by the summed delay. Overall cadence is unchanged while
+        WebDriver round-trips drop several-fold.
+        
+        With the ``fast`` preset on a CDP-capable driver, printable text is
+        instead typed key by key through ``Input.dispatchKeyEvent``, which
+        skips WebDriver's per-call element checks and keeps true per-key
+        timing at speeds where bursts would be conspicuous.
+        
         Args:
             element: Web element to type into
             text: Text to type
             typing_speed: Speed preset (slow, normal, fast)
+            chunk_delay: Accumulated delay (seconds) that closes a burst
         """
+        # (min, max, log-normal sigma) per preset; faster typists are steadier
         speed_ranges = {
-            "slow": (0.1, 0.3),
-            "normal": (0.05, 0.15),
-            "fast": (0.02, 0.08)
+            "slow": (0.1, 0.3, 0.45),
+            "normal": (0.05, 0.15, 0.4),
+            "fast": (0.02, 0.08, 0.35)
         }
         
-        min_delay, max_delay = speed_ranges.get(typing_speed, (0.05, 0.15))
+        min_delay, max_delay, sigma = speed_ranges.get(typing_speed, speed_ranges["normal"])
+        if not text:
+            return
         
-        for char in text:
-            element.send_keys(char)
-            time.sleep(random.uniform(min_delay, max_delay))
-            
-            # Occasionally pause longer (simulating thinking)
-            if random.random() < 0.1:
-                time.sleep(random.uniform(0.3, 0.8))
+        # Per-keystroke delays, plus occasional longer pauses (simulating thinking)
+        median = (min_delay * max_delay) ** 0.5
+        delays = np.clip(
+            np.random.lognormal(np.log(median), sigma, len(text)), min_delay, max_delay
+        ).tolist()
+        thinking = (np.random.random(len(text)) < 0.1).tolist()
+        
+        driver = getattr(element, "parent", None)
+        if typing_speed == "fast" and text.isprintable() and hasattr(driver, "execute_cdp_cmd"):
+            driver.execute_script("arguments[0].focus();", element)
+            for char, delay, pause in zip(text, delays, thinking):
+                driver.execute_cdp_cmd('Input.dispatchKeyEvent', {'type': 'keyDown', 'text': char})
+                driver.execute_cdp_cmd('Input.dispatchKeyEvent', {'type': 'keyUp'})
+                time.sleep(delay)
+                if pause:
+                    time.sleep(HumanBehaviorSimulator._delay_in_range(0.3, 0.8))
+            return
+        
+        start = 0
+        pending = 0.0
+        for i, delay in enumerate(delays):
+            pending += delay
+            last = i == len(text) - 1
+            if thinking[i] or pending >= chunk_delay or last:
+                element.send_keys(text[start:i + 1])
+                time.sleep(pending)
+                if thinking[i]:
+                    time.sleep(HumanBehaviorSimulator._delay_in_range(0.3, 0.8))
+                start = i + 1
+                pending = 0.0
     
     @staticmethod
     def bezier_curve_movement(
         action_chains: ActionChains,
         from_x: int, from_y: int,
         to_x: int, to_y: int,
-        steps: int = 20
+        steps: Optional[int] = None
     ) -> None:
         """
         Move mouse along Bezier curve for natural movement.
         
+        The moves and pauses are only queued on ``action_chains``; the
+        caller sends the whole gesture with a single ``perform()``.
+        
         Args:
             action_chains: Selenium ActionChains instance
             from_x, from_y: Starting coordinates
             to_x, to_y: Target coordinates
-            steps: Number of intermediate points
+            steps: Number of intermediate points (scaled to the travel
+                distance when None: 3-40 steps, a single move under 30px)
         """
+        distance = math.hypot(to_x - from_x, to_y - from_y)
+        if steps is None:
+            if distance < 30:
+                action_chains.move_by_offset(to_x - from_x, to_y - from_y)
+                return
+            steps = max(3, min(40, int(distance / 15)))
+        
         # Generate control points for Bezier curve
         ctrl_x1 = from_x + random.randint(-50, 50)
         ctrl_y1 = from_y + random.randint(-50, 50)
         ctrl_x2 = to_x + random.randint(-50, 50)
         ctrl_y2 = to_y + random.randint(-50, 50)
         
-        # Calculate points along curve
-        for i in range(steps):
-            t = i / steps
-            
-            # Cubic Bezier formula
-            x = (1-t)**3 * from_x + 3*(1-t)**2*t * ctrl_x1 + \
-                3*(1-t)*t**2 * ctrl_x2 + t**3 * to_x
-            y = (1-t)**3 * from_y + 3*(1-t)**2*t * ctrl_y1 + \
-                3*(1-t)*t**2 * ctrl_y2 + t**3 * to_y
-            
-            action_chains.move_by_offset(int(x), int(y))
-            time.sleep(random.uniform(0.001, 0.003))
+        # Evaluate the cubic Bezier at every step at once (ending on the target)
+        t = np.linspace(0.0, 1.0, steps + 1)
+        one_t = 1.0 - t
+        b0, b1, b2, b3 = one_t**3, 3 * one_t**2 * t, 3 * one_t * t**2, t**3
+        xs = np.rint(b0 * from_x + b1 * ctrl_x1 + b2 * ctrl_x2 + b3 * to_x).astype(np.int64)
+        ys = np.rint(b0 * from_y + b1 * ctrl_y1 + b2 * ctrl_y2 + b3 * to_y).astype(np.int64)
+        
+        # move_by_offset is relative: queue the step-to-step deltas
+        for dx, dy in zip(np.diff(xs).tolist(), np.diff(ys).tolist()):
+            action_chains.move_by_offset(dx, dy)
+            action_chains.pause(random.uniform(0.001, 0.003))
     
     @staticmethod
     def random_scroll(driver, direction: str = "down", distance: int = None) -> None:
@@ -134,17 +324,16 @@ class HumanBehaviorSimulator:
         if distance is None:
             distance = random.randint(100, 500)
         
-        # Scroll in multiple small increments
+        # Scroll in multiple small increments, all driven by one in-page script
         increments = random.randint(3, 8)
         increment_size = distance // increments
+        step = increment_size if direction == "down" else -increment_size
+        delays_ms = [
+            round(HumanBehaviorSimulator._delay_in_range(0.1, 0.3) * 1000)
+            for _ in range(increments)
+        ]
         
-        for _ in range(increments):
-            if direction == "down":
-                driver.execute_script(f"window.scrollBy(0, {increment_size})")
-            else:
-                driver.execute_script(f"window.scrollBy(0, -{increment_size})")
-            
-            time.sleep(random.uniform(0.1, 0.3))
+        driver.execute_async_script(_SCROLL_JS, step, delays_ms)
     
     @staticmethod
     def random_mouse_movement(driver, action_chains: ActionChains) -> None:
@@ -152,8 +341,11 @@ class HumanBehaviorSimulator:
         for _ in range(random.randint(2, 5)):
             offset_x = random.randint(-100, 100)
             offset_y = random.randint(-100, 100)
-            action_chains.move_by_offset(offset_x, offset_y).perform()
-            time.sleep(random.uniform(0.05, 0.15))
+            action_chains.move_by_offset(offset_x, offset_y)
+            action_chains.pause(random.uniform(0.05, 0.15))
+        
+        # Send the whole gesture in one round-trip
+        action_chains.perform()
 
 
 class StealthBrowser:
@@ -187,6 +379,68 @@ class StealthBrowser:
         self.downloads_folder = Path.home() / "Downloads" / "graive_downloads"
         self.downloads_folder.mkdir(parents=True, exist_ok=True)
     
+    @staticmethod
+    @functools.lru_cache(maxsize=4)
+    def _build_options(
+        headless: bool,
+        use_undetected: bool,
+        user_data_dir: Optional[str],
+        downloads_folder: str
+    ) -> Tuple[Tuple[str, ...], Tuple[Tuple[str, Any], ...]]:
+        """
+        Chrome arguments and experimental options for a configuration.
+        
+        Returns an immutable (arguments, experimental options) spec so the
+        cached value can be shared; ``_make_options`` turns it into a fresh
+        options object per launch (undetected-chromedriver refuses reuse).
+        """
+        arguments = []
+        if headless:
+            arguments.append('--headless=new')
+        
+        if user_data_dir:
+            arguments.append(f'--user-data-dir={user_data_dir}')
+        
+        # Anti-detection arguments
+        arguments += ['--disable-blink-features=AutomationControlled', '--no-sandbox', '--disable-dev-shm-usage']
+        experimental = []
+        if not use_undetected:
+            # undetected-chromedriver patches these itself
+            experimental += [("excludeSwitches", ("enable-automation",)), ("useAutomationExtension", False)]
+            arguments += [
+                '--disable-gpu',
+                # Realistic window size
+                '--window-size=1920,1080',
+                # User agent
+                'user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+            ]
+        
+        # Download preferences
+        experimental.append(("prefs", (
+            ("download.default_directory", downloads_folder),
+            ("download.prompt_for_download", False),
+            ("download.directory_upgrade", True),
+            ("safebrowsing.enabled", False)
+        )))
+        
+        return tuple(arguments), tuple(experimental)
+    
+    def _make_options(self):
+        """Fresh Chrome options object from the cached spec."""
+        arguments, experimental = self._build_options(
+            self.headless, self.use_undetected, self.user_data_dir, str(self.downloads_folder)
+        )
+        options = uc.ChromeOptions() if self.use_undetected else Options()
+        for argument in arguments:
+            options.add_argument(argument)
+        for name, value in experimental:
+            if name == "prefs":
+                value = dict(value)
+            elif isinstance(value, tuple):
+                value = list(value)
+            options.add_experimental_option(name, value)
+        return options
+    
     def start(self) -> webdriver.Chrome:
         """
         Start browser with stealth configuration.
@@ -194,65 +448,14 @@ class StealthBrowser:
         Returns:
             Configured WebDriver instance
         """
+        options = self._make_options()
+        
         if self.use_undetected:
             # Use undetected-chromedriver for maximum stealth
-            options = uc.ChromeOptions()
-            
-            if self.headless:
-                options.add_argument('--headless=new')
-            
-            if self.user_data_dir:
-                options.add_argument(f'--user-data-dir={self.user_data_dir}')
-            
-            # Additional stealth options
-            options.add_argument('--disable-blink-features=AutomationControlled')
-            options.add_argument('--no-sandbox')
-            options.add_argument('--disable-dev-shm-usage')
-            
-            # Download preferences
-            prefs = {
-                "download.default_directory": str(self.downloads_folder),
-                "download.prompt_for_download": False,
-                "download.directory_upgrade": True,
-                "safebrowsing.enabled": False
-            }
-            options.add_experimental_option("prefs", prefs)
-            
             self.driver = uc.Chrome(options=options, version_main=None)
         
         else:
             # Standard Selenium with stealth enhancements
-            options = Options()
-            
-            if self.headless:
-                options.add_argument('--headless=new')
-            
-            if self.user_data_dir:
-                options.add_argument(f'--user-data-dir={self.user_data_dir}')
-            
-            # Anti-detection arguments
-            options.add_argument('--disable-blink-features=AutomationControlled')
-            options.add_experimental_option("excludeSwitches", ["enable-automation"])
-            options.add_experimental_option('useAutomationExtension', False)
-            options.add_argument('--no-sandbox')
-            options.add_argument('--disable-dev-shm-usage')
-            options.add_argument('--disable-gpu')
-            
-            # Realistic window size
-            options.add_argument('--window-size=1920,1080')
-            
-            # User agent
-            options.add_argument('user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
-            
-            # Download preferences
-            prefs = {
-                "download.default_directory": str(self.downloads_folder),
-                "download.prompt_for_download": False,
-                "download.directory_upgrade": True,
-                "safebrowsing.enabled": False
-            }
-            options.add_experimental_option("prefs", prefs)
-            
             self.driver = webdriver.Chrome(options=options)
             
             # Apply selenium-stealth if available
@@ -281,6 +484,7 @@ class StealthBrowser:
                 '''
             })
         
+        self.human_behavior.bind(self.driver)
         return self.driver
     
     def navigate_to(self, url: str, wait_time: int = 10) -> Dict[str, Any]:
@@ -345,19 +549,15 @@ class StealthBrowser:
         try:
             # Wait for Cloudflare challenge to complete
             # Undetected ChromeDriver usually handles this automatically
-            
-            start_time = time.time()
-            while time.time() - start_time < max_wait:
-                # Check if still on challenge page
-                if "cloudflare" in self.driver.current_url.lower() or \
-                   "Just a moment" in self.driver.page_source:
-                    time.sleep(1)
-                    continue
-                else:
-                    return True
-            
-            return False
+            # (document.title is a few bytes; page_source would ship the whole DOM)
+            WebDriverWait(self.driver, max_wait, poll_frequency=0.25).until(
+                lambda d: "cloudflare" not in d.current_url.lower() and
+                not d.execute_script(_CLOUDFLARE_CHALLENGE_JS)
+            )
+            return True
         
+        except TimeoutException:
+            return False
         except Exception:
             return False
     
@@ -392,6 +592,7 @@ class StealthBrowser:
         if self.driver:
             self.driver.quit()
             self.driver = None
+            self.human_behavior.bind(None)
 
 
 class AdvancedBrowserAutomation:
@@ -420,7 +621,10 @@ class AdvancedBrowserAutomation:
             headless=headless,
             user_data_dir=user_data_dir
         )
-        self.driver = None
+        self._driver = None
+        self._started = False
+        # Why the last (possibly deferred) Chrome launch failed, if it did
+        self._launch_error: Optional[str] = None
         self.storage_manager = storage_manager
         self.human_behavior = HumanBehaviorSimulator()
         
@@ -428,39 +632,90 @@ class AdvancedBrowserAutomation:
         self.cookies: List[Dict] = []
         self.local_storage: Dict[str, str] = {}
         self.session_storage: Dict[str, str] = {}
+        
+        # Digest and path of the last saved screenshot (reset on navigation)
+        self._last_screenshot_hash: Optional[bytes] = None
+        self._last_screenshot_path: Optional[Path] = None
+    
+    @property
+    def driver(self):
+        """
+        WebDriver for the session, launched on first use.
+        
+        None until ``start_browser`` has been called (or after ``close``);
+        Chrome and its profile are only loaded when something needs them.
+        """
+        if self._driver is None and self._started:
+            try:
+                self._driver = self.browser.start()
+                self.human_behavior.bind(self._driver)
+            except Exception as e:
+                print(f"Browser launch failed: {e}")
+                self._launch_error = str(e)
+                self._started = False
+        return self._driver
     
-    def start_browser(self) -> Dict[str, Any]:
+    @driver.setter
+    def driver(self, value) -> None:
+        self._driver = value
+    
+    def start_browser(self, lazy: bool = True) -> Dict[str, Any]:
         """
         Start browser session.
         
+        Args:
+            lazy: Defer launching Chrome until the driver is first used;
+                pass False to launch immediately and report the version
+        
         Returns:
             Startup status and browser info
         """
+        self._started = True
+        self._launch_error = None
+        if lazy:
+            return {
+                "success": True,
+                "browser": "Chrome (Stealth Mode)",
+                "version": None,
+                "headless": self.browser.headless,
+                "deferred": True
+            }
+        
         try:
-            self.driver = self.browser.start()
+            self._driver = self.browser.start()
+            self.human_behavior.bind(self._driver)
             
             return {
                 "success": True,
                 "browser": "Chrome (Stealth Mode)",
-                "version": self.driver.capabilities.get('browserVersion'),
+                "version": self._driver.capabilities.get('browserVersion'),
                 "headless": self.browser.headless
             }
         
         except Exception as e:
+            self._started = False
+            self._launch_error = str(e)
             return {
                 "success": False,
                 "error": str(e)
             }
     
+    def _not_started(self) -> Dict[str, Any]:
+        """Error result for calls made without a running browser, naming any launch failure."""
+        if self._launch_error:
+            return {"success": False, "error": f"Browser launch failed: {self._launch_error}"}
+        return {"success": False, "error": "Browser not started"}
+    
     def navigate(self, url: str) -> Dict[str, Any]:
         """Navigate to URL with anti-detection."""
         if not self.driver:
-            return {"success": False, "error": "Browser not started"}
+            return self._not_started()
         
         result = self.browser.navigate_to(url)
+        self._last_screenshot_hash = None
         
-        # Check for Cloudflare
-        if "cloudflare" in self.driver.page_source.lower():
+        # Check for Cloudflare (without serializing the whole DOM via page_source)
+        if self.driver.execute_script(_CLOUDFLARE_CHALLENGE_JS):
             print("Cloudflare detected, attempting bypass...")
             if self.browser.bypass_cloudflare():
                 result["cloudflare_bypassed"] = True
@@ -473,11 +728,74 @@ class AdvancedBrowserAutomation:
         
         return result
     
+    def navigate_many(self, urls: List[str], wait_time: int = 30) -> Dict[str, Any]:
+        """
+        Load several URLs concurrently, one background tab each.
+        
+        Every tab is created through CDP ``Target.createTarget`` so Chrome
+        starts all loads at once; the tabs are then visited only to wait for
+        ``readyState`` and read their titles. The tabs are left open (their
+        handles are returned) and focus returns to the original tab.
+        
+        Args:
+            urls: URLs to open
+            wait_time: Maximum seconds to wait for each page to finish loading
+        
+        Returns:
+            Per-URL results with final URL, title and window handle
+        """
+        if not self.driver:
+            return self._not_started()
+        
+        start_time = time.time()
+        original_handle = self.driver.current_window_handle
+        
+        # Fire every navigation before waiting on any of them
+        targets = []
+        for url in urls:
+            try:
+                created = self.driver.execute_cdp_cmd(
+                    'Target.createTarget', {'url': url, 'background': True}
+                )
+                targets.append((url, created['targetId'], None))
+            except Exception as e:
+                targets.append((url, None, str(e)))
+        
+        results = []
+        for url, target_id, error in targets:
+            if error:
+                results.append({"success": False, "url": url, "error": error})
+                continue
+            try:
+                # ChromeDriver window handles are CDP target ids
+                self.driver.switch_to.window(target_id)
+                WebDriverWait(self.driver, wait_time).until(
+                    lambda d: d.execute_script('return document.readyState') == 'complete'
+                )
+                results.append({
+                    "success": True,
+                    "url": self.driver.current_url,
+                    "title": self.driver.title,
+                    "handle": target_id
+                })
+            except Exception as e:
+                results.append({"success": False, "url": url, "error": str(e), "handle": target_id})
+        
+        self.driver.switch_to.window(original_handle)
+        self._last_screenshot_hash = None
+        
+        return {
+            "success": any(result["success"] for result in results),
+            "results": results,
+            "load_time": time.time() - start_time
+        }
+    
     def take_screenshot(
         self,
         filename: Optional[str] = None,
         full_page: bool = False,
-        highlight_elements: Optional[List[str]] = None
+        highlight_elements: Optional[List[str]] = None,
+        cache_format: str = "webp"
     ) -> Dict[str, Any]:
         """
         Capture screenshot with optional element highlighting.
@@ -486,12 +804,16 @@ class AdvancedBrowserAutomation:
             filename: Output filename (auto-generated if None)
             full_page: Capture entire page or just viewport
             highlight_elements: CSS selectors to highlight before capture
+            cache_format: Encoding of the copy handed to storage_manager
+                ("webp", "jpeg" or "png" for lossless); the file on disk
+                stays PNG
         
         Returns:
-            Screenshot result with file path
+            Screenshot result with file path; ``unchanged`` is True when the
+            capture matched the previous one and nothing was written
         """
         if not self.driver:
-            return {"success": False, "error": "Browser not started"}
+            return self._not_started()
         
         try:
             # Generate filename if not provided
@@ -501,29 +823,43 @@ class AdvancedBrowserAutomation:
             
             # Highlight elements if requested
             if highlight_elements:
-                for selector in highlight_elements:
-                    self._highlight_element(selector)
+                self._highlight_elements(highlight_elements)
             
             # Capture screenshot
             if full_page:
-                screenshot_path = self._capture_full_page(filename)
+                png = self._capture_full_page()
             else:
-                screenshot_path = self.browser.downloads_folder / filename
-                self.driver.save_screenshot(str(screenshot_path))
+                png = self.driver.get_screenshot_as_png()
+            
+            # Skip the write when the page has not changed since the last capture
+            digest = hashlib.sha256(png).digest()
+            if digest == self._last_screenshot_hash:
+                return {
+                    "success": True,
+                    "unchanged": True,
+                    "file_path": str(self._last_screenshot_path),
+                    "size_bytes": len(png)
+                }
+            
+            screenshot_path = self.browser.downloads_folder / filename
+            screenshot_path.write_bytes(png)
+            self._last_screenshot_hash = digest
+            self._last_screenshot_path = screenshot_path
             
-            # Store in storage manager if available
+            # Store in storage manager if available (re-encoded: far fewer bytes)
             if self.storage_manager:
-                with open(screenshot_path, 'rb') as f:
-                    self.storage_manager.cache_media(
-                        media_data=f.read(),
-                        media_type="image",
-                        filename=filename
-                    )
+                media_data, extension = self._encode_for_cache(png, cache_format)
+                self.storage_manager.cache_media(
+                    media_data=media_data,
+                    media_type="image",
+                    filename=str(Path(filename).with_suffix(extension))
+                )
             
             return {
                 "success": True,
+                "unchanged": False,
                 "file_path": str(screenshot_path),
-                "size_bytes": screenshot_path.stat().st_size
+                "size_bytes": len(png)
             }
         
         except Exception as e:
@@ -532,52 +868,50 @@ class AdvancedBrowserAutomation:
                 "error": str(e)
             }
     
-    def _highlight_element(self, selector: str, color: str = "red"):
-        """Highlight element with border for screenshot."""
+    @staticmethod
+    def _encode_for_cache(png: bytes, cache_format: str) -> Tuple[bytes, str]:
+        """
+        Re-encode a PNG screenshot for the media cache.
+        
+        Returns:
+            (bytes, file extension); the PNG unchanged when lossless output is
+            requested, Pillow is missing, or encoding fails (e.g. pages taller
+            than WebP's 16383px limit)
+        """
+        cache_format = cache_format.lower()
+        if cache_format not in ("webp", "jpeg", "jpg"):
+            return png, ".png"
+        
         try:
-            script = f"""
-            var elements = document.querySelectorAll('{selector}');
-            elements.forEach(function(element) {{
-                element.style.border = '3px solid {color}';
-                element.style.boxShadow = '0 0 10px {color}';
-            }});
-            """
-            self.driver.execute_script(script)
+            from PIL import Image
+            import io
+            
+            with Image.open(io.BytesIO(png)) as image:
+                buffer = io.BytesIO()
+                if cache_format == "webp":
+                    image.save(buffer, format="WEBP", quality=85, method=4)
+                    return buffer.getvalue(), ".webp"
+                image.convert("RGB").save(buffer, format="JPEG", quality=85, optimize=True)
+                return buffer.getvalue(), ".jpg"
+        except Exception:
+            return png, ".png"
+    
+    def _highlight_elements(self, selectors: List[str], color: str = "red"):
+        """Highlight elements matching any selector with a border, in one call."""
+        try:
+            self.driver.execute_script(_HIGHLIGHT_JS, list(selectors), color)
         except Exception:
             pass
     
-    def _capture_full_page(self, filename: str) -> Path:
-        """Capture full page screenshot (beyond viewport)."""
-        # Get page dimensions
-        total_height = self.driver.execute_script(
-            "return document.body.scrollHeight"
-        )
-        viewport_height = self.driver.execute_script(
-            "return window.innerHeight"
-        )
-        
-        # Scroll and capture sections
-        screenshots = []
-        scroll_position = 0
-        
-        while scroll_position < total_height:
-            # Capture current viewport
-            screenshot = self.driver.get_screenshot_as_png()
-            screenshots.append(screenshot)
-            
-            # Scroll down
-            scroll_position += viewport_height
-            self.driver.execute_script(
-                f"window.scrollTo(0, {scroll_position})"
-            )
-            time.sleep(0.3)
-        
-        # Combine screenshots (simplified - would use PIL in production)
-        output_path = self.browser.downloads_folder / filename
-        with open(output_path, 'wb') as f:
-            f.write(screenshots[0])  # For now, just save first section
-        
-        return output_path
+    def _capture_full_page(self) -> bytes:
+        """Capture full page screenshot (beyond viewport) in one CDP call."""
+        # Chrome renders the whole document server-side; no scroll-and-stitch
+        result = self.driver.execute_cdp_cmd('Page.captureScreenshot', {
+            'format': 'png',
+            'captureBeyondViewport': True,
+            'fromSurface': True
+        })
+        return base64.b64decode(result['data'])
     
     def extract_all_text(self) -> Dict[str, Any]:
         """
@@ -587,29 +921,15 @@ class AdvancedBrowserAutomation:
             Extracted text and metadata
         """
         if not self.driver:
-            return {"success": False, "error": "Browser not started"}
+            return self._not_started()
         
         try:
-            # Extract visible text
-            text = self.driver.find_element(By.TAG_NAME, "body").text
-            
-            # Extract structured content
-            headings = [
-                elem.text for elem in self.driver.find_elements(
-                    By.CSS_SELECTOR, "h1, h2, h3, h4, h5, h6"
-                )
-            ]
-            
-            paragraphs = [
-                elem.text for elem in self.driver.find_elements(
-                    By.TAG_NAME, "p"
-                )
-            ]
-            
-            links = [
-                {"text": elem.text, "href": elem.get_attribute("href")}
-                for elem in self.driver.find_elements(By.TAG_NAME, "a")
-            ]
+            # Extract visible text and structured content in-page rather than per element
+            structure = self.driver.execute_script(_EXTRACT_STRUCTURE_JS) or {}
+            text = structure.get("body") or ""
+            headings = structure.get("headings", [])
+            paragraphs = structure.get("paragraphs", [])
+            links = structure.get("links", [])
             
             # Store in storage manager
             if self.storage_manager:
@@ -656,7 +976,7 @@ class AdvancedBrowserAutomation:
             Download result with file info
         """
         if not self.driver:
-            return {"success": False, "error": "Browser not started"}
+            return self._not_started()
         
         try:
             # Create subfolder if requested
@@ -667,48 +987,29 @@ class AdvancedBrowserAutomation:
             else:
                 download_dir = self.browser.downloads_folder
             
-            # Get initial file count
-            initial_files = set(download_dir.glob("*"))
-            
-            # Initiate download
-            self.driver.get(download_url)
-            self.human_behavior.human_delay(0.5, 1.5)
+            # Point Chrome at the target folder (prefs only cover the default one)
+            try:
+                self.driver.execute_cdp_cmd('Browser.setDownloadBehavior', {
+                    'behavior': 'allow',
+                    'downloadPath': str(download_dir)
+                })
+            except Exception:
+                pass
             
-            # Wait for download to complete
-            start_time = time.time()
-            while time.time() - start_time < wait_timeout:
-                current_files = set(download_dir.glob("*"))
-                new_files = current_files - initial_files
-                
-                # Check for completed downloads (no .crdownload files)
-                completed_downloads = [
-                    f for f in new_files
-                    if not f.name.endswith('.crdownload')
-                ]
-                
-                if completed_downloads:
-                    downloaded_file = completed_downloads[0]
-                    
-                    # Rename if custom filename provided
-                    if filename:
-                        new_path = downloaded_file.parent / filename
-                        downloaded_file.rename(new_path)
-                        downloaded_file = new_path
-                    
-                    return {
-                        "success": True,
-                        "file_path": str(downloaded_file),
-                        "filename": downloaded_file.name,
-                        "size_bytes": downloaded_file.stat().st_size,
-                        "download_time": time.time() - start_time
-                    }
-                
-                time.sleep(0.5)
+            # Watch the folder before the download starts so no event is missed
+            wake = threading.Event()
+            observer = None
+            if WATCHDOG_AVAILABLE:
+                observer = Observer()
+                observer.schedule(_DownloadEventHandler(wake), str(download_dir), recursive=False)
+                observer.start()
             
-            return {
-                "success": False,
-                "error": "Download timeout exceeded"
-            }
+            try:
+                return self._await_download(download_dir, download_url, filename, wait_timeout, wake, observer)
+            finally:
+                if observer is not None:
+                    observer.stop()
+                    observer.join()
         
         except Exception as e:
             return {
@@ -716,6 +1017,102 @@ class AdvancedBrowserAutomation:
                 "error": str(e)
             }
     
+    def _await_download(
+        self,
+        download_dir: Path,
+        download_url: str,
+        filename: Optional[str],
+        wait_timeout: int,
+        wake: threading.Event,
+        observer: Optional[Any]
+    ) -> Dict[str, Any]:
+        """Start the download and wait for a completed file to appear."""
+        # Snapshot existing entries
+        initial_files = self._list_dir_names(download_dir)
+        
+        # Initiate download
+        self.driver.get(download_url)
+        self.human_behavior.human_delay(0.5, 1.5)
+        
+        # Wait for download to complete: woken by filesystem events when
+        # watchdog is running, otherwise polling quickly at first and
+        # backing off so long downloads do not spin
+        start_time = time.time()
+        poll_interval = 0.05
+        while time.time() - start_time < wait_timeout:
+            # Check for completed downloads (no .crdownload files)
+            completed_downloads = [
+                name for name in self._list_dir_names(download_dir) - initial_files
+                if not name.endswith('.crdownload')
+            ]
+            
+            if completed_downloads:
+                downloaded_file = download_dir / completed_downloads[0]
+                
+                # Rename if custom filename provided
+                if filename:
+                    new_path = downloaded_file.parent / filename
+                    downloaded_file.rename(new_path)
+                    downloaded_file = new_path
+                
+                return {
+                    "success": True,
+                    "file_path": str(downloaded_file),
+                    "filename": downloaded_file.name,
+                    "size_bytes": downloaded_file.stat().st_size,
+                    "download_time": time.time() - start_time
+                }
+            
+            if observer is not None:
+                # Sleep until the next file event (re-check at least every second)
+                wake.wait(min(1.0, max(0.0, wait_timeout - (time.time() - start_time))))
+                wake.clear()
+            else:
+                time.sleep(poll_interval)
+                poll_interval = min(poll_interval * 2, 0.5)
+        
+        return {
+            "success": False,
+            "error": "Download timeout exceeded"
+        }
+    
+    def download_many(self, items: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Download several files through the browser.
+        
+        Args:
+            items: Dicts with ``url`` and optional ``filename`` / ``folder``
+        
+        Returns:
+            Per-item download results in input order
+        """
+        if not self.driver:
+            return self._not_started()
+        
+        # One driver drives one navigation at a time, so items run in turn
+        start_time = time.time()
+        results = []
+        for item in items:
+            result = self.download_file(
+                download_url=item["url"],
+                filename=item.get("filename"),
+                create_folder=item.get("folder")
+            )
+            result.setdefault("url", item["url"])
+            results.append(result)
+        
+        return {
+            "success": any(result["success"] for result in results),
+            "results": results,
+            "download_time": time.time() - start_time
+        }
+    
+    @staticmethod
+    def _list_dir_names(directory: Path) -> set:
+        """Names of the entries in a directory (one scandir, no per-file stat)."""
+        with os.scandir(directory) as entries:
+            return {entry.name for entry in entries}
+    
     def create_folder(self, folder_name: str, parent_path: Optional[str] = None) -> Dict[str, Any]:
         """
         Create folder in downloads directory.
@@ -755,23 +1152,19 @@ class AdvancedBrowserAutomation:
             Session data for later restoration
         """
         if not self.driver:
-            return {"success": False, "error": "Browser not started"}
+            return self._not_started()
         
         try:
             # Save cookies
             self.cookies = self.driver.get_cookies()
             
-            # Save local storage
-            local_storage = self.driver.execute_script(
-                "return Object.entries(localStorage).reduce((acc, [k, v]) => ({...acc, [k]: v}), {});"
-            )
-            self.local_storage = local_storage or {}
-            
-            # Save session storage
-            session_storage = self.driver.execute_script(
-                "return Object.entries(sessionStorage).reduce((acc, [k, v]) => ({...acc, [k]: v}), {});"
-            )
-            self.session_storage = session_storage or {}
+            # Save local and session storage (one linear copy each, one round-trip)
+            storage = self.driver.execute_script(
+                "return [Object.fromEntries(Object.entries(localStorage)), "
+                "Object.fromEntries(Object.entries(sessionStorage))];"
+            ) or [{}, {}]
+            self.local_storage = storage[0] or {}
+            self.session_storage = storage[1] or {}
             
             session_data = {
                 "cookies": self.cookies,
@@ -813,7 +1206,7 @@ class AdvancedBrowserAutomation:
             Restoration result
         """
         if not self.driver:
-            return {"success": False, "error": "Browser not started"}
+            return self._not_started()
         
         try:
             # Load session data from storage if not provided
@@ -828,23 +1221,14 @@ class AdvancedBrowserAutomation:
                 self.driver.get(session_data["url"])
             
             # Restore cookies
-            for cookie in session_data.get("cookies", []):
-                try:
-                    self.driver.add_cookie(cookie)
-                except Exception:
-                    pass  # Some cookies may be invalid
-            
-            # Restore local storage
-            for key, value in session_data.get("local_storage", {}).items():
-                self.driver.execute_script(
-                    f"localStorage.setItem('{key}', '{value}');"
-                )
+            self._restore_cookies(session_data.get("cookies", []))
             
-            # Restore session storage
-            for key, value in session_data.get("session_storage", {}).items():
-                self.driver.execute_script(
-                    f"sessionStorage.setItem('{key}', '{value}');"
-                )
+            # Restore local and session storage (values passed as arguments, not spliced into JS)
+            self.driver.execute_script(
+                _RESTORE_STORAGE_JS,
+                session_data.get("local_storage", {}),
+                session_data.get("session_storage", {})
+            )
             
             # Refresh page to apply session
             self.driver.refresh()
@@ -862,7 +1246,32 @@ class AdvancedBrowserAutomation:
                 "error": str(e)
             }
     
+    def _restore_cookies(self, cookies: List[Dict[str, Any]]) -> None:
+        """Set saved cookies with one CDP call, falling back to add_cookie per cookie."""
+        if not cookies:
+            return
+        
+        # Selenium stores the expiry as 'expiry'; CDP expects 'expires'
+        cdp_cookies = [
+            {("expires" if key == "expiry" else key): value for key, value in cookie.items()}
+            for cookie in cookies
+        ]
+        try:
+            self.driver.execute_cdp_cmd('Network.setCookies', {'cookies': cdp_cookies})
+            return
+        except Exception:
+            pass
+        
+        for cookie in cookies:
+            try:
+                self.driver.add_cookie(cookie)
+            except Exception:
+                pass  # Some cookies may be invalid
+    
     def close(self):
         """Close browser and cleanup resources."""
         self.browser.close()
-        self.driver = None
+        self._driver = None
+        self._started = False
+        self._launch_error = None
+        self.human_behavior.bind(None)
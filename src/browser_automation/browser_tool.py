@@ -57,6 +57,7 @@ class BrowserAutomationTool:
             # Navigation
             "start_browser",
             "navigate",
+            "navigate_many",
             "close_browser",
             
             # Content Extraction
@@ -67,6 +68,7 @@ class BrowserAutomationTool:
             
             # Downloads
             "download_file",
+            "download_many",
             "create_folder",
             
             # Session Management
@@ -102,6 +104,11 @@ class BrowserAutomationTool:
                 url=params["url"]
             )
         
+        elif action == "navigate_many":
+            return self.automation.navigate_many(
+                urls=params["urls"]
+            )
+        
         elif action == "close_browser":
             self.automation.close()
             return {"success": True, "message": "Browser closed"}
@@ -126,6 +133,11 @@ class BrowserAutomationTool:
                 wait_timeout=params.get("timeout", 60)
             )
         
+        elif action == "download_many":
+            return self.automation.download_many(
+                items=params["items"]
+            )
+        
         elif action == "create_folder":
             return self.automation.create_folder(
                 folder_name=params["name"],
@@ -3,28 +3,90 @@
 from __future__ import annotations
 
 import base64
+import codecs
+import functools
 import re
+import shutil
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from html import unescape
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 from urllib import request as urllib_request
-from urllib.parse import unquote, urlparse
+from urllib.parse import ParseResult, unquote, urlparse
 
 try:  # pragma: no cover - exercised when optional dependency exists
-    import requests
-except ImportError:  # pragma: no cover - fallback path covered in tests
-    requests = None  # type: ignore[assignment]
+    from selectolax.parser import HTMLParser
+except ImportError:  # pragma: no cover - regex extraction is used instead
+    HTMLParser = None  # type: ignore[assignment,misc]
 
 
-if requests:
-    RequestError = requests.RequestException  # type: ignore[attr-defined]
-else:
-    class RequestError(Exception):
-        """Placeholder error used when requests is unavailable."""
+# requests.RequestException derives from IOError, so OSError covers it
+# without importing requests up front
+RequestError = OSError
 
-        pass
+
+@functools.lru_cache(maxsize=1)
+def _requests_module() -> Any:
+    """Import requests on first HTTP use; None when it is not installed."""
+    try:  # pragma: no cover - exercised when optional dependency exists
+        import requests
+    except ImportError:  # pragma: no cover - fallback path covered in tests
+        return None
+    return requests
+
+
+# Regex extraction patterns, compiled once at import
+_SCRIPT_STYLE_RE = re.compile(r"<(script|style)[^>]*>.*?</\1>", re.IGNORECASE | re.DOTALL)
+_HEADING_RE = re.compile(r"<(h[1-6])[^>]*>(.*?)</\1>", re.IGNORECASE | re.DOTALL)
+_LINK_RE = re.compile(r"<a[^>]+href=\"([^\"]+)\"[^>]*>(.*?)</a>", re.IGNORECASE | re.DOTALL)
+_TAG_RE = re.compile(r"<[^>]+>")
+_WS_RE = re.compile(r"[ \t\r\f\v]+")
+_NEWLINE_INDENT_RE = re.compile(r"\n\s+")
+
+# On-disk HTTP cache used when CacheControl is installed
+_HTTP_CACHE_DIR = Path.home() / ".cache" / "graive_http"
+
+# Human-like pauses are pointless without a real browser to disguise; set True
+# to restore the fixed midpoint sleep in HumanBehaviorSimulator.human_delay
+_ENABLE_DELAYS = False
+
+# Buffer size for streamed downloads
+_DOWNLOAD_CHUNK_SIZE = 1 << 16
+# Storage writes allowed in flight before navigate/extract block (backpressure)
+_MAX_PENDING_WRITES = 32
+
+
+@functools.lru_cache(maxsize=1024)
+def _cached_urlparse(url: str) -> ParseResult:
+    """urlparse memoized per URL string (ParseResult is an immutable tuple)."""
+    return urlparse(url)
+
+
+@functools.lru_cache(maxsize=1024)
+def _cached_unquote(component: str) -> str:
+    """unquote memoized for short URL components such as paths and hosts."""
+    return unquote(component)
+
+
+@functools.lru_cache(maxsize=64)
+def _charset_from_content_type(content_type: str) -> str:
+    """Codec named by a Content-Type header, defaulting to UTF-8 when absent or unknown."""
+    for param in content_type.split(";")[1:]:
+        key, _, value = param.partition("=")
+        if key.strip().lower() == "charset":
+            try:
+                return codecs.lookup(value.strip().strip("'\"")).name
+            except LookupError:
+                break
+    return "utf-8"
+
+
+def _decode_body(body: bytes, headers: Dict[str, str]) -> str:
+    """Decode a response body with its declared charset, never guessing."""
+    return body.decode(_charset_from_content_type(headers.get("content-type", "")), errors="replace")
 
 
 @dataclass
@@ -35,14 +97,32 @@ class _LightweightResponse:
     status_code: int
     headers: Dict[str, str]
     text: str
+    source: str = "file"
 
 
 class HumanBehaviorSimulator:
     """Fallback human behaviour simulator used for parity with Selenium version."""
 
+    def __init__(self, driver: Any = None) -> None:
+        self.driver = driver
+
+    def bind(self, driver: Any) -> None:
+        """Kept for API compatibility; there is no action chain to reset."""
+        self.driver = driver
+
+    def mouse_gesture(self, *_args: Any, **_kwargs: Any) -> None:
+        """Mouse movement is not supported in the fallback implementation."""
+        return None
+
+    def wander(self) -> None:
+        """Mouse movement is not supported in the fallback implementation."""
+        return None
+
     @staticmethod
     def human_delay(min_delay: float = 0.05, max_delay: float = 0.2) -> None:
-        """Introduce a deterministic short delay to mimic human interaction."""
+        """Introduce a deterministic short delay to mimic human interaction (off by default)."""
+        if not _ENABLE_DELAYS:
+            return
         time.sleep((min_delay + max_delay) / 2)
 
     @staticmethod
@@ -61,14 +141,26 @@ class HumanBehaviorSimulator:
         return None
 
 
+# The fallback simulator is never bound to a driver, so every browser shares one
+_HUMAN = HumanBehaviorSimulator()
+
+
 class StealthBrowser:
     """Placeholder browser that keeps download folder semantics consistent."""
 
     def __init__(self, headless: bool = True, user_data_dir: Optional[str] = None) -> None:
         self.headless = headless
         self.user_data_dir = user_data_dir
-        self.downloads_folder = Path.home() / "Downloads" / "graive_downloads"
-        self.downloads_folder.mkdir(parents=True, exist_ok=True)
+        self._downloads_root = Path.home() / "Downloads" / "graive_downloads"
+        self._downloads_ready = False
+
+    @property
+    def downloads_folder(self) -> Path:
+        """Download directory, created the first time it is needed."""
+        if not self._downloads_ready:
+            self._downloads_root.mkdir(parents=True, exist_ok=True)
+            self._downloads_ready = True
+        return self._downloads_root
 
     def start(self) -> None:
         """There is no real browser to return in lightweight mode."""
@@ -90,19 +182,69 @@ class AdvancedBrowserAutomation:
         request_timeout: int = 15,
     ) -> None:
         self.browser = StealthBrowser(headless=headless, user_data_dir=user_data_dir)
-        self.session = requests.Session() if requests else None
+        self._session: Any = None
+        self._session_lock = threading.Lock()
         self.storage_manager = storage_manager
         self.request_timeout = request_timeout
-        self.human_behavior = HumanBehaviorSimulator()
+        self.human_behavior = _HUMAN
 
         self._started = False
         self._last_response: Optional[_LightweightResponse] = None
         self._history: List[str] = []
+        # (response, extraction) for the last page extracted; reused while that response is current
+        self._extract_cache: Tuple[Optional[_LightweightResponse], Any] = (None, None)
+        # Page captures are written off the request path; the pool starts on first write
+        self._io_pool: Optional[ThreadPoolExecutor] = None
+        self._io_slots = threading.BoundedSemaphore(_MAX_PENDING_WRITES)
+
+    @property
+    def session(self) -> Any:
+        """HTTP session, built on first use; None when requests is not installed."""
+        if self._session is None:
+            with self._session_lock:
+                if self._session is None:
+                    requests = _requests_module()
+                    if requests is not None:
+                        self._session = self._create_session(requests)
+        return self._session
+
+    @staticmethod
+    def _create_session(requests: Any) -> Any:
+        """
+        Keep-alive session with a larger per-host pool and retries on gateway errors.
+
+        With CacheControl installed the adapter also honours HTTP caching:
+        fresh responses are served from disk and stale ones are revalidated
+        with If-None-Match / If-Modified-Since.
+        """
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
+        try:  # pragma: no cover - exercised when optional dependency exists
+            from cachecontrol import CacheControlAdapter
+            from cachecontrol.caches.file_cache import FileCache
+        except ImportError:  # pragma: no cover - responses are simply not cached
+            CacheControlAdapter = None
+
+        session = requests.Session()
+        adapter_options = {
+            "pool_connections": 16,
+            "pool_maxsize": 32,
+            "max_retries": Retry(total=2, backoff_factor=0.2, status_forcelist=[502, 503, 504]),
+        }
+        if CacheControlAdapter is not None:
+            adapter = CacheControlAdapter(cache=FileCache(str(_HTTP_CACHE_DIR)), **adapter_options)
+        else:
+            adapter = HTTPAdapter(**adapter_options)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
 
     # ------------------------------------------------------------------
     # Lifecycle management
     # ------------------------------------------------------------------
-    def start_browser(self) -> Dict[str, Any]:
+    def start_browser(self, lazy: bool = True) -> Dict[str, Any]:
+        del lazy  # Nothing to launch in lightweight mode
         self._started = True
         self.browser.start()
         return {
@@ -113,11 +255,31 @@ class AdvancedBrowserAutomation:
         }
 
     def close(self) -> None:
-        if self.session and requests:
-            self.session.close()
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+        if self._io_pool is not None:
+            self._io_pool.shutdown(wait=True)
+            self._io_pool = None
         self.browser.close()
         self._started = False
         self._last_response = None
+        self._extract_cache = (None, None)
+
+    def _write_async(self, filename: str, content: str) -> None:
+        """Queue a storage write on the I/O pool, blocking only when too many are pending."""
+        if self._io_pool is None:
+            self._io_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="graive-browser-io")
+        self._io_slots.acquire()
+        future = self._io_pool.submit(self._safe_write, filename, content)
+        future.add_done_callback(lambda _: self._io_slots.release())
+
+    def _safe_write(self, filename: str, content: str) -> None:
+        try:
+            self.storage_manager.write_file(file_path=filename, content=content)
+        except Exception:
+            # Storage errors should not halt browser usage.
+            pass
 
     # ------------------------------------------------------------------
     # Navigation helpers
@@ -132,35 +294,56 @@ class AdvancedBrowserAutomation:
             return {"success": False, "error": str(exc)}
 
         self._last_response = response
+        self._extract_cache = (None, None)
         self._history.append(response.url)
 
         if self.storage_manager and response.text:
-            try:
-                filename = f"page_capture_{len(self._history):04d}.html"
-                self.storage_manager.write_file(
-                    file_path=filename,
-                    content=response.text,
-                )
-            except Exception:
-                # Storage errors should not halt browser usage.
-                pass
+            self._write_async(f"page_capture_{len(self._history):04d}.html", response.text)
 
         return {
             "success": True,
             "url": response.url,
             "status_code": response.status_code,
             "content_length": len(response.text),
-            "source": self._source_for_url(response.url),
+            "source": response.source,
+        }
+
+    def navigate_many(self, urls: List[str], max_workers: int = 8) -> Dict[str, Any]:
+        """Fetch several URLs concurrently; the current page is left unchanged."""
+        if not self._started:
+            return {"success": False, "error": "Browser not started"}
+
+        def fetch(url: str) -> Dict[str, Any]:
+            try:
+                response = self._load_url(url)
+            except (OSError, ValueError, RequestError) as exc:
+                return {"success": False, "url": url, "error": str(exc)}
+            return {
+                "success": True,
+                "url": response.url,
+                "status_code": response.status_code,
+                "content_length": len(response.text),
+                "source": response.source,
+            }
+
+        start_time = time.time()
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(urls) or 1))) as pool:
+            results = list(pool.map(fetch, urls))
+
+        return {
+            "success": any(result["success"] for result in results),
+            "results": results,
+            "load_time": time.time() - start_time,
         }
 
     def _load_url(self, url: str) -> _LightweightResponse:
-        parsed = urlparse(url)
+        parsed = _cached_urlparse(url)
         scheme = parsed.scheme.lower()
 
         if scheme == "file":
             path = self._resolve_file_url(parsed)
-            text = path.read_text(encoding="utf-8")
-            return _LightweightResponse(url=url, status_code=200, headers={}, text=text)
+            text = path.read_bytes().decode("utf-8", errors="replace")
+            return _LightweightResponse(url=url, status_code=200, headers={}, text=text, source=scheme)
 
         if scheme == "data":
             header, _, data = url.partition(",")
@@ -169,29 +352,35 @@ class AdvancedBrowserAutomation:
                 text = payload.decode("utf-8", errors="replace")
             else:
                 text = unquote(data)
-            return _LightweightResponse(url=url, status_code=200, headers={}, text=text)
+            return _LightweightResponse(url=url, status_code=200, headers={}, text=text, source=scheme)
 
         if scheme in {"http", "https"}:
-            if self.session and requests:
-                response = self.session.get(url, timeout=self.request_timeout)
+            session = self.session
+            if session is not None:
+                response = session.get(url, timeout=self.request_timeout)
                 response.raise_for_status()
                 headers = {k.lower(): v for k, v in response.headers.items()}
+                final_url = str(response.url)
                 return _LightweightResponse(
-                    url=str(response.url),
+                    url=final_url,
                     status_code=response.status_code,
                     headers=headers,
-                    text=response.text,
+                    # response.text would run charset detection when no charset is declared
+                    text=_decode_body(response.content, headers),
+                    # Redirects can change the scheme; no need to reparse the rest
+                    source=final_url.partition(":")[0].lower() or scheme,
                 )
 
             with urllib_request.urlopen(url, timeout=self.request_timeout) as response:  # type: ignore[call-arg]
-                data = response.read().decode("utf-8", errors="replace")
                 headers = {k.lower(): v for k, v in response.headers.items()}
+                data = _decode_body(response.read(), headers)
                 status_code = getattr(response, "status", 200)
                 return _LightweightResponse(
                     url=url,
                     status_code=status_code,
                     headers=headers,
                     text=data,
+                    source=scheme,
                 )
 
         if not scheme:
@@ -202,18 +391,13 @@ class AdvancedBrowserAutomation:
 
     @staticmethod
     def _resolve_file_url(parsed) -> Path:
-        path = Path(unquote(parsed.path))
+        path = Path(_cached_unquote(parsed.path))
         if parsed.netloc and parsed.netloc != "":
             # Windows paths come through the netloc component.
-            drive = unquote(parsed.netloc)
+            drive = _cached_unquote(parsed.netloc)
             path = Path(f"{drive}{parsed.path}")
         return path.resolve()
 
-    @staticmethod
-    def _source_for_url(url: str) -> str:
-        parsed = urlparse(url)
-        return parsed.scheme or "file"
-
     # ------------------------------------------------------------------
     # Extraction utilities
     # ------------------------------------------------------------------
@@ -233,17 +417,14 @@ class AdvancedBrowserAutomation:
         if not self._last_response:
             return {"success": False, "error": "No page loaded"}
 
-        text, headings, links = self._extract_from_html(self._last_response.text)
+        cached_response, extracted = self._extract_cache
+        if cached_response is not self._last_response:
+            extracted = self._extract_from_html(self._last_response.text)
+            self._extract_cache = (self._last_response, extracted)
+        text, headings, links = extracted
 
         if self.storage_manager:
-            try:
-                filename = f"extracted_text_{len(self._history):04d}.txt"
-                self.storage_manager.write_file(
-                    file_path=filename,
-                    content=text,
-                )
-            except Exception:
-                pass
+            self._write_async(f"extracted_text_{len(self._history):04d}.txt", text)
 
         return {
             "success": True,
@@ -258,25 +439,47 @@ class AdvancedBrowserAutomation:
         }
 
     def _extract_from_html(self, html: str) -> Tuple[str, List[str], List[Dict[str, str]]]:
-        cleaned = re.sub(r"(?is)<(script|style)[^>]*>.*?</\1>", "", html)
-        headings = [
-            unescape(match.group(2)).strip()
-            for match in re.finditer(r"<(h[1-6])[^>]*>(.*?)</\1>", cleaned, flags=re.IGNORECASE | re.DOTALL)
+        if HTMLParser is not None:
+            return self._extract_with_parser(html)
+        return self._extract_with_regex(html)
+
+    @staticmethod
+    def _normalize_text(text: str) -> str:
+        normalized = _WS_RE.sub(" ", text)
+        normalized = _NEWLINE_INDENT_RE.sub("\n", normalized)
+        return normalized.strip()
+
+    def _extract_with_parser(self, html: str) -> Tuple[str, List[str], List[Dict[str, str]]]:
+        """Single C-level parse (selectolax/lexbor) producing text, headings and links."""
+        tree = HTMLParser(html)
+        for node in tree.css("script, style"):
+            node.decompose()
+        headings = [node.text(strip=True) for node in tree.css("h1, h2, h3, h4, h5, h6")]
+        links = [
+            {"text": node.text(strip=True), "href": node.attributes.get("href") or ""}
+            for node in tree.css("a[href]")
         ]
+        root = tree.body or tree.root
+        text = root.text(separator=" ", strip=False) if root is not None else ""
+        return self._normalize_text(text), headings, links
+
+    def _extract_with_regex(self, html: str) -> Tuple[str, List[str], List[Dict[str, str]]]:
+        """
+        Regex extraction used when selectolax is unavailable.
+
+        The script/style, heading, link and tag passes are deliberately kept
+        separate: each is a literal-prefixed C-level scan, and fusing them
+        into one tokenizer driven from Python measured slower, because the
+        per-tag interpreter work outweighs the extra scans.
+        """
+        cleaned = _SCRIPT_STYLE_RE.sub("", html)
+        headings = [unescape(match.group(2)).strip() for match in _HEADING_RE.finditer(cleaned)]
         links = [
             {"text": unescape(match.group(2)).strip(), "href": match.group(1)}
-            for match in re.finditer(
-                r"<a[^>]+href=\"([^\"]+)\"[^>]*>(.*?)</a>",
-                cleaned,
-                flags=re.IGNORECASE | re.DOTALL,
-            )
+            for match in _LINK_RE.finditer(cleaned)
         ]
-        text_only = re.sub(r"(?s)<[^>]+>", " ", cleaned)
-        text_only = unescape(text_only)
-        normalized = re.sub(r"[ \t\r\f\v]+", " ", text_only)
-        normalized = re.sub(r"\n\s+", "\n", normalized)
-        normalized = normalized.strip()
-        return normalized, headings, links
+        text_only = unescape(_TAG_RE.sub(" ", cleaned))
+        return self._normalize_text(text_only), headings, links
 
     # ------------------------------------------------------------------
     # Downloads and filesystem helpers
@@ -310,30 +513,58 @@ class AdvancedBrowserAutomation:
             "size_bytes": path.stat().st_size,
         }
 
+    def download_many(self, items: List[Dict[str, Any]], max_workers: int = 8) -> Dict[str, Any]:
+        """Download several files concurrently; results follow the input order."""
+        if not self._started:
+            return {"success": False, "error": "Browser not started"}
+
+        def fetch(item: Dict[str, Any]) -> Dict[str, Any]:
+            result = self.download_file(
+                download_url=item["url"],
+                filename=item.get("filename"),
+                create_folder=item.get("folder"),
+            )
+            result.setdefault("url", item["url"])
+            return result
+
+        start_time = time.time()
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(items) or 1))) as pool:
+            results = list(pool.map(fetch, items))
+
+        return {
+            "success": any(result["success"] for result in results),
+            "results": results,
+            "download_time": time.time() - start_time,
+        }
+
     def _download_to_path(self, url: str, directory: Path, filename: Optional[str]) -> Path:
-        parsed = urlparse(url)
+        parsed = _cached_urlparse(url)
         scheme = parsed.scheme.lower()
 
         if scheme == "file":
             source_path = self._resolve_file_url(parsed)
             target_name = filename or source_path.name
             target_path = directory / target_name
-            target_path.write_bytes(source_path.read_bytes())
+            # Kernel-side copy (sendfile / CopyFileEx); bytes never enter Python
+            shutil.copyfile(source_path, target_path)
             return target_path
 
         if scheme in {"http", "https"}:
-            data: bytes
-            if self.session and requests:
-                response = self.session.get(url, timeout=self.request_timeout)
-                response.raise_for_status()
-                data = response.content
-            else:
-                with urllib_request.urlopen(url, timeout=self.request_timeout) as response:  # type: ignore[call-arg]
-                    data = response.read()
-
             target_name = filename or Path(parsed.path).name or "download.bin"
             target_path = directory / target_name
-            target_path.write_bytes(data)
+
+            # Stream to disk in 64 KiB chunks so memory stays flat for large files
+            session = self.session
+            if session is not None:
+                with session.get(url, timeout=self.request_timeout, stream=True) as response:
+                    response.raise_for_status()
+                    with open(target_path, "wb") as handle:
+                        for chunk in response.iter_content(chunk_size=_DOWNLOAD_CHUNK_SIZE):
+                            handle.write(chunk)
+            else:
+                with urllib_request.urlopen(url, timeout=self.request_timeout) as response:  # type: ignore[call-arg]
+                    with open(target_path, "wb") as handle:
+                        shutil.copyfileobj(response, handle, _DOWNLOAD_CHUNK_SIZE)
             return target_path
 
         if not scheme:
@@ -356,8 +587,8 @@ class AdvancedBrowserAutomation:
         if not self._started:
             return {"success": False, "error": "Browser not started"}
 
-        if self.session and requests:
-            cookie_dict = requests.utils.dict_from_cookiejar(self.session.cookies)
+        if self._session is not None:
+            cookie_dict = _requests_module().utils.dict_from_cookiejar(self._session.cookies)
         else:
             cookie_dict = {}
         session_data = {
@@ -369,35 +600,45 @@ class AdvancedBrowserAutomation:
         return {"success": True, "cookies_count": len(cookie_dict), "session_data": session_data}
 
     def restore_session(self, session_data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Restore cookies and history without fetching anything.
+
+        The saved page URL is recorded but not re-requested; call
+        ``navigate(result["url"])`` when a fresh copy of the page is needed.
+        """
         if not self._started:
             return {"success": False, "error": "Browser not started"}
 
         if not session_data:
             return {"success": False, "error": "No session data provided"}
 
-        if self.session and requests:
-            jar = requests.utils.cookiejar_from_dict(session_data.get("cookies", {}))
-            self.session.cookies = jar
+        session = self.session
+        if session is not None:
+            jar = _requests_module().utils.cookiejar_from_dict(session_data.get("cookies", {}))
+            session.cookies = jar
         self._history = list(session_data.get("history", []))
 
         url = session_data.get("url")
-        if url:
-            self.navigate(url)
+        if url and (not self._history or self._history[-1] != url):
+            self._history.append(url)
+        self._last_response = None
+        self._extract_cache = (None, None)
 
         return {
             "success": True,
             "restored_cookies": len(session_data.get("cookies", {})),
             "history_length": len(self._history),
+            "url": url,
         }
 
     def clear_cookies(self) -> Dict[str, Any]:
-        if self.session and requests:
-            self.session.cookies.clear()
+        if self._session is not None:
+            self._session.cookies.clear()
         return {"success": True}
 
     def get_cookies(self) -> Dict[str, Any]:
-        if self.session and requests:
-            cookies = requests.utils.dict_from_cookiejar(self.session.cookies)
+        if self._session is not None:
+            cookies = _requests_module().utils.dict_from_cookiejar(self._session.cookies)
         else:
             cookies = {}
         return {"success": True, "cookies": cookies, "cookies_count": len(cookies)}
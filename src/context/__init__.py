@@ -5,5 +5,7 @@ Contains the context and knowledge base management components.
 """
 
 from .context_manager import ContextManager, Message, TaskPlan
+from .prompt_buffer import PromptBuffer
+from .transcript_writer import TranscriptWriter
 
-__all__ = ['ContextManager', 'Message', 'TaskPlan']
+__all__ = ['ContextManager', 'Message', 'TaskPlan', 'PromptBuffer', 'TranscriptWriter']
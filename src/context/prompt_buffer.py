@@ -0,0 +1,107 @@
+"""
+Graive AI - Prompt Buffer
+
+Bounded, prefix-stable conversation buffer for LLM prompts.
+
+Messages are laid out as [Static][Committed][Recent][Dynamic]:
+- Static: the system prompt, never changes within a session
+- Committed: append-only history; its bytes only change when it outgrows
+  ``max_committed`` and the oldest half is dropped, so provider prefix
+  caches keep hitting between those rare trims
+- Recent: the last ``max_recent`` messages in a bounded deque
+- Dynamic: per-call context supplied by the caller, kept last so it never
+  invalidates the cached prefix
+
+Appending a turn is amortized O(1) and the buffer never holds more than
+``max_committed + max_recent`` messages, however long the session runs.
+"""
+
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict, List, Optional
+import json
+import sys
+
+
+@dataclass
+class PromptBuffer:
+    """Conversation history with an immutable committed prefix and a bounded recent window."""
+
+    static_system: str = ""
+    max_recent: int = 40
+    max_committed: int = 400
+    committed: List[Dict[str, str]] = field(default_factory=list)
+    recent: Deque[Dict[str, str]] = field(init=False)
+    _committed_json: Optional[bytes] = field(default=None, init=False, repr=False)
+
+    def __post_init__(self):
+        self.recent = deque(maxlen=self.max_recent)
+
+    def append(self, role: str, content: str) -> None:
+        """
+        Append a message, compacting the recent window first when it is full.
+
+        Args:
+            role: Message role ('user' or 'assistant')
+            content: Message text
+        """
+        if len(self.recent) == self.max_recent:
+            self.compact()
+        # Roles come from a tiny vocabulary; interning makes every copy share one object
+        self.recent.append({"role": sys.intern(role), "content": content})
+
+    def compact(self) -> None:
+        """
+        Move the older half of the recent window into the committed prefix.
+
+        Messages are committed verbatim at the end of the prefix. Past
+        ``max_committed`` the oldest messages are dropped down to half the
+        cap, the only point at which earlier prefix bytes change.
+        """
+        count = len(self.recent) // 2
+        if not count:
+            return
+        self.committed.extend(self.recent.popleft() for _ in range(count))
+        if len(self.committed) > self.max_committed:
+            # Trim to half the cap so the prefix changes once per many compactions
+            del self.committed[:len(self.committed) - self.max_committed // 2]
+        self._committed_json = None
+
+    @property
+    def committed_json(self) -> bytes:
+        """Serialized committed prefix, rebuilt only after the prefix grows."""
+        if self._committed_json is None:
+            self._committed_json = json.dumps(
+                self.committed, ensure_ascii=False, separators=(",", ":")
+            ).encode("utf-8")
+        return self._committed_json
+
+    def build_messages(self, dynamic_context: Optional[str] = None) -> List[Dict[str, str]]:
+        """
+        Build the chat message list in cache-friendly order.
+
+        Args:
+            dynamic_context: Optional per-call context appended after the history
+
+        Returns:
+            Messages ordered [system] + committed + recent + [dynamic]
+        """
+        messages: List[Dict[str, str]] = []
+        if self.static_system:
+            messages.append({"role": "system", "content": self.static_system})
+        messages.extend(self.committed)
+        messages.extend(self.recent)
+        if dynamic_context:
+            messages.append({"role": "system", "content": dynamic_context})
+        return messages
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Summary of buffer state."""
+        return {
+            "committed_messages": len(self.committed),
+            "recent_messages": len(self.recent),
+            "max_recent": self.max_recent
+        }
+
+    def __len__(self) -> int:
+        return len(self.committed) + len(self.recent)
@@ -0,0 +1,82 @@
+"""
+Graive AI - Transcript Writer
+
+Persists conversation turns to a JSONL file without putting disk I/O on the
+interactive hot path. Turns are queued and a single background thread drains
+the queue, coalescing whatever has accumulated into one append, so ordering is
+preserved and a slow disk never delays the next prompt.
+"""
+
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List
+import json
+import queue
+import threading
+
+
+class TranscriptWriter:
+    """Background, batched JSONL writer for conversation turns."""
+
+    _STOP = object()
+
+    def __init__(self, transcript_path: Path, maxsize: int = 256):
+        """
+        Initialize the writer and start its drain thread.
+
+        Args:
+            transcript_path: JSONL file that turns are appended to
+            maxsize: Queue bound; producers block (backpressure) when it is full
+        """
+        self.transcript_path = Path(transcript_path)
+        self.transcript_path.parent.mkdir(parents=True, exist_ok=True)
+        self._queue: "queue.Queue[Any]" = queue.Queue(maxsize=maxsize)
+        self._thread = threading.Thread(target=self._drain, name="graive-transcript", daemon=True)
+        self._thread.start()
+
+    def record(self, user_message: str, assistant_message: str) -> None:
+        """
+        Queue one conversation turn for persistence.
+
+        Args:
+            user_message: What the user said
+            assistant_message: The recorded reply
+        """
+        self._queue.put({
+            "timestamp": datetime.now().isoformat(),
+            "user": user_message,
+            "assistant": assistant_message
+        })
+
+    def close(self, timeout: float = 5.0) -> None:
+        """Flush queued turns and stop the drain thread."""
+        self._queue.put(self._STOP)
+        self._thread.join(timeout)
+
+    def _drain(self) -> None:
+        """Write queued turns, batching everything available into one append."""
+        while True:
+            batch: List[Dict[str, Any]] = []
+            item = self._queue.get()
+            stop = item is self._STOP
+            if not stop:
+                batch.append(item)
+            while not stop:
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is self._STOP:
+                    stop = True
+                else:
+                    batch.append(item)
+
+            if batch:
+                try:
+                    with open(self.transcript_path, "a", encoding="utf-8") as f:
+                        f.write("".join(json.dumps(turn, ensure_ascii=False) + "\n" for turn in batch))
+                except OSError as e:
+                    print(f"⚠️  Transcript write failed: {e}")
+
+            if stop:
+                return
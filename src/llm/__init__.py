@@ -10,6 +10,9 @@ from .openai_provider import OpenAIProvider
 from .deepseek_provider import DeepSeekProvider
 from .gemini_provider import GeminiProvider
 from .provider_factory import LLMProviderFactory
+from .rate_limiter import TokenBucketLimiter
+from .llm_client import LLMClient
+from .response_cache import LLMResponseCache
 
 __all__ = [
     'BaseLLMProvider',
@@ -19,4 +22,7 @@ __all__ = [
     'DeepSeekProvider',
     'GeminiProvider',
     'LLMProviderFactory',
+    'LLMClient',
+    'TokenBucketLimiter',
+    'LLMResponseCache',
 ]
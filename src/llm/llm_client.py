@@ -0,0 +1,352 @@
+"""
+Shared LLM Client
+
+This module provides a single chat-completion entry point used by the Graive
+document pipeline. It owns provider selection (OpenAI first, DeepSeek as the
+fallback), keeps one authenticated client or HTTP session per provider, and
+sizes ``max_tokens`` against the tokenized prompt so requests fit the model's
+context window. An optional ``TokenBucketLimiter`` throttles calls under the
+provider's rate limits and absorbs HTTP 429 responses.
+"""
+
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from src.llm.rate_limiter import TokenBucketLimiter
+
+try:
+    from openai import OpenAI
+except ImportError:
+    OpenAI = None
+
+try:
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+except ImportError:
+    requests = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+try:
+    import tiktoken
+    TIKTOKEN_AVAILABLE = True
+except ImportError:
+    tiktoken = None
+    TIKTOKEN_AVAILABLE = False
+
+
+class LLMClient:
+    """
+    Provider-agnostic chat completion client.
+
+    One instance is created per Graive session so that API keys are read once,
+    the OpenAI client and DeepSeek HTTP session are reused across calls, and
+    cross-cutting behaviour (streaming, token budgeting) lives in one place.
+    """
+
+    DEEPSEEK_URL = "https://api.deepseek.com/chat/completions"
+    DEFAULT_RETRY_AFTER = 5.0
+
+    def __init__(
+        self,
+        openai_key: Optional[str] = None,
+        deepseek_key: Optional[str] = None,
+        openai_model: str = "gpt-3.5-turbo-16k",
+        deepseek_model: str = "deepseek-chat",
+        context_window: int = 16385,
+        timeout: int = 60,
+        rate_limiter: Optional[TokenBucketLimiter] = None,
+        max_retries: int = 3,
+        compress_requests: bool = False
+    ):
+        """
+        Initialize the client.
+
+        Args:
+            openai_key: OpenAI API key (preferred provider)
+            deepseek_key: DeepSeek API key (fallback provider)
+            openai_model: OpenAI chat model identifier
+            deepseek_model: DeepSeek chat model identifier
+            context_window: Model context size in tokens, used to cap max_tokens
+            timeout: HTTP timeout in seconds for DeepSeek requests
+            rate_limiter: Shared limiter gating every call (None disables throttling)
+            max_retries: Attempts per call when the provider answers 429
+            compress_requests: zstd-compress DeepSeek request bodies (needs
+                zstandard; switched off for the session if the server rejects it)
+        """
+        self.openai_key = openai_key
+        self.deepseek_key = deepseek_key
+        self.openai_model = openai_model
+        self.deepseek_model = deepseek_model
+        self.context_window = context_window
+        self.timeout = timeout
+        self.rate_limiter = rate_limiter
+        self.max_retries = max_retries
+        self.compress_requests = compress_requests and zstandard is not None
+
+        self._openai_client = None
+        self._session = None
+        self._encoding = None
+        self._compressor = None
+
+        if openai_key and OpenAI is not None:
+            self.provider = "openai"
+        elif deepseek_key and requests is not None:
+            self.provider = "deepseek"
+        else:
+            self.provider = None
+
+    @property
+    def available(self) -> bool:
+        """Whether any provider is configured."""
+        return self.provider is not None
+
+    @property
+    def model(self) -> Optional[str]:
+        """Model identifier of the active provider."""
+        if self.provider == "openai":
+            return self.openai_model
+        if self.provider == "deepseek":
+            return self.deepseek_model
+        return None
+
+    @property
+    def openai_client(self) -> Any:
+        """Lazily created OpenAI client, or None when OpenAI is unavailable."""
+        if self._openai_client is None and self.openai_key and OpenAI is not None:
+            self._openai_client = OpenAI(api_key=self.openai_key)
+        return self._openai_client
+
+    def count_tokens(self, text: str) -> int:
+        """
+        Count tokens in text.
+
+        Uses tiktoken when installed; otherwise falls back to the common
+        four-characters-per-token approximation.
+        """
+        if TIKTOKEN_AVAILABLE:
+            if self._encoding is None:
+                try:
+                    self._encoding = tiktoken.encoding_for_model(self.openai_model)
+                except KeyError:
+                    self._encoding = tiktoken.get_encoding("cl100k_base")
+            return len(self._encoding.encode(text))
+        return len(text) // 4 + 1
+
+    def _prompt_tokens(self, messages: List[Dict[str, str]]) -> int:
+        """Token count of a chat prompt."""
+        # ~4 tokens of framing per message plus the reply primer
+        return sum(self.count_tokens(m["content"]) + 4 for m in messages) + 3
+
+    def complete(
+        self,
+        messages: List[Dict[str, str]],
+        max_tokens: int,
+        temperature: float = 0.7,
+        stream: bool = False,
+        on_chunk: Optional[Callable[[str], None]] = None
+    ) -> Optional[str]:
+        """
+        Run a chat completion against the configured provider.
+
+        Args:
+            messages: Chat messages in OpenAI format
+            max_tokens: Maximum tokens to generate
+            temperature: Sampling temperature
+            stream: Stream the completion, forwarding fragments to on_chunk
+            on_chunk: Callback receiving each streamed fragment
+
+        Returns:
+            Generated text, or None when no provider is configured
+
+        Raises:
+            RuntimeError: If the provider returns an error response
+        """
+        if self.provider is None:
+            return None
+
+        # Cap the completion so prompt plus reply fits the context window
+        prompt_tokens = self._prompt_tokens(messages)
+        max_tokens = max(1, min(max_tokens, self.context_window - prompt_tokens))
+
+        for attempt in range(1, self.max_retries + 1):
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire(prompt_tokens + max_tokens)
+
+            retry_after = self._send(messages, max_tokens, temperature, stream, on_chunk)
+            if not isinstance(retry_after, float):
+                return retry_after
+
+            # 429: hold the shared bucket closed so every worker backs off together
+            if self.rate_limiter is not None:
+                self.rate_limiter.block(retry_after)
+            if attempt == self.max_retries:
+                break
+            if self.rate_limiter is None:
+                time.sleep(retry_after)
+
+        raise RuntimeError(f"{self.provider} rate limit exceeded after {self.max_retries} attempts")
+
+    def _send(
+        self,
+        messages: List[Dict[str, str]],
+        max_tokens: int,
+        temperature: float,
+        stream: bool,
+        on_chunk: Optional[Callable[[str], None]]
+    ) -> Any:
+        """
+        Issue one request to the configured provider.
+
+        Returns:
+            Generated text, or the Retry-After delay in seconds (float) on HTTP 429
+        """
+        if self.provider == "openai":
+            try:
+                response = self.openai_client.chat.completions.create(
+                    model=self.openai_model,
+                    messages=messages,
+                    max_tokens=max_tokens,
+                    temperature=temperature,
+                    stream=stream
+                )
+            except Exception as e:
+                if getattr(e, "status_code", None) == 429:
+                    headers = getattr(getattr(e, "response", None), "headers", None) or {}
+                    return self._retry_after(headers)
+                raise
+            if stream:
+                return self._collect_stream(
+                    (chunk.choices[0].delta.content for chunk in response if chunk.choices),
+                    on_chunk
+                )
+            return response.choices[0].message.content or ""
+
+        if self._session is None:
+            self._session = self._create_session()
+
+        body = self._encode_json({
+            "model": self.deepseek_model,
+            "messages": messages,
+            "max_tokens": max_tokens,
+            "temperature": temperature,
+            "stream": stream
+        })
+
+        response = None
+        if self.compress_requests:
+            if self._compressor is None:
+                self._compressor = zstandard.ZstdCompressor(level=3)
+            response = self._session.post(
+                self.DEEPSEEK_URL,
+                data=self._compressor.compress(body),
+                headers={"Content-Encoding": "zstd"},
+                timeout=self.timeout,
+                stream=stream
+            )
+            if response.status_code in (400, 415) or response.status_code >= 500:
+                # Server does not accept compressed bodies; stop trying this session.
+                # Release the pooled connection before re-posting uncompressed.
+                response.close()
+                self.compress_requests = False
+                response = None
+
+        if response is None:
+            response = self._session.post(
+                self.DEEPSEEK_URL,
+                data=body,
+                timeout=self.timeout,
+                stream=stream
+            )
+        with response:
+            if response.status_code == 429:
+                return self._retry_after(response.headers)
+            if response.status_code != 200:
+                raise RuntimeError(f"DeepSeek API error: {response.status_code}")
+            if stream:
+                return self._collect_stream(self._iter_sse_content(response), on_chunk)
+            return response.json()["choices"][0]["message"]["content"]
+
+    def _create_session(self) -> Any:
+        """Build the pooled DeepSeek HTTP session, reused for every request."""
+        session = requests.Session()
+        # 429 is left to complete(), which coordinates back-off through the limiter
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=8,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.5,
+                status_forcelist=[502, 503],
+                allowed_methods=None,
+                raise_on_status=False
+            )
+        )
+        session.mount("https://", adapter)
+        session.headers.update({
+            "Authorization": f"Bearer {self.deepseek_key}",
+            "Content-Type": "application/json"
+        })
+        return session
+
+    @staticmethod
+    def _encode_json(payload: Dict[str, Any]) -> bytes:
+        """Serialize a request payload once, using orjson when installed."""
+        if orjson is not None:
+            return orjson.dumps(payload)
+        return json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+    @classmethod
+    def _retry_after(cls, headers: Any) -> float:
+        """Parse a Retry-After header (seconds), falling back to a default delay."""
+        try:
+            return max(0.0, float(headers.get("Retry-After") or headers.get("retry-after")))
+        except (TypeError, ValueError):
+            return cls.DEFAULT_RETRY_AFTER
+
+    @staticmethod
+    def _collect_stream(
+        pieces: Iterable[Optional[str]],
+        on_chunk: Optional[Callable[[str], None]] = None
+    ) -> str:
+        """Accumulate streamed completion fragments, forwarding each to ``on_chunk``."""
+        parts: List[str] = []
+        for piece in pieces:
+            if not piece:
+                continue
+            parts.append(piece)
+            if on_chunk:
+                on_chunk(piece)
+        return "".join(parts)
+
+    @staticmethod
+    def _iter_sse_content(response: Any) -> Iterator[str]:
+        """Yield content deltas from an OpenAI-compatible server-sent event stream."""
+        for line in response.iter_lines(decode_unicode=True):
+            if not line or not line.startswith("data:"):
+                continue
+            data = line[len("data:"):].strip()
+            if data == "[DONE]":
+                break
+            try:
+                event = json.loads(data)
+            except json.JSONDecodeError:
+                continue
+            for choice in event.get("choices", []):
+                delta = choice.get("delta") or {}
+                if delta.get("content"):
+                    yield delta["content"]
@@ -0,0 +1,98 @@
+"""
+LLM Rate Limiter
+
+Token-bucket throttling for chat completion calls. Requests-per-minute and
+tokens-per-minute budgets refill continuously; callers block until both have
+room. When a provider answers with HTTP 429 the whole bucket can be paused for
+the server-advertised ``Retry-After`` period so every worker thread backs off
+together instead of each one retrying into the limit.
+"""
+
+from typing import Optional
+import threading
+import time
+
+
+class TokenBucketLimiter:
+    """
+    Thread-safe requests/tokens per minute limiter.
+
+    All waiting threads share one ``threading.Condition`` so a refill or a
+    lifted 429 block wakes them in a coordinated way.
+    """
+
+    def __init__(self, rpm: int = 3000, tpm: int = 90000):
+        """
+        Initialize limiter.
+
+        Args:
+            rpm: Maximum requests per minute
+            tpm: Maximum tokens (prompt + completion) per minute
+        """
+        self.rpm = rpm
+        self.tpm = tpm
+        self._requests = float(rpm)
+        self._tokens = float(tpm)
+        self._last_refill = time.monotonic()
+        self._blocked_until = 0.0
+        self._condition = threading.Condition()
+
+    def _refill(self, now: float) -> None:
+        """Top up both buckets for the time elapsed since the last refill."""
+        elapsed = now - self._last_refill
+        self._last_refill = now
+        self._requests = min(self.rpm, self._requests + elapsed * self.rpm / 60.0)
+        self._tokens = min(self.tpm, self._tokens + elapsed * self.tpm / 60.0)
+
+    def acquire(self, estimated_tokens: int, timeout: Optional[float] = None) -> bool:
+        """
+        Block until one request and ``estimated_tokens`` tokens are available.
+
+        Args:
+            estimated_tokens: Expected prompt + completion tokens for the call
+            timeout: Maximum seconds to wait (None waits indefinitely)
+
+        Returns:
+            True if capacity was acquired, False on timeout
+        """
+        # A single call larger than the whole budget would never fit
+        needed = min(float(estimated_tokens), float(self.tpm))
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        with self._condition:
+            while True:
+                now = time.monotonic()
+                self._refill(now)
+
+                if now >= self._blocked_until and self._requests >= 1 and self._tokens >= needed:
+                    self._requests -= 1
+                    self._tokens -= needed
+                    return True
+
+                if now < self._blocked_until:
+                    wait = self._blocked_until - now
+                else:
+                    wait = max(
+                        (1 - self._requests) * 60.0 / self.rpm,
+                        (needed - self._tokens) * 60.0 / self.tpm,
+                        0.001
+                    )
+
+                if deadline is not None:
+                    remaining = deadline - now
+                    if remaining <= 0:
+                        return False
+                    wait = min(wait, remaining)
+
+                self._condition.wait(wait)
+
+    def block(self, seconds: float) -> None:
+        """
+        Pause all callers for ``seconds`` (e.g. from a 429 Retry-After header).
+
+        Args:
+            seconds: Time to hold the bucket closed
+        """
+        with self._condition:
+            self._blocked_until = max(self._blocked_until, time.monotonic() + seconds)
+            self._condition.notify_all()
@@ -0,0 +1,101 @@
+"""
+LLM Response Cache
+
+Exact-match cache for chat completions: SHA-256 of (model, max_tokens, prompt)
+looked up in an on-disk SQLite table.
+
+There is deliberately no semantic (embedding-similarity) tier. Generation
+prompts that differ only in their subject - the same section template for a
+different country, say - embed as near-duplicates, so reusing a "similar"
+prompt's response would silently return text about the wrong topic.
+"""
+
+from pathlib import Path
+from typing import Optional
+import hashlib
+import sqlite3
+import threading
+
+
+class LLMResponseCache:
+    """
+    Persistent exact-match cache of LLM responses.
+
+    Safe to share between threads; all SQLite access is serialised through
+    one lock.
+    """
+
+    def __init__(self, cache_path: Path):
+        """
+        Initialize cache.
+
+        Args:
+            cache_path: SQLite file holding cached responses
+        """
+        self.cache_path = Path(cache_path)
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.cache_path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                model TEXT NOT NULL,
+                max_tokens INTEGER NOT NULL,
+                response TEXT NOT NULL
+            )
+            """
+        )
+        self._conn.commit()
+
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _key(prompt: str, model: str, max_tokens: int) -> str:
+        """Exact-match cache key."""
+        return hashlib.sha256(f"{model}\x00{max_tokens}\x00{prompt}".encode("utf-8")).hexdigest()
+
+    def get(self, prompt: str, model: str, max_tokens: int) -> Optional[str]:
+        """
+        Look up a cached response.
+
+        Args:
+            prompt: Prompt text
+            model: Model identifier the response was generated with
+            max_tokens: Completion budget the response was generated with
+
+        Returns:
+            Cached response, or None on a miss
+        """
+        key = self._key(prompt, model, max_tokens)
+        with self._lock:
+            row = self._conn.execute("SELECT response FROM responses WHERE key = ?", (key,)).fetchone()
+            if row:
+                self.hits += 1
+                return row[0]
+            self.misses += 1
+            return None
+
+    def put(self, prompt: str, model: str, max_tokens: int, response: str) -> None:
+        """
+        Store a response.
+
+        Args:
+            prompt: Prompt text
+            model: Model identifier
+            max_tokens: Completion budget
+            response: Generated response to cache
+        """
+        if not response:
+            return
+
+        key = self._key(prompt, model, max_tokens)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, model, max_tokens, response) VALUES (?, ?, ?, ?)",
+                (key, model, max_tokens, response)
+            )
+            self._conn.commit()
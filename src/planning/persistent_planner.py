@@ -12,11 +12,13 @@ This is the CORRECT architecture for autonomous document generation:
 5. Enable interruption and redirection
 """
 
+import hashlib
 import json
 import os
 import re
+import threading
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime
 
 
@@ -51,11 +53,17 @@ class PersistentPlanner:
         self.plan_version = 0
         self.module_versions = {}
         self.draft_version = 0
+        self._last_draft_hash: Optional[str] = None
+        self._last_draft_file: Optional[Path] = None
         
         # Progress state
         self.current_module = 0
         self.total_modules = 0
         self.generation_status = "initialized"
+        
+        # Deferred module updates while a batch is open (see begin_batch)
+        self._batch_updates: Optional[List[Tuple[int, str, Optional[str], Optional[float]]]] = None
+        self._batch_lock = threading.Lock()
     
     def create_initial_plan(
         self,
@@ -349,12 +357,59 @@ Type `cancel` in the chat
         """
         Update module status with progress tracking.
         
+        Inside a begin_batch()/commit_batch() block the update is queued in
+        memory and written out when the batch is committed.
+        
         Args:
             module_order: Module number (1-indexed)
             status: Status (planning/generating/review/complete)
             content: Generated content (if available)
             quality_score: Quality assessment score
         """
+        with self._batch_lock:
+            if self._batch_updates is not None:
+                self._batch_updates.append((module_order, status, content, quality_score))
+                return
+        
+        self._write_module_updates(module_order, [(status, content, quality_score)])
+        
+        # Update progress tracking
+        self._update_progress_file(module_order, status)
+    
+    def begin_batch(self):
+        """Start deferring update_module_status() writes until commit_batch()."""
+        with self._batch_lock:
+            if self._batch_updates is None:
+                self._batch_updates = []
+    
+    def commit_batch(self):
+        """
+        Write all queued module updates.
+        
+        Each module file is read and written once regardless of how many
+        updates it received, and the progress file is written once.
+        """
+        with self._batch_lock:
+            updates, self._batch_updates = self._batch_updates, None
+        if not updates:
+            return
+        
+        by_module: Dict[int, List[Tuple[str, Optional[str], Optional[float]]]] = {}
+        for module_order, status, content, quality_score in updates:
+            by_module.setdefault(module_order, []).append((status, content, quality_score))
+        
+        for module_order, module_updates in by_module.items():
+            self._write_module_updates(module_order, module_updates)
+        
+        last_module, last_status = updates[-1][0], updates[-1][1]
+        self._update_progress_file(last_module, last_status)
+    
+    def _write_module_updates(
+        self,
+        module_order: int,
+        updates: List[Tuple[str, Optional[str], Optional[float]]]
+    ):
+        """Apply one or more (status, content, quality_score) updates to a module file."""
         # Find module file
         module_files = list(self.modules_dir.glob(f"module_{module_order}_*.md"))
         if not module_files:
@@ -376,40 +431,38 @@ Type `cancel` in the chat
         }
         
         lines = current_content.split('\n')
-        for i, line in enumerate(lines):
-            if line.startswith('- ['):
-                status_index = (i - lines.index('## Status') - 1)
-                if status_index <= status_map.get(status, 0):
-                    lines[i] = line.replace('[ ]', '[✓]')
-        
-        # Update content if provided
-        if content:
-            content_index = lines.index('## Content')
-            lines[content_index + 2] = content
-            
-            # Update word count
-            word_count = len(content.split())
-            for i, line in enumerate(lines):
-                if line.startswith('- **Current Words**:'):
-                    lines[i] = f"- **Current Words**: {word_count:,}"
-        
-        # Update quality score if provided
-        if quality_score is not None:
+        for status, content, quality_score in updates:
             for i, line in enumerate(lines):
-                if line.startswith('- **Quality Score**:'):
-                    lines[i] = f"- **Quality Score**: {quality_score:.2f}/10"
-        
-        # Add version entry
-        version_index = lines.index('## Version History')
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        lines.insert(version_index + 1, f"- v{self.module_versions.get(module_file.stem, 1) + 1}: {status.capitalize()} ({timestamp})")
+                if line.startswith('- ['):
+                    status_index = (i - lines.index('## Status') - 1)
+                    if status_index <= status_map.get(status, 0):
+                        lines[i] = line.replace('[ ]', '[✓]')
+            
+            # Update content if provided
+            if content:
+                content_index = lines.index('## Content')
+                lines[content_index + 2] = content
+                
+                # Update word count
+                word_count = len(content.split())
+                for i, line in enumerate(lines):
+                    if line.startswith('- **Current Words**:'):
+                        lines[i] = f"- **Current Words**: {word_count:,}"
+            
+            # Update quality score if provided
+            if quality_score is not None:
+                for i, line in enumerate(lines):
+                    if line.startswith('- **Quality Score**:'):
+                        lines[i] = f"- **Quality Score**: {quality_score:.2f}/10"
+            
+            # Add version entry
+            version_index = lines.index('## Version History')
+            timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            lines.insert(version_index + 1, f"- v{self.module_versions.get(module_file.stem, 1) + 1}: {status.capitalize()} ({timestamp})")
         
         # Write back
         with open(module_file, 'w', encoding='utf-8') as f:
             f.write('\n'.join(lines))
-        
-        # Update progress tracking
-        self._update_progress_file(module_order, status)
     
     def _update_progress_file(self, module_order: int, status: str):
         """Update the progress tracking file for real-time visibility."""
@@ -459,6 +512,9 @@ Type `cancel` in the chat
         """
         Save assembly draft with version tracking.
         
+        Drafts identical to the previously saved one are not rewritten; the
+        existing draft path is returned instead.
+        
         Args:
             content: Assembled document content
             draft_type: Type of draft (combined/revised/final)
@@ -466,12 +522,20 @@ Type `cancel` in the chat
         Returns:
             Path to saved draft file
         """
+        content_hash = hashlib.sha1(content.encode('utf-8')).hexdigest()
+        if content_hash == self._last_draft_hash and self._last_draft_file is not None:
+            print(f"\n✅ DRAFT UNCHANGED ({draft_type}) - keeping {self._last_draft_file.name}\n")
+            return str(self._last_draft_file)
+        
         self.draft_version += 1
         draft_file = self.assembly_dir / f"draft_{self.draft_version}_{draft_type}.md"
         
         with open(draft_file, 'w', encoding='utf-8') as f:
             f.write(content)
         
+        self._last_draft_hash = content_hash
+        self._last_draft_file = draft_file
+        
         file_size = os.path.getsize(draft_file)
         word_count = len(content.split())
         
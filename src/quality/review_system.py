@@ -178,20 +178,31 @@ class PhDReviewSystem:
         content: str,
         review_report: Dict[str, Any],
         topic: str,
-        max_iterations: int = 3
+        max_iterations: int = 3,
+        convergence_threshold: float = 0.2,
+        skip_above: float = 8.5
     ) -> str:
         """
         Iteratively revise content to meet PhD standards.
         
+        Stops early once an iteration improves the score by less than
+        ``convergence_threshold``, since further passes rarely pay off.
+        
         Args:
             content: Original content
             review_report: Review report from review_content()
             topic: Document topic
             max_iterations: Maximum revision iterations
+            convergence_threshold: Minimum per-iteration score gain to keep revising
+            skip_above: Scores above this are returned unrevised
         
         Returns:
             Revised content meeting quality standards
         """
+        if review_report['average_score'] > skip_above:
+            print(f"\n✅ Score {review_report['average_score']:.2f}/10 already above {skip_above} - skipping revision")
+            return content
+        
         print(f"\n{'='*70}")
         print(f"🔄 ITERATIVE REVISION PROCESS")
         print(f"{'='*70}")
@@ -247,12 +258,33 @@ class PhDReviewSystem:
             if current_score >= self.min_threshold:
                 print(f"\n✅ Quality threshold met after {iteration} iteration(s)")
                 break
+            
+            if improvement < convergence_threshold:
+                print(f"\n⏹️  Score plateaued after {iteration} iteration(s) - stopping revision")
+                break
         
-        if current_score < self.min_threshold:
+        if current_score < self.min_threshold and iteration >= max_iterations:
             print(f"\n⚠️  Maximum iterations reached. Final score: {current_score:.2f}/10")
         
         return current_content
     
+    def apply_review(self, content: str, review_report: Dict[str, Any], topic: str) -> str:
+        """
+        Apply a single revision pass driven by an existing review report.
+        
+        Unlike revise_content(), the result is not re-reviewed; use this when
+        the report covers a larger document that the content is part of.
+        
+        Args:
+            content: Content to revise
+            review_report: Review report from review_content()
+            topic: Document topic
+        
+        Returns:
+            Revised content
+        """
+        return self._apply_revisions(content, review_report['revision_priority'], topic, 1)
+    
     def _assess_clarity(self, content: str) -> ReviewScore:
         """Assess writing clarity and readability."""
         # Simple heuristics (in production, use NLP analysis)
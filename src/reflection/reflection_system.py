@@ -578,7 +578,8 @@ class ReflectionSystem:
     def _generate_activity_id(self, agent_name: str, activity_type: ActivityType) -> str:
         """Generate unique activity ID."""
         timestamp = datetime.now().isoformat()
-        content = f"{agent_name}:{activity_type.value}:{timestamp}"
+        # Thread id keeps ids unique when one agent runs activities concurrently
+        content = f"{agent_name}:{activity_type.value}:{timestamp}:{threading.get_ident()}"
         return hashlib.md5(content.encode()).hexdigest()[:12]
     
     def generate_reflection_report(self) -> ReflectionReport:
@@ -10,8 +10,11 @@ entire lifecycle, supporting long-running projects like document generation,
 data analysis, and application development.
 """
 
-from typing import Dict, List, Any, Optional, Union
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, List, Any, Optional, Tuple, Union
 from pathlib import Path
+import functools
+import itertools
 import os
 import json
 import sqlite3
@@ -70,6 +73,10 @@ class SandboxStorageManager:
         self.media_cache_path = self.sandbox_root / "media"
         self.vector_store_path = self.sandbox_root / "vectors"
         
+        # Background writer for write_file_async; threads start on first submit.
+        # Created here, not lazily, because callers submit from several threads.
+        self._write_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="sandbox-writer")
+        
         # Initialize directory structure
         self._initialize_directories()
         
@@ -174,6 +181,28 @@ class SandboxStorageManager:
                 "file_path": str(file_path)
             }
     
+    def write_file_async(
+        self,
+        file_path: str,
+        content: Union[str, bytes],
+        encoding: str = 'utf-8'
+    ) -> Future:
+        """
+        Queue a file write on the background writer pool.
+        
+        Independent writes proceed concurrently, so a batch of files costs
+        roughly the slowest write rather than the sum of all of them.
+        
+        Args:
+            file_path: Relative path within sandbox
+            content: File content (string or bytes)
+            encoding: Encoding for text files
+        
+        Returns:
+            Future resolving to the write_file() result dictionary
+        """
+        return self._write_pool.submit(self.write_file, file_path, content, encoding)
+    
     def read_file(
         self,
         file_path: str,
@@ -424,6 +453,39 @@ class SandboxStorageManager:
         
         return self.database_manager.execute_query(db_name, query, params)
     
+    def execute_many(
+        self,
+        db_name: str,
+        query: str,
+        param_list: List[tuple],
+        chunk_size: int = 500
+    ) -> Dict[str, Any]:
+        """Execute SQL statement for many parameter rows in one transaction."""
+        if not self.database_manager:
+            return {
+                "success": False,
+                "error": "Database support not enabled"
+            }
+        
+        return self.database_manager.execute_many(db_name, query, param_list, chunk_size)
+    
+    def insert_many(
+        self,
+        db_name: str,
+        table: str,
+        columns: Tuple[str, ...],
+        rows: List[tuple],
+        max_params: int = 480
+    ) -> Dict[str, Any]:
+        """Insert many rows using multi-row INSERT statements in one transaction."""
+        if not self.database_manager:
+            return {
+                "success": False,
+                "error": "Database support not enabled"
+            }
+        
+        return self.database_manager.insert_many(db_name, table, columns, rows, max_params)
+    
     def get_database_connection(self, db_name: str) -> Optional[Any]:
         """Get database connection object."""
         if not self.database_manager:
@@ -730,6 +792,16 @@ class DatabaseScaffold:
     Supports SQLite (default), PostgreSQL, and MySQL databases within sandbox.
     """
     
+    # Applied once when a SQLite connection is opened: WAL lets readers run
+    # alongside the writer and NORMAL sync drops the fsync on every commit.
+    SQLITE_PRAGMAS = (
+        "PRAGMA journal_mode=WAL",
+        "PRAGMA synchronous=NORMAL",
+        "PRAGMA busy_timeout=5000",
+        "PRAGMA temp_store=MEMORY",
+        "PRAGMA cache_size=-20000",
+    )
+    
     def __init__(self, database_path: Path):
         """Initialize database scaffold."""
         self.database_path = database_path
@@ -752,8 +824,18 @@ class DatabaseScaffold:
         
         db_file = self.database_path / f"{db_name}.db"
         
+        if db_name in self.connections:
+            return {
+                "success": True,
+                "db_name": db_name,
+                "db_path": str(db_file),
+                "db_type": db_type
+            }
+        
         try:
             conn = sqlite3.connect(str(db_file))
+            for pragma in self.SQLITE_PRAGMAS:
+                conn.execute(pragma)
             self.connections[db_name] = conn
             
             self.metadata[db_name] = {
@@ -822,6 +904,116 @@ class DatabaseScaffold:
                 "error": str(e)
             }
     
+    def execute_many(
+        self,
+        db_name: str,
+        query: str,
+        param_list: List[tuple],
+        chunk_size: int = 500
+    ) -> Dict[str, Any]:
+        """
+        Execute a statement for many rows inside a single transaction.
+        
+        Rows are fed to executemany() in chunks of ``chunk_size`` so very large
+        inserts stay bounded in memory, but the whole batch commits once.
+        """
+        if db_name not in self.connections:
+            return {
+                "success": False,
+                "error": f"Database {db_name} not found"
+            }
+        
+        conn = self.connections[db_name]
+        try:
+            if conn.in_transaction:
+                conn.commit()
+            conn.execute("BEGIN IMMEDIATE")
+            cursor = conn.cursor()
+            rows_affected = 0
+            for start in range(0, len(param_list), chunk_size):
+                cursor.executemany(query, param_list[start:start + chunk_size])
+                rows_affected += cursor.rowcount
+            conn.commit()
+            
+            return {
+                "success": True,
+                "rows_affected": rows_affected
+            }
+        
+        except Exception as e:
+            conn.rollback()
+            return {
+                "success": False,
+                "error": str(e)
+            }
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=64)
+    def _multi_row_insert_sql(table: str, columns: Tuple[str, ...], row_count: int) -> str:
+        """Build (and cache) an INSERT with ``row_count`` placeholder groups."""
+        group = "(" + ",".join("?" * len(columns)) + ")"
+        return f"INSERT INTO {table} ({', '.join(columns)}) VALUES {','.join([group] * row_count)}"
+    
+    def insert_many(
+        self,
+        db_name: str,
+        table: str,
+        columns: Tuple[str, ...],
+        rows: List[tuple],
+        max_params: int = 480
+    ) -> Dict[str, Any]:
+        """
+        Insert rows with multi-row ``INSERT ... VALUES (...),(...)`` statements.
+        
+        Rows are grouped so each statement binds at most ``max_params``
+        parameters (below SQLite's historical 999 limit). Statement text is
+        cached per chunk length, so a large insert reuses at most two SQL
+        strings, and the whole batch commits once.
+        
+        Args:
+            db_name: Database name
+            table: Target table
+            columns: Column names, matching the order of each row tuple
+            rows: Row tuples to insert
+            max_params: Maximum bound parameters per statement
+        
+        Returns:
+            Result dict with rows_affected
+        """
+        if db_name not in self.connections:
+            return {
+                "success": False,
+                "error": f"Database {db_name} not found"
+            }
+        
+        columns = tuple(columns)
+        chunk_rows = max(1, max_params // len(columns))
+        conn = self.connections[db_name]
+        try:
+            if conn.in_transaction:
+                conn.commit()
+            conn.execute("BEGIN IMMEDIATE")
+            cursor = conn.cursor()
+            for start in range(0, len(rows), chunk_rows):
+                chunk = rows[start:start + chunk_rows]
+                cursor.execute(
+                    self._multi_row_insert_sql(table, columns, len(chunk)),
+                    list(itertools.chain.from_iterable(chunk))
+                )
+            conn.commit()
+            
+            return {
+                "success": True,
+                "rows_affected": len(rows)
+            }
+        
+        except Exception as e:
+            conn.rollback()
+            return {
+                "success": False,
+                "error": str(e)
+            }
+    
     def get_connection(self, db_name: str) -> Optional[Any]:
         """Get database connection."""
         return self.connections.get(db_name)
@@ -6,7 +6,10 @@ a Graive sandbox: file system, context/knowledge base, databases, media cache,
 and vector embeddings.
 """
 
+from concurrent.futures import Future
 from typing import Dict, List, Any, Optional, Union
+import threading
+
 from src.storage.sandbox_storage import SandboxStorageManager, StorageLayer
 
 
@@ -28,12 +31,18 @@ class StorageTool:
         self.storage = sandbox_manager
         self.name = "storage_tool"
         self.description = "Multi-layered persistent storage for files, data, context, and media"
+        
+        # write_file_async results, collected by the flush_writes action
+        self._pending_writes: List[Future] = []
+        self._pending_lock = threading.Lock()
     
     def get_available_actions(self) -> List[str]:
         """Get list of available storage actions."""
         return [
             # File system
             "write_file",
+            "write_file_async",
+            "flush_writes",
             "read_file",
             "append_file",
             "list_files",
@@ -48,6 +57,8 @@ class StorageTool:
             # Database
             "create_database",
             "execute_query",
+            "execute_many",
+            "insert_many",
             "get_tables",
             
             # Media cache
@@ -84,6 +95,25 @@ class StorageTool:
                 encoding=params.get("encoding", "utf-8")
             )
         
+        elif action == "write_file_async":
+            future = self.storage.write_file_async(
+                file_path=params["file_path"],
+                content=params["content"],
+                encoding=params.get("encoding", "utf-8")
+            )
+            with self._pending_lock:
+                self._pending_writes.append(future)
+            return {"success": True, "file_path": params["file_path"], "queued": True}
+        
+        elif action == "flush_writes":
+            with self._pending_lock:
+                pending, self._pending_writes = self._pending_writes, []
+            results = [future.result() for future in pending]
+            return {
+                "success": all(result.get("success") for result in results),
+                "results": results
+            }
+        
         elif action == "read_file":
             return self.storage.read_file(
                 file_path=params["file_path"],
@@ -153,6 +183,23 @@ class StorageTool:
                 params=params.get("query_params")
             )
         
+        elif action == "execute_many":
+            return self.storage.execute_many(
+                db_name=params["db_name"],
+                query=params["query"],
+                param_list=params["param_list"],
+                chunk_size=params.get("chunk_size", 500)
+            )
+        
+        elif action == "insert_many":
+            return self.storage.insert_many(
+                db_name=params["db_name"],
+                table=params["table"],
+                columns=tuple(params["columns"]),
+                rows=params["rows"],
+                max_params=params.get("max_params", 480)
+            )
+        
         elif action == "get_tables":
             return self.storage.execute_query(
                 db_name=params["db_name"],
@@ -4,7 +4,7 @@ from pathlib import Path
 
 import pytest
 
-from src.browser_automation import AdvancedBrowserAutomation, ADVANCED_BROWSER_AVAILABLE
+from src.browser_automation import AdvancedBrowserAutomation, ADVANCED_BROWSER_AVAILABLE, create_browser_tool
 
 
 @pytest.mark.skipif(ADVANCED_BROWSER_AVAILABLE, reason="Fallback is only exercised when Selenium is unavailable")
@@ -27,3 +27,68 @@ def test_fallback_navigates_local_file(tmp_path: Path) -> None:
     assert text_result["links_count"] == 0
 
     browser.close()
+
+
+@pytest.mark.skipif(ADVANCED_BROWSER_AVAILABLE, reason="Fallback is only exercised when Selenium is unavailable")
+def test_fallback_navigate_many_preserves_order(tmp_path: Path) -> None:
+    browser = AdvancedBrowserAutomation(headless=True)
+    browser.start_browser()
+
+    urls = []
+    for index in range(3):
+        page = tmp_path / f"page_{index}.html"
+        page.write_text(f"<html><body><p>{'x' * index}</p></body></html>", encoding="utf-8")
+        urls.append(page.resolve().as_uri())
+    urls.append((tmp_path / "missing.html").resolve().as_uri())
+
+    result = browser.navigate_many(urls)
+    assert result["success"] is True
+    assert [item["success"] for item in result["results"]] == [True, True, True, False]
+    assert [item["url"] for item in result["results"][:3]] == urls[:3]
+
+    browser.close()
+
+
+@pytest.mark.skipif(ADVANCED_BROWSER_AVAILABLE, reason="Fallback is only exercised when Selenium is unavailable")
+def test_tool_download_many_copies_local_files(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("HOME", str(tmp_path / "home"))
+    tool = create_browser_tool(headless=True)
+    tool.execute("start_browser")
+
+    sources = []
+    for index in range(3):
+        source = tmp_path / f"file_{index}.txt"
+        source.write_text(str(index), encoding="utf-8")
+        sources.append(source)
+
+    result = tool.execute(
+        "download_many",
+        items=[{"url": source.resolve().as_uri(), "folder": "batch"} for source in sources],
+    )
+    assert result["success"] is True
+    assert [Path(item["file_path"]).read_text(encoding="utf-8") for item in result["results"]] == ["0", "1", "2"]
+
+    tool.execute("close_browser")
+
+
+@pytest.mark.skipif(ADVANCED_BROWSER_AVAILABLE, reason="Fallback is only exercised when Selenium is unavailable")
+def test_fallback_storage_writes_flush_on_close(tmp_path: Path) -> None:
+    class RecordingStorage:
+        def __init__(self) -> None:
+            self.files = {}
+
+        def write_file(self, file_path: str, content: str) -> None:
+            self.files[file_path] = content
+
+    storage = RecordingStorage()
+    browser = AdvancedBrowserAutomation(headless=True, storage_manager=storage)
+    browser.start_browser()
+
+    html_file = tmp_path / "capture.html"
+    html_file.write_text("<html><body><p>Saved</p></body></html>", encoding="utf-8")
+    browser.navigate(html_file.resolve().as_uri())
+    browser.extract_all_text()
+    browser.close()
+
+    assert "Saved" in storage.files["page_capture_0001.html"]
+    assert storage.files["extracted_text_0001.txt"] == "Saved"
@@ -8,7 +8,7 @@ import os
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from src.context import ContextManager, Message, TaskPlan
+from src.context import ContextManager, Message, TaskPlan, PromptBuffer, TranscriptWriter
 
 
 class TestContextManager:
@@ -59,5 +59,68 @@ class TestContextManager:
         assert intent == "Do something"
 
 
+
+class TestPromptBuffer:
+    """Test suite for the PromptBuffer class."""
+    
+    def test_recent_window_is_bounded(self):
+        """Test that compaction keeps the recent window within max_recent."""
+        buffer = PromptBuffer(static_system="system", max_recent=4)
+        for i in range(10):
+            buffer.append("user", str(i))
+        assert len(buffer.recent) <= 4
+        assert len(buffer) == 10
+        assert [m["content"] for m in buffer.build_messages()][1:] == [str(i) for i in range(10)]
+    
+    def test_committed_prefix_is_stable(self):
+        """Test that compaction only appends to the committed prefix."""
+        buffer = PromptBuffer(max_recent=2)
+        for i in range(3):
+            buffer.append("user", str(i))
+        prefix = buffer.committed_json
+        for i in range(3, 5):
+            buffer.append("user", str(i))
+        assert buffer.committed_json.startswith(prefix[:-1])
+    
+    def test_committed_prefix_is_bounded(self):
+        """Test that the committed prefix is trimmed once it outgrows its cap."""
+        buffer = PromptBuffer(max_recent=4, max_committed=10)
+        for i in range(100):
+            buffer.append("user", str(i))
+        assert len(buffer.committed) <= 10
+        assert [m["content"] for m in buffer.build_messages()][-1] == "99"
+    
+    def test_dynamic_context_goes_last(self):
+        """Test message ordering with per-call context."""
+        buffer = PromptBuffer(static_system="system")
+        buffer.append("user", "hi")
+        messages = buffer.build_messages("context")
+        assert messages[0]["content"] == "system"
+        assert messages[-1] == {"role": "system", "content": "context"}
+    
+    def test_recent_messages_are_not_reused(self):
+        """Test that later appends never overwrite messages a caller holds."""
+        buffer = PromptBuffer(max_recent=2)
+        buffer.append("user", "first")
+        held = list(buffer.recent)
+        for i in range(5):
+            buffer.append("user", str(i))
+        assert held == [{"role": "user", "content": "first"}]
+
+
+
+def test_transcript_writer_persists_turns_in_order(tmp_path):
+    """Test that queued turns are flushed to JSONL in order on close."""
+    import json
+    path = tmp_path / "conversation.jsonl"
+    writer = TranscriptWriter(path)
+    for i in range(25):
+        writer.record(f"question {i}", f"answer {i}")
+    writer.close()
+    
+    turns = [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+    assert [turn["user"] for turn in turns] == [f"question {i}" for i in range(25)]
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
@@ -0,0 +1,65 @@
+"""
+Unit tests for message routing in the interactive entry point.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+graive = pytest.importorskip("graive")
+
+
+def test_introduction_with_request_still_reaches_router(tmp_path, monkeypatch):
+    """Test that an "I am ..." message sets the name and is still routed."""
+    messages = iter(["I am writing an essay about Kenya", "exit"])
+    monkeypatch.setattr("builtins.input", lambda _prompt="": next(messages))
+    routed = []
+
+    def process_user_request(message, user_name=None):
+        routed.append((message, user_name))
+        return {"action": "general_interaction"}
+
+    stub = SimpleNamespace(
+        session_workspace=tmp_path,
+        process_user_request=process_user_request,
+        _action_handlers={},
+        _handle_unknown_action=lambda request, user_input, user_name: None,
+    )
+    graive.GraiveAI.interactive_mode(stub)
+
+    assert routed == [("I am writing an essay about Kenya", "Writing")]
+
+
+@pytest.fixture
+def fallback_router():
+    """A GraiveAI with no request reasoner, so process_user_request pattern-matches."""
+    ai = object.__new__(graive.GraiveAI)
+    ai.request_reasoner = None
+    ai.last_generated_document = None
+    ai._create_general_interaction_plan = lambda message, interaction_type: "plan.md"
+    return ai
+
+
+@pytest.mark.parametrize("message, expected", [
+    ("What is the capital of Kenya",
+     {"action": "general_interaction", "interaction_type": "question_or_complaint"}),
+    ("Build a snake game in JavaScript",
+     {"action": "generate_code", "language": "javascript"}),
+    ("Analyze the sales data in this csv",
+     {"action": "analyze_data", "data_source": "user_provided"}),
+    ("Create a PowerPoint presentation on solar energy",
+     {"action": "create_presentation", "slides": 10}),
+    ("Insert the image into the essay titled climate change",
+     {"action": "insert_image_in_document", "title": "climate change", "image_description": "latest_generated"}),
+    ("Write an essay about Kenya with 800 words",
+     {"action": "generate_document", "topic": "kenya", "word_count": 800, "format": "md"}),
+    ("Generate a picture of a sunset",
+     {"action": "generate_image", "description": "a sunset"}),
+    ("Hello there friend",
+     {"action": "general_interaction", "interaction_type": "general"}),
+])
+def test_fallback_router_actions(fallback_router, message, expected):
+    """Test that the pattern-matching router maps each request kind to its action."""
+    result = fallback_router.process_user_request(message)
+
+    assert {key: result.get(key) for key in expected} == expected
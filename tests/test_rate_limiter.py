@@ -0,0 +1,33 @@
+"""Tests for the token-bucket LLM rate limiter."""
+
+import sys
+import os
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.llm import TokenBucketLimiter
+
+
+def test_acquire_within_budget_does_not_block() -> None:
+    limiter = TokenBucketLimiter(rpm=60, tpm=1000)
+    start = time.monotonic()
+    assert limiter.acquire(400) is True
+    assert limiter.acquire(400) is True
+    assert time.monotonic() - start < 0.1
+
+
+def test_acquire_times_out_when_tokens_exhausted() -> None:
+    limiter = TokenBucketLimiter(rpm=60, tpm=600)
+    assert limiter.acquire(600) is True
+    # 600 tokens/minute refills 10 tokens/second, far short of another 600
+    assert limiter.acquire(600, timeout=0.05) is False
+
+
+def test_block_pauses_callers() -> None:
+    limiter = TokenBucketLimiter(rpm=6000, tpm=100000)
+    limiter.block(0.2)
+    assert limiter.acquire(1, timeout=0.05) is False
+    start = time.monotonic()
+    assert limiter.acquire(1, timeout=1.0) is True
+    assert time.monotonic() - start >= 0.1